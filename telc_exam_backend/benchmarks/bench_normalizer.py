@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark the precompiled translation normalizer against the previous implementation.
+
+Usage:
+    python benchmarks/bench_normalizer.py            # bundled exam text corpus
+    python benchmarks/bench_normalizer.py --db       # all exam texts from DATABASE_URL
+
+Every corpus text is also checked to produce identical output with both
+implementations; the script exits with status 1 on any difference.
+"""
+
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.routes.translation import clean_and_format_translation
+
+
+def legacy_clean_and_format_translation(text: str, target_lang: str) -> str:
+    """clean_and_format_translation as it was before the precompiled normalizer."""
+    if not text:
+        return text
+    
+    # Remove leading/trailing whitespace
+    text = text.strip()
+    
+    # Fix common encoding issues
+    encoding_fixes = {
+        'Ã¼': 'ü', 'Ã¤': 'ä', 'Ã¶': 'ö', 'ÃŸ': 'ß',
+        'â€™': "'", 'â€œ': '"', 'â€': '"', 'â€"': '–', 'â€"': '—'
+    }
+    for bad, good in encoding_fixes.items():
+        text = text.replace(bad, good)
+    
+    # Decode HTML entities (but preserve intentional ones)
+    import html
+    # First decode numeric character references like &#10; &#13; etc.
+    text = html.unescape(text)
+    
+    # Handle specific problematic entities that break formatting
+    problematic_entities = {
+        '&#10;': '\n',    # Line feed
+        '&#13;': '\r',    # Carriage return  
+        '&#32;': ' ',     # Space
+        '&nbsp;': ' ',    # Non-breaking space
+        '&amp;': '&',     # Ampersand
+        '&lt;': '<',      # Less than
+        '&gt;': '>',      # Greater than
+        '&quot;': '"',    # Quote
+        '&apos;': "'",    # Apostrophe
+    }
+    for entity, replacement in problematic_entities.items():
+        text = text.replace(entity, replacement)
+    
+    # Remove translation service artifacts
+    artifacts_to_remove = [
+        r'\[/?translation\]',
+        r'\*\*',
+        r'###',
+        r'^Translation:\s*',
+        r'^Übersetzung:\s*',
+        r'^Translated:\s*',
+        r'^Result:\s*'
+    ]
+    for pattern in artifacts_to_remove:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    
+    # Clean up extra whitespace while preserving intentional line breaks
+    text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces/tabs to single space
+    text = re.sub(r'[ \t]*\n[ \t]*', '\n', text)  # Clean around newlines
+    text = text.strip()
+    
+    # Persian-specific formatting
+    if target_lang.upper() == 'FA':
+        # Ensure proper RTL markers for Persian text
+        if text and not text.startswith('\u202B'):  # RTL embedding
+            # Only add if text contains significant Persian content
+            persian_char_count = len(re.findall(r'[\u0600-\u06FF]', text))
+            if persian_char_count > 3:
+                text = f'\u202B{text}\u202C'  # Wrap in RTL embedding
+    
+    return text
+
+
+# Exam instructions and texts in the style of the telc B1/B2 papers, with the
+# Persian translations and provider noise (entities, artifacts, spacing) the
+# normalizer has to deal with.
+GERMAN_TEXTS = [
+    "Lesen Sie zuerst die zehn Überschriften. Lesen Sie dann die fünf Texte und entscheiden Sie, welche Überschrift (a–j) am besten zu welchem Text (1–5) passt.",
+    "Sie hören fünf kurze Texte. Sie hören jeden Text zweimal. Zu jedem Text lösen Sie zwei Aufgaben. Wählen Sie bei jeder Aufgabe die richtige Lösung. Lesen Sie jetzt die Aufgaben 41–50. Dafür haben Sie 60 Sekunden Zeit.",
+    "Sie hören ein Gespräch. Sie hören das Gespräch einmal. Dazu lösen Sie fünf Aufgaben. Wählen Sie bei jeder Aufgabe: Sind die Aussagen Richtig oder Falsch? Lesen Sie jetzt die Aufgaben 51–55.",
+    "Wählen Sie Aufgabe A oder Aufgabe B. Zeigen Sie, was Sie können. Schreiben Sie möglichst viel zu allen Punkten. Vergessen Sie nicht Anrede und Gruß. Sie haben 30 Minuten Zeit.",
+    "Liebe Frau Schneider,\nvielen Dank für Ihre Einladung zum Sommerfest am 12. Juli. Leider kann ich nicht kommen, weil ich an diesem Wochenende umziehe.\n\nMit freundlichen Grüßen\nPeter Klein",
+    "Sehr geehrte Damen und Herren,\n\nich habe in Ihrer Anzeige gelesen, dass Sie einen Deutschkurs für Berufstätige anbieten. Ich interessiere mich sehr dafür und hätte gern weitere Informationen: Wann beginnt der Kurs? Wie viel kostet er?",
+    "Wohnung in Köln-Ehrenfeld, 3 Zimmer, 78 m², Balkon, Einbauküche, ab 1. September frei. Miete 950 € warm. Tel.: 0221 / 45 67 89",
+    "Sprachschule Aktiv: Intensivkurse (A1–C1) &amp; Prüfungsvorbereitung &quot;telc Deutsch B1&quot; – jetzt anmelden!",
+]
+PERSIAN_TEXTS = [
+    "ابتدا ده عنوان را بخوانید. سپس پنج متن را بخوانید و تصمیم بگیرید کدام عنوان (a–j) به کدام متن (۱–۵) بهتر می‌خورد.",
+    "شما پنج متن کوتاه می‌شنوید. هر متن را دو بار می‌شنوید. برای هر متن دو تکلیف حل می‌کنید.",
+    "خانم اشنایدر عزیز،\nاز دعوت شما به جشن تابستانی در ۱۲ ژوئیه بسیار سپاسگزارم. متأسفانه نمی‌توانم بیایم، چون در این آخر هفته اسباب‌کشی می‌کنم.\n\nبا احترام\nپیتر کلاین",
+    "آپارتمان در کلن-ارنفلد، ۳ اتاق، ۷۸ متر مربع، بالکن، آشپزخانه توکار، از اول سپتامبر خالی. اجاره ۹۵۰ یورو.",
+]
+NOISE = [
+    lambda t: t,
+    lambda t: f"  {t}  ",
+    lambda t: f"Translation: {t}",
+    lambda t: f"**{t}**",
+    lambda t: t.replace(' ', '  ').replace('\n', ' \n\t'),
+    lambda t: t.replace('\n', '&#10;').replace('"', '&quot;'),
+    lambda t: t.replace('ü', 'Ã¼').replace('ä', 'Ã¤').replace("'", 'â€™'),
+    lambda t: f"[translation]{t}[/translation]",
+    lambda t: f"Übersetzung:\n{t} ###",
+    lambda t: t.replace('&', '&amp;amp;'),
+]
+
+
+def bundled_corpus() -> list[tuple[str, str]]:
+    corpus = []
+    for noise in NOISE:
+        corpus += [(noise(text), 'DE') for text in GERMAN_TEXTS]
+        corpus += [(noise(text), 'FA') for text in PERSIAN_TEXTS]
+    return corpus
+
+
+def database_corpus() -> list[tuple[str, str]]:
+    from src.main import app
+    from src.models.exam import Exam
+    from src.models.translation import ExamTranslation
+    from src.routes.translation import iter_exam_text_fields
+
+    corpus = []
+    with app.app_context():
+        for exam in Exam.query.all():
+            corpus += [(str(value), 'DE') for _, value in iter_exam_text_fields(exam) if value]
+        for snapshot in ExamTranslation.query.all():
+            # Every string in the stored translated payloads
+            corpus += [(value, snapshot.target_lang) for value in re.findall(r'"((?:[^"\\]|\\.)*)"', snapshot.payload)]
+    return corpus
+
+
+def run(func, corpus, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text, lang in corpus:
+            func(text, lang)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    corpus = database_corpus() if '--db' in sys.argv else bundled_corpus()
+    if not corpus:
+        print("Corpus is empty")
+        return 1
+
+    mismatches = [
+        (text, lang) for text, lang in corpus
+        if clean_and_format_translation(text, lang) != legacy_clean_and_format_translation(text, lang)
+    ]
+    for text, lang in mismatches[:5]:
+        print(f"MISMATCH ({lang}): {text!r}")
+
+    rounds = max(1, 20000 // len(corpus))
+    legacy_seconds = run(legacy_clean_and_format_translation, corpus, rounds)
+    new_seconds = run(clean_and_format_translation, corpus, rounds)
+    calls = rounds * len(corpus)
+    print(f"Corpus: {len(corpus)} texts, {calls} calls per implementation")
+    print(f"legacy:      {legacy_seconds / calls * 1e6:8.2f} us/call")
+    print(f"precompiled: {new_seconds / calls * 1e6:8.2f} us/call ({legacy_seconds / new_seconds:.1f}x)")
+    print(f"Identical output: {'yes' if not mismatches else f'NO ({len(mismatches)} differences)'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Content-addressed translation memory
+
+Revision ID: 002_translation_memory
+Revises: 001_initial_postgresql_schema
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_translation_memory'
+down_revision = '001_initial_postgresql_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create translation_memory table keyed only by source text hash and language pair
+    op.create_table('translation_memory',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source_hash', sa.String(length=64), nullable=False),
+        sa.Column('source_lang', sa.String(length=10), nullable=False),
+        sa.Column('target_lang', sa.String(length=10), nullable=False),
+        sa.Column('translated_text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('source_hash', 'source_lang', 'target_lang', name='uq_translation_memory_entry')
+    )
+
+    # Path-keyed cache rows now reference the memory
+    op.add_column('translation_cache', sa.Column('memory_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_translation_cache_memory_id', 'translation_cache', 'translation_memory',
+        ['memory_id'], ['id'], ondelete='SET NULL'
+    )
+    op.alter_column('translation_cache', 'translated_text', existing_type=sa.Text(), nullable=True)
+
+    # Backfill the memory from existing cache rows (most recent translation wins)
+    op.execute("""
+        INSERT INTO translation_memory (source_hash, source_lang, target_lang, translated_text, created_at, updated_at)
+        SELECT DISTINCT ON (source_hash, source_lang, target_lang)
+               source_hash, source_lang, target_lang, translated_text, created_at, updated_at
+        FROM translation_cache
+        WHERE translated_text IS NOT NULL AND translated_text <> ''
+        ORDER BY source_hash, source_lang, target_lang, updated_at DESC NULLS LAST
+        ON CONFLICT (source_hash, source_lang, target_lang) DO NOTHING
+    """)
+    op.execute("""
+        UPDATE translation_cache AS tc
+        SET memory_id = tm.id
+        FROM translation_memory AS tm
+        WHERE tm.source_hash = tc.source_hash
+          AND tm.source_lang = tc.source_lang
+          AND tm.target_lang = tc.target_lang
+    """)
+
+
+def downgrade():
+    # Restore the text on rows that only referenced the memory, drop the rest
+    op.execute("""
+        UPDATE translation_cache AS tc
+        SET translated_text = tm.translated_text
+        FROM translation_memory AS tm
+        WHERE tc.memory_id = tm.id AND tc.translated_text IS NULL
+    """)
+    op.execute("DELETE FROM translation_cache WHERE translated_text IS NULL")
+    op.alter_column('translation_cache', 'translated_text', existing_type=sa.Text(), nullable=False)
+    op.drop_constraint('fk_translation_cache_memory_id', 'translation_cache', type_='foreignkey')
+    op.drop_column('translation_cache', 'memory_id')
+    op.drop_table('translation_memory')
@@ -0,0 +1,24 @@
+"""Per-section fingerprints on exam translation snapshots
+
+Revision ID: 003_exam_translation_section_hashes
+Revises: 002_translation_memory
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_exam_translation_section_hashes'
+down_revision = '002_translation_memory'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing snapshots have no fingerprints and are rebuilt in full on their next update
+    op.add_column('exam_translation', sa.Column('section_hashes', sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('exam_translation', 'section_hashes')
@@ -0,0 +1,44 @@
+"""Background translation job queue
+
+Revision ID: 004_translation_jobs
+Revises: 003_exam_translation_section_hashes
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_translation_jobs'
+down_revision = '003_exam_translation_section_hashes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create translation_job table (claimed by workers with SELECT ... FOR UPDATE SKIP LOCKED)
+    op.create_table('translation_job',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('exam_id', sa.Integer(), nullable=False),
+        sa.Column('source_lang', sa.String(length=10), nullable=False),
+        sa.Column('target_lang', sa.String(length=10), nullable=False),
+        sa.Column('batch', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='queued'),
+        sa.Column('total_fields', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('done_fields', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('results', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('worker', sa.String(length=100), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_translation_job_status_id', 'translation_job', ['status', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_translation_job_status_id', table_name='translation_job')
+    op.drop_table('translation_job')
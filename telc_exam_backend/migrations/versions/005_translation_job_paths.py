@@ -0,0 +1,23 @@
+"""Path-limited translation jobs for write-through pre-translation
+
+Revision ID: 005_translation_job_paths
+Revises: 004_translation_jobs
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_translation_job_paths'
+down_revision = '004_translation_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('translation_job', sa.Column('paths', sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('translation_job', 'paths')
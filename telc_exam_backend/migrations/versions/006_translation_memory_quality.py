@@ -0,0 +1,30 @@
+"""Stored validation results on the translation memory
+
+Revision ID: 006_translation_memory_quality
+Revises: 005_translation_job_paths
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_translation_memory_quality'
+down_revision = '005_translation_job_paths'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows keep validator_version NULL and are validated on their next read
+    op.add_column('translation_memory', sa.Column('source_text', sa.Text(), nullable=True))
+    op.add_column('translation_memory', sa.Column('quality_score', sa.Integer(), nullable=True))
+    op.add_column('translation_memory', sa.Column('quality_issues', sa.Text(), nullable=True))
+    op.add_column('translation_memory', sa.Column('validator_version', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('translation_memory', 'validator_version')
+    op.drop_column('translation_memory', 'quality_issues')
+    op.drop_column('translation_memory', 'quality_score')
+    op.drop_column('translation_memory', 'source_text')
@@ -0,0 +1,35 @@
+"""Glossary and phrase table for the local translation provider
+
+Revision ID: 007_glossary
+Revises: 006_translation_memory_quality
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_glossary'
+down_revision = '006_translation_memory_quality'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('glossary_entry',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source_lang', sa.String(length=10), nullable=False),
+        sa.Column('target_lang', sa.String(length=10), nullable=False),
+        sa.Column('source_text', sa.Text(), nullable=False),
+        sa.Column('normalized_source', sa.Text(), nullable=False),
+        sa.Column('translated_text', sa.Text(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False, server_default='term'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('source_lang', 'target_lang', 'normalized_source', name='uq_glossary_entry')
+    )
+
+
+def downgrade():
+    op.drop_table('glossary_entry')
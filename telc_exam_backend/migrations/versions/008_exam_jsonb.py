@@ -0,0 +1,59 @@
+"""Store structured exam fields and submitted answers as JSONB and track exam updates
+
+Revision ID: 008_exam_jsonb
+Revises: 007_glossary
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008_exam_jsonb'
+down_revision = '007_glossary'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = (
+    'lv1_titles', 'lv1_texts', 'lv1_answers',
+    'lv2_texts', 'lv2_questions', 'lv2_answers',
+    'lv3_situations', 'lv3_ads', 'lv3_answers',
+    'sb1_options', 'sb1_answers',
+    'sb2_words', 'sb2_answers',
+    'hv1_statements', 'hv1_answers',
+    'hv2_statements', 'hv2_answers',
+    'hv3_statements', 'hv3_answers',
+)
+
+
+def upgrade():
+    for column in JSON_COLUMNS:
+        op.alter_column('exam', column,
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f"NULLIF({column}, '')::jsonb",
+            existing_nullable=True)
+    op.alter_column('exam_result', 'answers',
+        existing_type=sa.Text(),
+        type_=postgresql.JSONB(),
+        postgresql_using="NULLIF(answers, '')::jsonb",
+        existing_nullable=True)
+    # Versions the decoded exam views cached in each process
+    op.add_column('exam', sa.Column('updated_at', sa.DateTime(), nullable=True, server_default=sa.func.now()))
+
+
+def downgrade():
+    op.drop_column('exam', 'updated_at')
+    op.alter_column('exam_result', 'answers',
+        existing_type=postgresql.JSONB(),
+        type_=sa.Text(),
+        postgresql_using='answers::text',
+        existing_nullable=True)
+    for column in JSON_COLUMNS:
+        op.alter_column('exam', column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.Text(),
+            postgresql_using=f'{column}::text',
+            existing_nullable=True)
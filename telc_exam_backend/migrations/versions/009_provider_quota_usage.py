@@ -0,0 +1,31 @@
+"""Provider quota counters shared by all web and worker processes
+
+Revision ID: 009_provider_quota_usage
+Revises: 008_exam_jsonb
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_provider_quota_usage'
+down_revision = '008_exam_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('provider_quota_usage',
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('window', sa.String(length=10), nullable=False),
+        sa.Column('window_start', sa.DateTime(), nullable=False),
+        sa.Column('requests', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('chars', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('blocked_until', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('provider', 'window', 'window_start')
+    )
+
+
+def downgrade():
+    op.drop_table('provider_quota_usage')
@@ -0,0 +1,29 @@
+"""Glossary generation counter that lets every process drop cached translations after edits
+
+Revision ID: 010_glossary_state
+Revises: 009_provider_quota_usage
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_glossary_state'
+down_revision = '009_provider_quota_usage'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('glossary_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO glossary_state (id, generation, updated_at) VALUES (1, 0, now())")
+
+
+def downgrade():
+    op.drop_table('glossary_state')
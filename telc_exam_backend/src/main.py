@@ -1,5 +1,6 @@
 import os
 import sys
+import logging
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
@@ -9,6 +10,8 @@ from src.models.exam import Exam, ExamResult
 from src.routes.user import user_bp
 from src.routes.exam import exam_bp
 from src.routes.translation import translation_bp
+from src.routes.glossary import glossary_bp
+from src.services.tracing import end_trace, start_trace, tracing_enabled
 from flask_cors import CORS
 from dotenv import load_dotenv
 from flask_migrate import Migrate
@@ -18,6 +21,12 @@ from sqlalchemy import text
 
 load_dotenv()
 
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+)
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'change-me')
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
@@ -70,8 +79,7 @@ app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
 }
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-print(f"✅ Connected to PostgreSQL database")
-print(f"🔗 Host: {database_url.split('@')[1].split('/')[0] if '@' in database_url else 'Unknown'}")
+logger.info("Using PostgreSQL database at %s", database_url.split('@')[1].split('/')[0] if '@' in database_url else 'Unknown')
 
 db.init_app(app)
 Migrate(app, db)
@@ -83,6 +91,7 @@ Migrate(app, db)
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(exam_bp, url_prefix='/api')
 app.register_blueprint(translation_bp, url_prefix='/api')
+app.register_blueprint(glossary_bp, url_prefix='/api')
 
 @app.after_request
 def add_security_headers(response):
@@ -104,6 +113,28 @@ def add_security_headers(response):
         response.headers['Content-Security-Policy'] = csp
     return response
 
+@app.before_request
+def begin_request_trace():
+    # Opt-in per-request spans (TRACING_ENABLED=true); span() is a no-op otherwise
+    if tracing_enabled():
+        start_trace()
+
+@app.after_request
+def add_server_timing(response):
+    trace = end_trace()
+    if trace is None:
+        return response
+    response.headers['Server-Timing'] = trace.server_timing()
+    slow_ms = float(os.getenv('TRACING_SLOW_MS', '1000'))
+    elapsed_ms = trace.elapsed() * 1000
+    if elapsed_ms >= slow_ms:
+        logger.info("Slow request %s %s %.0fms: %s", request.method, request.path, elapsed_ms, trace.summary())
+    return response
+
+@app.teardown_request
+def clear_request_trace(_):
+    end_trace()
+
 @app.before_request
 def reject_oversized_json():
     # Fast path to reject huge bodies (Flask will also enforce MAX_CONTENT_LENGTH)
@@ -1,128 +1,197 @@
 from src.models.user import db
+from src.services.memory_cache import LRUTTLCache
+from src.services.tracing import traced
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-import json
+import os
+import pickle
 
 class Exam(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Leseverstehen Teil 1 - match headlines
-    lv1_titles = db.Column(db.Text)  # JSON string of titles a-j
-    lv1_texts = db.Column(db.Text)   # JSON string of texts 1-5
-    lv1_answers = db.Column(db.Text) # JSON string of correct answers
+    lv1_titles = db.Column(JSONB)  # Titles a-j
+    lv1_texts = db.Column(JSONB)   # Texts 1-5
+    lv1_answers = db.Column(JSONB) # Correct answers
     
     # Leseverstehen Teil 2 - detailed comprehension
-    lv2_texts = db.Column(db.Text)   # JSON string of long texts
-    lv2_questions = db.Column(db.Text) # JSON string of questions 6-10
-    lv2_answers = db.Column(db.Text) # JSON string of correct answers
+    lv2_texts = db.Column(JSONB)   # Long texts
+    lv2_questions = db.Column(JSONB) # Questions 6-10
+    lv2_answers = db.Column(JSONB) # Correct answers
     
     # Leseverstehen Teil 3 - match situations
-    lv3_situations = db.Column(db.Text) # JSON string of situations 11-20
-    lv3_ads = db.Column(db.Text)     # JSON string of ads a-l
-    lv3_answers = db.Column(db.Text) # JSON string of correct answers
+    lv3_situations = db.Column(JSONB) # Situations 11-20
+    lv3_ads = db.Column(JSONB) # Ads a-l
+    lv3_answers = db.Column(JSONB) # Correct answers
     
     # Sprachbausteine Teil 1 - grammar
     sb1_text = db.Column(db.Text)    # Text with blanks
-    sb1_options = db.Column(db.Text) # JSON string of options for each blank
-    sb1_answers = db.Column(db.Text) # JSON string of correct answers
+    sb1_options = db.Column(JSONB) # Options for each blank
+    sb1_answers = db.Column(JSONB) # Correct answers
     
     # Sprachbausteine Teil 2 - vocabulary
     sb2_text = db.Column(db.Text)    # Text with blanks
-    sb2_words = db.Column(db.Text)   # JSON string of word list a-o
-    sb2_answers = db.Column(db.Text) # JSON string of correct answers
+    sb2_words = db.Column(JSONB)   # Word list a-o
+    sb2_answers = db.Column(JSONB) # Correct answers
     
     # Hörverstehen
     hv1_audio_url = db.Column(db.String(500)) # Audio file URL for Teil 1
-    hv1_statements = db.Column(db.Text) # JSON string of statements 41-45
-    hv1_answers = db.Column(db.Text)   # JSON string of correct answers (true/false)
+    hv1_statements = db.Column(JSONB) # Statements 41-45
+    hv1_answers = db.Column(JSONB)   # Correct answers (true/false)
     
     hv2_audio_url = db.Column(db.String(500)) # Audio file URL for Teil 2
-    hv2_statements = db.Column(db.Text) # JSON string of statements 46-55
-    hv2_answers = db.Column(db.Text)   # JSON string of correct answers (true/false)
+    hv2_statements = db.Column(JSONB) # Statements 46-55
+    hv2_answers = db.Column(JSONB)   # Correct answers (true/false)
     
     hv3_audio_url = db.Column(db.String(500)) # Audio file URL for Teil 3
-    hv3_statements = db.Column(db.Text) # JSON string of statements 56-60
-    hv3_answers = db.Column(db.Text)   # JSON string of correct answers (true/false)
+    hv3_statements = db.Column(JSONB) # Statements 56-60
+    hv3_answers = db.Column(JSONB)   # Correct answers (true/false)
     
     # Schriftlicher Ausdruck
     sa_task_a = db.Column(db.Text)   # Task A description
     sa_task_b = db.Column(db.Text)   # Task B description
     
-    def to_dict(self):
-        return {
+    def to_dict(self, format: str = 'v1', shared: bool = False):
+        """
+        Decoded exam payload in one of EXAM_FORMATS.
+
+        v1 carries the sectioned layout (leseverstehen_teil1, ...) and the flat
+        editor keys (lv1_titles, ...); v2 has every field once: the flat keys
+        for Leseverstehen and Sprachbausteine plus the hoerverstehen and
+        schriftlicher_ausdruck sections. Views are memoized per exam version
+        (id and updated_at); callers get a private copy unless shared=True, in
+        which case the cached view is returned and must not be modified.
+        Unsaved or locally modified exams are decoded without the cache.
+        """
+        if format not in EXAM_FORMATS:
+            raise ValueError(f'Unknown exam format: {format!r}')
+        if self.id is None or self.updated_at is None or inspect(self).modified:
+            return self._build_dict(format)
+        key = (format, self.id, self.updated_at)
+        view = exam_view_cache.get(key)
+        if view is None:
+            view = _ExamView(self._build_dict(format))
+            exam_view_cache.set(key, view)
+        return view.data if shared else view.copy()
+
+    @traced('to_dict')
+    def _build_dict(self, format: str) -> dict:
+        head = {
             'id': self.id,
             'title': self.title,
             'created_at': self.created_at.isoformat(),
-            
-            # Support both old and new formats in response
-            # Old format (for backward compatibility)
-            'leseverstehen_teil1': {
-                'titles': json.loads(self.lv1_titles) if self.lv1_titles else [],
-                'texts': json.loads(self.lv1_texts) if self.lv1_texts else [],
-                'answers': json.loads(self.lv1_answers) if self.lv1_answers else []
-            },
-            'leseverstehen_teil2': {
-                'texts': json.loads(self.lv2_texts) if self.lv2_texts else [],
-                'questions': json.loads(self.lv2_questions) if self.lv2_questions else []
-            },
-            'leseverstehen_teil3': {
-                'situations': json.loads(self.lv3_situations) if self.lv3_situations else [],
-                'ads': json.loads(self.lv3_ads) if self.lv3_ads else []
-            },
-            'sprachbausteine_teil1': {
-                'text': self.sb1_text,
-                'options': json.loads(self.sb1_options) if self.sb1_options else [],
-                'answers': json.loads(self.sb1_answers) if self.sb1_answers else []
-            },
-            'sprachbausteine_teil2': {
-                'text': self.sb2_text,
-                'words': json.loads(self.sb2_words) if self.sb2_words else [],
-                'answers': json.loads(self.sb2_answers) if self.sb2_answers else []
-            },
+        }
+        # JSONB values are the session's own lists; detach each part so views
+        # neither alias the loaded columns nor share lists between sections and flat keys
+        if format == 'v2':
+            return {**head, **_detached({**self._flat_fields(), **self._listening_and_writing()})}
+        return {**head, **_detached(self._sections()), **_detached(self._flat_fields())}
+
+    def _listening_and_writing(self) -> dict:
+        return {
             'hoerverstehen': {
                 'teil1': {
                     'audio_url': self.hv1_audio_url,
-                    'statements': json.loads(self.hv1_statements) if self.hv1_statements else [],
-                    'answers': json.loads(self.hv1_answers) if self.hv1_answers else []
+                    'statements': self.hv1_statements or [],
+                    'answers': self.hv1_answers or []
                 },
                 'teil2': {
                     'audio_url': self.hv2_audio_url,
-                    'statements': json.loads(self.hv2_statements) if self.hv2_statements else [],
-                    'answers': json.loads(self.hv2_answers) if self.hv2_answers else []
+                    'statements': self.hv2_statements or [],
+                    'answers': self.hv2_answers or []
                 },
                 'teil3': {
                     'audio_url': self.hv3_audio_url,
-                    'statements': json.loads(self.hv3_statements) if self.hv3_statements else [],
-                    'answers': json.loads(self.hv3_answers) if self.hv3_answers else []
+                    'statements': self.hv3_statements or [],
+                    'answers': self.hv3_answers or []
                 }
             },
             'schriftlicher_ausdruck': {
                 'task_a': self.sa_task_a,
                 'task_b': self.sa_task_b
             },
-            
-            # New format (for new admin editor)
-            'lv1_titles': json.loads(self.lv1_titles) if self.lv1_titles else [],
-            'lv1_texts': json.loads(self.lv1_texts) if self.lv1_texts else [],
-            'lv1_answers': json.loads(self.lv1_answers) if self.lv1_answers else [],
-            'lv2_texts': json.loads(self.lv2_texts) if self.lv2_texts else [],
-            'lv2_questions': json.loads(self.lv2_questions) if self.lv2_questions else [],
-            'lv3_situations': json.loads(self.lv3_situations) if self.lv3_situations else [],
-            'lv3_ads': json.loads(self.lv3_ads) if self.lv3_ads else [],
+        }
+
+    def _sections(self) -> dict:
+        # Old format (for backward compatibility)
+        return {
+            'leseverstehen_teil1': {
+                'titles': self.lv1_titles or [],
+                'texts': self.lv1_texts or [],
+                'answers': self.lv1_answers or []
+            },
+            'leseverstehen_teil2': {
+                'texts': self.lv2_texts or [],
+                'questions': self.lv2_questions or []
+            },
+            'leseverstehen_teil3': {
+                'situations': self.lv3_situations or [],
+                'ads': self.lv3_ads or []
+            },
+            'sprachbausteine_teil1': {
+                'text': self.sb1_text,
+                'options': self.sb1_options or [],
+                'answers': self.sb1_answers or []
+            },
+            'sprachbausteine_teil2': {
+                'text': self.sb2_text,
+                'words': self.sb2_words or [],
+                'answers': self.sb2_answers or []
+            },
+            **self._listening_and_writing(),
+        }
+
+    def _flat_fields(self) -> dict:
+        # New format (for new admin editor)
+        return {
+            'lv1_titles': self.lv1_titles or [],
+            'lv1_texts': self.lv1_texts or [],
+            'lv1_answers': self.lv1_answers or [],
+            'lv2_texts': self.lv2_texts or [],
+            'lv2_questions': self.lv2_questions or [],
+            'lv3_situations': self.lv3_situations or [],
+            'lv3_ads': self.lv3_ads or [],
             'sb1_text': self.sb1_text,
-            'sb1_words': json.loads(self.sb1_options) if self.sb1_options else [],
-            'sb1_answers': json.loads(self.sb1_answers) if self.sb1_answers else [],
+            'sb1_words': self.sb1_options or [],
+            'sb1_answers': self.sb1_answers or [],
             'sb2_text': self.sb2_text,
-            'sb2_options': json.loads(self.sb2_words) if self.sb2_words else [],
-            'sb2_answers': json.loads(self.sb2_answers) if self.sb2_answers else []
+            'sb2_options': self.sb2_words or [],
+            'sb2_answers': self.sb2_answers or []
         }
 
+
+EXAM_FORMATS = ('v1', 'v2')
+
+def _detached(data: dict) -> dict:
+    return pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class _ExamView:
+    """A decoded exam payload; copies are made by unpickling, which is faster than decoding the columns again."""
+    __slots__ = ('data', '_pickled')
+
+    def __init__(self, data: dict):
+        self.data = data
+        self._pickled = None
+
+    def copy(self) -> dict:
+        if self._pickled is None:
+            self._pickled = pickle.dumps(self.data, protocol=pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(self._pickled)
+
+
+# Decoded exam views, keyed by format and exam version; EXAM_VIEW_CACHE_SIZE entries
+exam_view_cache = LRUTTLCache(max_size=int(os.getenv('EXAM_VIEW_CACHE_SIZE', '256')), ttl_seconds=0)
+
 class ExamResult(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     exam_id = db.Column(db.Integer, db.ForeignKey('exam.id'), nullable=False)
     student_name = db.Column(db.String(100))
-    answers = db.Column(db.Text)  # JSON string of student answers
+    answers = db.Column(JSONB)  # Student answers
     score = db.Column(db.Float)   # Total score
     completed_at = db.Column(db.DateTime, default=datetime.utcnow)
     
@@ -133,7 +202,7 @@ class ExamResult(db.Model):
             'id': self.id,
             'exam_id': self.exam_id,
             'student_name': self.student_name,
-            'answers': json.loads(self.answers) if self.answers else {},
+            'answers': self.answers or {},
             'score': self.score,
             'completed_at': self.completed_at.isoformat()
         }
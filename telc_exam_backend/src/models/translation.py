@@ -1,7 +1,27 @@
+import json
 from datetime import datetime
 from src.models.user import db
 
 
+class TranslationMemory(db.Model):
+    """Content-addressed translations shared by every exam and path."""
+    id = db.Column(db.Integer, primary_key=True)
+    source_hash = db.Column(db.String(64), nullable=False)  # sha256 of the source text
+    source_lang = db.Column(db.String(10), nullable=False)
+    target_lang = db.Column(db.String(10), nullable=False)
+    source_text = db.Column(db.Text, nullable=True)  # kept so the sweeper can revalidate
+    translated_text = db.Column(db.Text, nullable=False)
+    quality_score = db.Column(db.Integer, nullable=True)
+    quality_issues = db.Column(db.Text, nullable=True)  # JSON list from validate_translation_quality
+    validator_version = db.Column(db.Integer, nullable=True)  # NULL = never validated
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('source_hash', 'source_lang', 'target_lang', name='uq_translation_memory_entry'),
+    )
+
+
 class TranslationCache(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     resource_type = db.Column(db.String(50), nullable=False)  # e.g., 'exam'
@@ -10,7 +30,10 @@ class TranslationCache(db.Model):
     source_lang = db.Column(db.String(10), nullable=False, default='de')
     target_lang = db.Column(db.String(10), nullable=False)
     source_hash = db.Column(db.String(64), nullable=False)
-    translated_text = db.Column(db.Text, nullable=False)
+    # Legacy rows carry their own text; new rows only reference the translation memory
+    translated_text = db.Column(db.Text, nullable=True)
+    memory_id = db.Column(db.Integer, db.ForeignKey('translation_memory.id', ondelete='SET NULL'), nullable=True)
+    memory = db.relationship('TranslationMemory')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -28,6 +51,7 @@ class ExamTranslation(db.Model):
     target_lang = db.Column(db.String(10), nullable=False)
     exam_hash = db.Column(db.String(64), nullable=False)
     payload = db.Column(db.Text, nullable=False)  # JSON string of the fully translated exam
+    section_hashes = db.Column(db.Text)  # JSON string of per-section fingerprints (lv1, lv2, ..., sa)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -36,3 +60,95 @@ class ExamTranslation(db.Model):
     )
 
 
+
+
+class TranslationJob(db.Model):
+    """Queued background translation of one exam into one language."""
+    id = db.Column(db.Integer, primary_key=True)
+    exam_id = db.Column(db.Integer, nullable=False)
+    source_lang = db.Column(db.String(10), nullable=False)
+    target_lang = db.Column(db.String(10), nullable=False)
+    batch = db.Column(db.Boolean, nullable=False, default=False)
+    paths = db.Column(db.Text)  # JSON list of paths to pre-translate; NULL means the whole exam
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, done, failed
+    total_fields = db.Column(db.Integer, nullable=False, default=0)
+    done_fields = db.Column(db.Integer, nullable=False, default=0)
+    results = db.Column(db.Text)  # JSON string of {path: translation} completed so far
+    error = db.Column(db.Text)
+    worker = db.Column(db.String(100))
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_translation_job_status_id', 'status', 'id'),
+    )
+
+    def to_dict(self, include_results: bool = True):
+        data = {
+            'id': self.id,
+            'exam_id': self.exam_id,
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'paths': json.loads(self.paths) if self.paths else None,
+            'status': self.status,
+            'total_fields': self.total_fields,
+            'done_fields': self.done_fields,
+            'progress': round(self.done_fields / self.total_fields, 3) if self.total_fields else 0.0,
+            'error': self.error,
+            'attempts': self.attempts,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if include_results:
+            data['results'] = json.loads(self.results) if self.results else {}
+        return data
+
+
+class GlossaryEntry(db.Model):
+    """Admin-managed term or phrase translation served without a provider call."""
+    id = db.Column(db.Integer, primary_key=True)
+    source_lang = db.Column(db.String(10), nullable=False, default='DE')
+    target_lang = db.Column(db.String(10), nullable=False)
+    source_text = db.Column(db.Text, nullable=False)
+    normalized_source = db.Column(db.Text, nullable=False)  # lookup key, see services/glossary.normalize_term
+    translated_text = db.Column(db.Text, nullable=False)
+    kind = db.Column(db.String(20), nullable=False, default='term')  # 'term' or 'phrase'
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('source_lang', 'target_lang', 'normalized_source', name='uq_glossary_entry'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'source_lang': self.source_lang,
+            'target_lang': self.target_lang,
+            'source_text': self.source_text,
+            'translated_text': self.translated_text,
+            'kind': self.kind,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class GlossaryState(db.Model):
+    """Single row counting glossary edits; processes compare it to drop their in-memory copies."""
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ProviderQuotaUsage(db.Model):
+    """Requests and characters sent to a provider in one minute or day window, shared by every process."""
+    provider = db.Column(db.String(50), primary_key=True)
+    window = db.Column(db.String(10), primary_key=True)  # 'minute' or 'day'
+    window_start = db.Column(db.DateTime, primary_key=True)  # UTC
+    requests = db.Column(db.Integer, nullable=False, default=0)
+    chars = db.Column(db.Integer, nullable=False, default=0)
+    blocked_until = db.Column(db.DateTime)  # day rows: the provider reported its quota as used up
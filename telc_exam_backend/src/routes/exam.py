@@ -1,9 +1,26 @@
-from flask import Blueprint, request, jsonify
-from src.models.exam import db, Exam, ExamResult
-import json
+import logging
+from flask import Blueprint, abort, request, jsonify
+from src.models.exam import db, Exam, ExamResult, EXAM_FORMATS
 from src.security import rate_limit, require_admin
+from src.services.exam_projection import exam_answers
+from src.routes.translation import exam_text_fields, schedule_pretranslation
+
+
+def _pretranslate(exam, old_fields):
+    # Write-through: queue translation of new/changed texts for the warm languages
+    try:
+        schedule_pretranslation(exam, old_fields)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning("Pre-translation scheduling failed for exam %s: %s", exam.id, e)
 
 exam_bp = Blueprint('exam', __name__)
+logger = logging.getLogger(__name__)
+
+def requested_format() -> str | None:
+    """Exam payload format from ?format= (default v1), or None when unknown."""
+    exam_format = request.args.get('format', 'v1').lower()
+    return exam_format if exam_format in EXAM_FORMATS else None
 
 @exam_bp.route('/exams', methods=['GET'])
 @rate_limit(limit=120, window_seconds=60)
@@ -19,15 +36,21 @@ def get_exams():
 @exam_bp.route('/exams/<int:exam_id>', methods=['GET'])
 @rate_limit(limit=120, window_seconds=60)
 def get_exam(exam_id):
-    """Get details of a specific exam"""
+    """Get details of a specific exam; ?format=v2 returns every field once (see Exam.to_dict)"""
     exam = Exam.query.get_or_404(exam_id)
-    return jsonify(exam.to_dict())
+    exam_format = requested_format()
+    if exam_format is None:
+        return jsonify({'error': f'format must be one of {", ".join(EXAM_FORMATS)}'}), 400
+    return jsonify(exam.to_dict(exam_format, shared=True))
 
 @exam_bp.route('/exams', methods=['POST'])
 @require_admin
 @rate_limit(limit=30, window_seconds=60)
 def create_exam():
     """Create a new exam - supports both old and new data formats"""
+    exam_format = requested_format()
+    if exam_format is None:
+        return jsonify({'error': f'format must be one of {", ".join(EXAM_FORMATS)}'}), 400
     data = request.get_json()
     
     # Support both old format (leseverstehen_teil1.titles) and new format (lv1_titles)
@@ -35,67 +58,67 @@ def create_exam():
         title=data.get('title', 'Neue Prüfung'),
         
         # Leseverstehen Teil 1 - try new format first, then old format
-        lv1_titles=json.dumps(
+        lv1_titles=(
             data.get('lv1_titles') or 
             data.get('leseverstehen_teil1', {}).get('titles', [])
         ),
-        lv1_texts=json.dumps(
+        lv1_texts=(
             data.get('lv1_texts') or 
             data.get('leseverstehen_teil1', {}).get('texts', [])
         ),
-        lv1_answers=json.dumps(
+        lv1_answers=(
             data.get('lv1_answers') or 
             data.get('leseverstehen_teil1', {}).get('answers', [])
         ),
         
         # Leseverstehen Teil 2
-        lv2_texts=json.dumps(
+        lv2_texts=(
             data.get('lv2_texts') or 
             data.get('leseverstehen_teil2', {}).get('texts', [])
         ),
-        lv2_questions=json.dumps(
+        lv2_questions=(
             data.get('lv2_questions') or 
             data.get('leseverstehen_teil2', {}).get('questions', [])
         ),
-        lv2_answers=json.dumps(
+        lv2_answers=(
             data.get('lv2_answers') or 
             data.get('leseverstehen_teil2', {}).get('answers', [])
         ),
         
         # Leseverstehen Teil 3
-        lv3_situations=json.dumps(
+        lv3_situations=(
             data.get('lv3_situations') or 
             data.get('leseverstehen_teil3', {}).get('situations', [])
         ),
-        lv3_ads=json.dumps(
+        lv3_ads=(
             data.get('lv3_ads') or 
             data.get('leseverstehen_teil3', {}).get('ads', [])
         ),
-        lv3_answers=json.dumps(
+        lv3_answers=(
             data.get('lv3_answers') or 
             data.get('leseverstehen_teil3', {}).get('answers', [])
         ),
         
         # Sprachbausteine Teil 1
         sb1_text=data.get('sb1_text') or data.get('sprachbausteine_teil1', {}).get('text', ''),
-        sb1_options=json.dumps(
+        sb1_options=(
             data.get('sb1_words') or  # new format uses 'words' instead of 'options'
             data.get('sb1_options') or 
             data.get('sprachbausteine_teil1', {}).get('options', [])
         ),
-        sb1_answers=json.dumps(
+        sb1_answers=(
             data.get('sb1_answers') or 
             data.get('sprachbausteine_teil1', {}).get('answers', [])
         ),
         
         # Sprachbausteine Teil 2
         sb2_text=data.get('sb2_text') or data.get('sprachbausteine_teil2', {}).get('text', ''),
-        sb2_words=json.dumps(
+        sb2_words=(
             data.get('sb2_options') or  # new format uses 'options' for Teil 2
             data.get('sb2_words') or 
             data.get('sprachbausteine_teil2', {}).get('words', [])
         ),
-        sb2_answers=json.dumps(
+        sb2_answers=(
             data.get('sb2_answers') or 
             data.get('sprachbausteine_teil2', {}).get('answers', [])
         ),
@@ -105,10 +128,10 @@ def create_exam():
             data.get('hoerverstehen', {}).get('teil1', {}).get('audio_url', '') or 
             data.get('hv1_audio_url', '')
         ),
-        hv1_statements=json.dumps(
+        hv1_statements=(
             data.get('hoerverstehen', {}).get('teil1', {}).get('statements', [])
         ),
-        hv1_answers=json.dumps(
+        hv1_answers=(
             data.get('hoerverstehen', {}).get('teil1', {}).get('answers', [])
         ),
         
@@ -117,10 +140,10 @@ def create_exam():
             data.get('hoerverstehen', {}).get('teil2', {}).get('audio_url', '') or 
             data.get('hv2_audio_url', '')
         ),
-        hv2_statements=json.dumps(
+        hv2_statements=(
             data.get('hoerverstehen', {}).get('teil2', {}).get('statements', [])
         ),
-        hv2_answers=json.dumps(
+        hv2_answers=(
             data.get('hoerverstehen', {}).get('teil2', {}).get('answers', [])
         ),
         
@@ -129,10 +152,10 @@ def create_exam():
             data.get('hoerverstehen', {}).get('teil3', {}).get('audio_url', '') or 
             data.get('hv3_audio_url', '')
         ),
-        hv3_statements=json.dumps(
+        hv3_statements=(
             data.get('hoerverstehen', {}).get('teil3', {}).get('statements', [])
         ),
-        hv3_answers=json.dumps(
+        hv3_answers=(
             data.get('hoerverstehen', {}).get('teil3', {}).get('answers', [])
         ),
         
@@ -143,8 +166,9 @@ def create_exam():
     
     db.session.add(exam)
     db.session.commit()
+    _pretranslate(exam, {})
     
-    return jsonify(exam.to_dict()), 201
+    return jsonify(exam.to_dict(exam_format, shared=True)), 201
 
 @exam_bp.route('/exams/<int:exam_id>', methods=['PUT'])
 @require_admin
@@ -152,51 +176,75 @@ def create_exam():
 def update_exam(exam_id):
     """Update an existing exam - supports both old and new data formats"""
     exam = Exam.query.get_or_404(exam_id)
+    exam_format = requested_format()
+    if exam_format is None:
+        return jsonify({'error': f'format must be one of {", ".join(EXAM_FORMATS)}'}), 400
     data = request.get_json()
+    old_fields = exam_text_fields(exam)
     
     exam.title = data.get('title', exam.title)
     
     # Leseverstehen Teil 1 - support both formats
     if 'lv1_titles' in data or 'leseverstehen_teil1' in data:
-        exam.lv1_titles = json.dumps(
+        exam.lv1_titles = (
             data.get('lv1_titles') or 
             data.get('leseverstehen_teil1', {}).get('titles', [])
         )
     if 'lv1_texts' in data or 'leseverstehen_teil1' in data:
-        exam.lv1_texts = json.dumps(
+        exam.lv1_texts = (
             data.get('lv1_texts') or 
             data.get('leseverstehen_teil1', {}).get('texts', [])
         )
     if 'lv1_answers' in data or 'leseverstehen_teil1' in data:
-        exam.lv1_answers = json.dumps(
+        exam.lv1_answers = (
             data.get('lv1_answers') or 
             data.get('leseverstehen_teil1', {}).get('answers', [])
         )
     
     # Leseverstehen Teil 2
+    if 'lv2_texts' in data or 'leseverstehen_teil2' in data:
+        exam.lv2_texts = (
+            data.get('lv2_texts') or 
+            data.get('leseverstehen_teil2', {}).get('texts', [])
+        )
     if 'lv2_questions' in data or 'leseverstehen_teil2' in data:
-        exam.lv2_questions = json.dumps(
+        exam.lv2_questions = (
             data.get('lv2_questions') or 
             data.get('leseverstehen_teil2', {}).get('questions', [])
         )
+    if 'lv2_answers' in data or 'answers' in data.get('leseverstehen_teil2', {}):
+        exam.lv2_answers = (
+            data.get('lv2_answers') or 
+            data.get('leseverstehen_teil2', {}).get('answers', [])
+        )
     
     # Leseverstehen Teil 3
     if 'lv3_situations' in data or 'leseverstehen_teil3' in data:
-        exam.lv3_situations = json.dumps(
+        exam.lv3_situations = (
             data.get('lv3_situations') or 
             data.get('leseverstehen_teil3', {}).get('situations', [])
         )
+    if 'lv3_ads' in data or 'leseverstehen_teil3' in data:
+        exam.lv3_ads = (
+            data.get('lv3_ads') or 
+            data.get('leseverstehen_teil3', {}).get('ads', [])
+        )
+    if 'lv3_answers' in data or 'answers' in data.get('leseverstehen_teil3', {}):
+        exam.lv3_answers = (
+            data.get('lv3_answers') or 
+            data.get('leseverstehen_teil3', {}).get('answers', [])
+        )
     
     # Sprachbausteine Teil 1
     if 'sb1_text' in data or 'sprachbausteine_teil1' in data:
         exam.sb1_text = data.get('sb1_text') or data.get('sprachbausteine_teil1', {}).get('text', '')
     if 'sb1_words' in data or 'sprachbausteine_teil1' in data:
-        exam.sb1_options = json.dumps(
+        exam.sb1_options = (
             data.get('sb1_words') or 
             data.get('sprachbausteine_teil1', {}).get('options', [])
         )
     if 'sb1_answers' in data or 'sprachbausteine_teil1' in data:
-        exam.sb1_answers = json.dumps(
+        exam.sb1_answers = (
             data.get('sb1_answers') or 
             data.get('sprachbausteine_teil1', {}).get('answers', [])
         )
@@ -205,12 +253,12 @@ def update_exam(exam_id):
     if 'sb2_text' in data or 'sprachbausteine_teil2' in data:
         exam.sb2_text = data.get('sb2_text') or data.get('sprachbausteine_teil2', {}).get('text', '')
     if 'sb2_options' in data or 'sprachbausteine_teil2' in data:
-        exam.sb2_words = json.dumps(
+        exam.sb2_words = (
             data.get('sb2_options') or 
             data.get('sprachbausteine_teil2', {}).get('words', [])
         )
     if 'sb2_answers' in data or 'sprachbausteine_teil2' in data:
-        exam.sb2_answers = json.dumps(
+        exam.sb2_answers = (
             data.get('sb2_answers') or 
             data.get('sprachbausteine_teil2', {}).get('answers', [])
         )
@@ -220,16 +268,16 @@ def update_exam(exam_id):
         hv = data['hoerverstehen']
         if 'teil1' in hv:
             exam.hv1_audio_url = hv['teil1'].get('audio_url', '')
-            exam.hv1_statements = json.dumps(hv['teil1'].get('statements', []))
-            exam.hv1_answers = json.dumps(hv['teil1'].get('answers', []))
+            exam.hv1_statements = hv['teil1'].get('statements', [])
+            exam.hv1_answers = hv['teil1'].get('answers', [])
         if 'teil2' in hv:
             exam.hv2_audio_url = hv['teil2'].get('audio_url', '')
-            exam.hv2_statements = json.dumps(hv['teil2'].get('statements', []))
-            exam.hv2_answers = json.dumps(hv['teil2'].get('answers', []))
+            exam.hv2_statements = hv['teil2'].get('statements', [])
+            exam.hv2_answers = hv['teil2'].get('answers', [])
         if 'teil3' in hv:
             exam.hv3_audio_url = hv['teil3'].get('audio_url', '')
-            exam.hv3_statements = json.dumps(hv['teil3'].get('statements', []))
-            exam.hv3_answers = json.dumps(hv['teil3'].get('answers', []))
+            exam.hv3_statements = hv['teil3'].get('statements', [])
+            exam.hv3_answers = hv['teil3'].get('answers', [])
     
     if 'schriftlicher_ausdruck' in data:
         sa = data['schriftlicher_ausdruck']
@@ -237,7 +285,8 @@ def update_exam(exam_id):
         exam.sa_task_b = sa.get('task_b', '')
     
     db.session.commit()
-    return jsonify(exam.to_dict())
+    _pretranslate(exam, old_fields)
+    return jsonify(exam.to_dict(exam_format, shared=True))
 
 @exam_bp.route('/exams/<int:exam_id>', methods=['DELETE'])
 @require_admin
@@ -253,7 +302,10 @@ def delete_exam(exam_id):
 @rate_limit(limit=30, window_seconds=60)
 def submit_exam(exam_id):
     """Submit student answers and calculate score"""
-    exam = Exam.query.get_or_404(exam_id)
+    # Grading needs only the answer columns, not the exam texts
+    answer_key = exam_answers(exam_id)
+    if answer_key is None:
+        abort(404)
     data = request.get_json()
     
     student_answers = data.get('answers', {})
@@ -317,7 +369,7 @@ def submit_exam(exam_id):
     
     # Grade Leseverstehen Teil 1 (5 points)
     if 'leseverstehen_teil1' in student_answers:
-        correct_answers = json.loads(exam.lv1_answers) if exam.lv1_answers else []
+        correct_answers = answer_key['lv1_answers']
         student_lv1 = student_answers['leseverstehen_teil1']
         for i, correct in enumerate(correct_answers):
             if i < len(student_lv1) and student_lv1[i] == correct:
@@ -325,7 +377,7 @@ def submit_exam(exam_id):
     
     # Grade Leseverstehen Teil 2 (5 points)
     if 'leseverstehen_teil2' in student_answers:
-        correct_answers = json.loads(exam.lv2_answers) if exam.lv2_answers else []
+        correct_answers = answer_key['lv2_answers']
         student_lv2 = student_answers['leseverstehen_teil2']
         for i, correct in enumerate(correct_answers):
             if i < len(student_lv2) and student_lv2[i] == correct:
@@ -333,7 +385,7 @@ def submit_exam(exam_id):
     
     # Grade Leseverstehen Teil 3 (10 points)
     if 'leseverstehen_teil3' in student_answers:
-        correct_answers = json.loads(exam.lv3_answers) if exam.lv3_answers else []
+        correct_answers = answer_key['lv3_answers']
         student_lv3 = student_answers['leseverstehen_teil3']
         for i, correct in enumerate(correct_answers):
             if i < len(student_lv3) and student_lv3[i] == correct:
@@ -341,7 +393,7 @@ def submit_exam(exam_id):
     
     # Grade Sprachbausteine Teil 1 (10 points)
     if 'sprachbausteine_teil1' in student_answers:
-        correct_answers = json.loads(exam.sb1_answers) if exam.sb1_answers else []
+        correct_answers = answer_key['sb1_answers']
         student_sb1 = student_answers['sprachbausteine_teil1']
         for i, correct in enumerate(correct_answers):
             if i < len(student_sb1) and student_sb1[i] == correct:
@@ -349,7 +401,7 @@ def submit_exam(exam_id):
     
     # Grade Sprachbausteine Teil 2 (10 points)
     if 'sprachbausteine_teil2' in student_answers:
-        correct_answers = json.loads(exam.sb2_answers) if exam.sb2_answers else []
+        correct_answers = answer_key['sb2_answers']
         student_sb2 = student_answers['sprachbausteine_teil2']
         for i, correct in enumerate(correct_answers):
             if i < len(student_sb2) and student_sb2[i] == correct:
@@ -361,21 +413,21 @@ def submit_exam(exam_id):
         
         # Teil 1 (5 points)
         if 'teil1' in hv_answers:
-            correct_answers = json.loads(exam.hv1_answers) if exam.hv1_answers else []
+            correct_answers = answer_key['hv1_answers']
             for i, correct in enumerate(correct_answers):
                 if i < len(hv_answers['teil1']) and hv_answers['teil1'][i] == correct:
                     total_score += 1
         
         # Teil 2 (10 points)
         if 'teil2' in hv_answers:
-            correct_answers = json.loads(exam.hv2_answers) if exam.hv2_answers else []
+            correct_answers = answer_key['hv2_answers']
             for i, correct in enumerate(correct_answers):
                 if i < len(hv_answers['teil2']) and hv_answers['teil2'][i] == correct:
                     total_score += 1
         
         # Teil 3 (5 points)
         if 'teil3' in hv_answers:
-            correct_answers = json.loads(exam.hv3_answers) if exam.hv3_answers else []
+            correct_answers = answer_key['hv3_answers']
             for i, correct in enumerate(correct_answers):
                 if i < len(hv_answers['teil3']) and hv_answers['teil3'][i] == correct:
                     total_score += 1
@@ -387,7 +439,7 @@ def submit_exam(exam_id):
     result = ExamResult(
         exam_id=exam_id,
         student_name=student_name,
-        answers=json.dumps(student_answers),
+        answers=student_answers,
         score=score_percentage
     )
     
@@ -400,12 +452,12 @@ def submit_exam(exam_id):
         'max_score': max_score,
         'score_percentage': score_percentage,
         'detailed_scores': {
-            'leseverstehen_teil1': f"{sum(1 for i, correct in enumerate(json.loads(exam.lv1_answers) if exam.lv1_answers else []) if i < len(student_answers.get('leseverstehen_teil1', [])) and student_answers['leseverstehen_teil1'][i] == correct)}/5",
-            'leseverstehen_teil2': f"{sum(1 for i, correct in enumerate(json.loads(exam.lv2_answers) if exam.lv2_answers else []) if i < len(student_answers.get('leseverstehen_teil2', [])) and student_answers['leseverstehen_teil2'][i] == correct)}/5",
-            'leseverstehen_teil3': f"{sum(1 for i, correct in enumerate(json.loads(exam.lv3_answers) if exam.lv3_answers else []) if i < len(student_answers.get('leseverstehen_teil3', [])) and student_answers['leseverstehen_teil3'][i] == correct)}/10",
-            'sprachbausteine_teil1': f"{sum(1 for i, correct in enumerate(json.loads(exam.sb1_answers) if exam.sb1_answers else []) if i < len(student_answers.get('sprachbausteine_teil1', [])) and student_answers['sprachbausteine_teil1'][i] == correct)}/10",
-            'sprachbausteine_teil2': f"{sum(1 for i, correct in enumerate(json.loads(exam.sb2_answers) if exam.sb2_answers else []) if i < len(student_answers.get('sprachbausteine_teil2', [])) and student_answers['sprachbausteine_teil2'][i] == correct)}/10",
-            'hoerverstehen': f"{sum(1 for teil in ['teil1', 'teil2', 'teil3'] for i, correct in enumerate(json.loads(getattr(exam, f'hv{teil[-1]}_answers')) if getattr(exam, f'hv{teil[-1]}_answers') else []) if i < len(student_answers.get('hoerverstehen', {}).get(teil, [])) and student_answers['hoerverstehen'][teil][i] == correct)}/20"
+            'leseverstehen_teil1': f"{sum(1 for i, correct in enumerate(answer_key['lv1_answers']) if i < len(student_answers.get('leseverstehen_teil1', [])) and student_answers['leseverstehen_teil1'][i] == correct)}/5",
+            'leseverstehen_teil2': f"{sum(1 for i, correct in enumerate(answer_key['lv2_answers']) if i < len(student_answers.get('leseverstehen_teil2', [])) and student_answers['leseverstehen_teil2'][i] == correct)}/5",
+            'leseverstehen_teil3': f"{sum(1 for i, correct in enumerate(answer_key['lv3_answers']) if i < len(student_answers.get('leseverstehen_teil3', [])) and student_answers['leseverstehen_teil3'][i] == correct)}/10",
+            'sprachbausteine_teil1': f"{sum(1 for i, correct in enumerate(answer_key['sb1_answers']) if i < len(student_answers.get('sprachbausteine_teil1', [])) and student_answers['sprachbausteine_teil1'][i] == correct)}/10",
+            'sprachbausteine_teil2': f"{sum(1 for i, correct in enumerate(answer_key['sb2_answers']) if i < len(student_answers.get('sprachbausteine_teil2', [])) and student_answers['sprachbausteine_teil2'][i] == correct)}/10",
+            'hoerverstehen': f"{sum(1 for teil in ['teil1', 'teil2', 'teil3'] for i, correct in enumerate(answer_key[f'hv{teil[-1]}_answers']) if i < len(student_answers.get('hoerverstehen', {}).get(teil, [])) and student_answers['hoerverstehen'][teil][i] == correct)}/20"
         }
     })
 
@@ -0,0 +1,139 @@
+from flask import Blueprint, request, jsonify
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.user import db
+from src.models.translation import GlossaryEntry
+from src.routes.translation import sha256_text
+from src.security import rate_limit, require_admin
+from src.services.glossary import bump_glossary_generation, invalidate_glossary, normalize_term, spelling_variants
+from src.services.translation_memory import forget_many
+
+glossary_bp = Blueprint('glossary', __name__)
+
+GLOSSARY_KINDS = ('term', 'phrase')
+
+
+def _entry_values(data: dict) -> dict | None:
+    source_text = (data.get('source_text') or '').strip()
+    translated_text = (data.get('translated_text') or '').strip()
+    target_lang = (data.get('target_lang') or '').upper()
+    if not source_text or not translated_text or not target_lang or not normalize_term(source_text):
+        return None
+    kind = data.get('kind') or ('phrase' if ' ' in source_text else 'term')
+    if kind not in GLOSSARY_KINDS:
+        return None
+    return {
+        'source_lang': (data.get('source_lang') or 'DE').upper(),
+        'target_lang': target_lang,
+        'source_text': source_text,
+        'normalized_source': normalize_term(source_text),
+        'translated_text': translated_text,
+        'kind': kind,
+    }
+
+
+def _forget_cached(values: dict) -> None:
+    # Make the glossary win over translations already in the memory. The memory is
+    # keyed by exact text, so the usual spellings of the term are dropped as well.
+    forget_many(
+        [sha256_text(spelling) for spelling in spelling_variants(values['source_text'])],
+        values['source_lang'], values['target_lang'],
+    )
+
+
+@glossary_bp.route('/translation/glossary', methods=['GET'])
+@require_admin
+@rate_limit(limit=60, window_seconds=60)
+def list_glossary():
+    """List glossary entries, optionally filtered by ?target_lang=&source_lang=&q="""
+    query = GlossaryEntry.query
+    if request.args.get('source_lang'):
+        query = query.filter(GlossaryEntry.source_lang == request.args['source_lang'].upper())
+    if request.args.get('target_lang'):
+        query = query.filter(GlossaryEntry.target_lang == request.args['target_lang'].upper())
+    if request.args.get('q'):
+        query = query.filter(GlossaryEntry.normalized_source.contains(normalize_term(request.args['q'])))
+    limit = min(max(request.args.get('limit', 100, type=int), 0), 1000)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    total = query.count()
+    entries = query.order_by(GlossaryEntry.normalized_source).offset(offset).limit(limit).all()
+    return jsonify({'total': total, 'entries': [entry.to_dict() for entry in entries]})
+
+
+@glossary_bp.route('/translation/glossary', methods=['POST'])
+@require_admin
+@rate_limit(limit=30, window_seconds=60)
+def upsert_glossary():
+    """
+    Add or replace glossary entries.
+
+    Accepts one entry or {"entries": [...]}; an entry is
+    {source_text, translated_text, target_lang, source_lang?, kind?}.
+    Entries with the same normalized source text are replaced.
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get('entries') if 'entries' in data else [data]
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'entries must be a non-empty list'}), 400
+
+    values = []
+    for item in items:
+        entry = _entry_values(item if isinstance(item, dict) else {})
+        if entry is None:
+            return jsonify({'error': 'Each entry needs source_text, translated_text, target_lang and a valid kind',
+                            'entry': item}), 400
+        values.append(entry)
+    # Last entry wins when a request repeats a term
+    values = list({(v['source_lang'], v['target_lang'], v['normalized_source']): v for v in values}.values())
+
+    stmt = insert(GlossaryEntry).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['source_lang', 'target_lang', 'normalized_source'],
+        set_={
+            'source_text': stmt.excluded.source_text,
+            'translated_text': stmt.excluded.translated_text,
+            'kind': stmt.excluded.kind,
+            'updated_at': db.func.now(),
+        },
+    )
+    db.session.execute(stmt)
+    for entry in values:
+        _forget_cached(entry)
+    bump_glossary_generation()
+    db.session.commit()
+    invalidate_glossary()
+    return jsonify({'upserted': len(values)}), 201
+
+
+@glossary_bp.route('/translation/glossary/<int:entry_id>', methods=['PUT'])
+@require_admin
+@rate_limit(limit=30, window_seconds=60)
+def update_glossary_entry(entry_id: int):
+    """Update one glossary entry"""
+    entry = GlossaryEntry.query.get_or_404(entry_id)
+    data = request.get_json(silent=True) or {}
+    values = _entry_values({**entry.to_dict(), **data})
+    if values is None:
+        return jsonify({'error': 'Invalid glossary entry'}), 400
+    _forget_cached(entry.to_dict())
+    for key, value in values.items():
+        setattr(entry, key, value)
+    _forget_cached(values)
+    bump_glossary_generation()
+    db.session.commit()
+    invalidate_glossary()
+    return jsonify(entry.to_dict())
+
+
+@glossary_bp.route('/translation/glossary/<int:entry_id>', methods=['DELETE'])
+@require_admin
+@rate_limit(limit=30, window_seconds=60)
+def delete_glossary_entry(entry_id: int):
+    """Delete one glossary entry"""
+    entry = GlossaryEntry.query.get_or_404(entry_id)
+    _forget_cached(entry.to_dict())
+    db.session.delete(entry)
+    bump_glossary_generation()
+    db.session.commit()
+    invalidate_glossary()
+    return '', 204
@@ -1,24 +1,48 @@
 import hashlib
+import html
+import logging
 import re
 import json
 import os
-from flask import Blueprint, request, jsonify
+import string
+import time
+from flask import Blueprint, Response, abort, request, jsonify, stream_with_context
 from flask_cors import cross_origin
 from src.models.user import db
 from src.models.exam import Exam
-from src.models.translation import TranslationCache, ExamTranslation
+from src.models.translation import ExamTranslation, TranslationJob
 
-from src.security import rate_limit, require_admin
+from src.security import check_rate_limit, rate_limit, require_admin
+from src.services.coalesce import SingleFlight, advisory_lock
+from src.services.exam_paths import compile_path, iter_exam_text_accessors
+from src.services.exam_projection import project_exam_fields
+from src.services.glossary import glossary_stats, translate_via_glossary
+from src.services.memory_cache import translation_lru
+from src.services.provider_client import provider_get, provider_max_bytes, provider_post
+from src.services.provider_health import get_provider_health, health_snapshot, order_providers
+from src.services.provider_quota import bulk_priority, get_provider_quota
+from src.services.provider_registry import configured_providers, get_provider, register_provider
+from src.services.segmenter import is_passthrough, join_segments, should_segment, split_for_limit, split_segments
+from src.services.translation_executor import hedged_call, iter_completed, map_concurrently, map_nested, provider_slot
+from src.services.tracing import span, traced
+from src.services.translation_jobs import enqueue_translation_job
+from src.services.translation_memory import (
+    MemoryEntry, forget, link_paths, lookup_legacy, lookup_memory, remember_many, stale_quality_rows, store_quality,
+)
 
 translation_bp = Blueprint('translation', __name__)
+logger = logging.getLogger(__name__)
 
 
 def sha256_text(text: str) -> str:
     return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
 
-def translate_via_openrouter(text: str, source_lang: str, target_lang: str) -> str | None:
-    import requests
+def _openrouter_chat(system_prompt: str, user_content: str, timeout: int = 25) -> str | None:
+    """Send one chat completion to OpenRouter and return the message content.
+
+    Returns None without an API key or content; request and HTTP errors raise.
+    """
     api_key = os.getenv('OPENROUTER_API_KEY')
     if not api_key:
         return None
@@ -33,84 +57,157 @@ def translate_via_openrouter(text: str, source_lang: str, target_lang: str) -> s
         headers['HTTP-Referer'] = site_url
     if site_name:
         headers['X-Title'] = site_name
-    system_prompt = (
-        'You are a professional translator. Translate the user text accurately '
-        f'from {source_lang.upper()} to {target_lang.upper()}. Return only the translated text without explanations.'
-    )
     body = {
         'model': model,
         'messages': [
             {'role': 'system', 'content': system_prompt},
-            {'role': 'user', 'content': text},
+            {'role': 'user', 'content': user_content},
         ],
     }
+    resp = provider_post('https://openrouter.ai/api/v1/chat/completions', timeout, json=body, headers=headers)
+    if resp.status_code == 429:
+        get_provider_quota('OpenRouter').exhaust(_retry_after(resp) or 60)
+    resp.raise_for_status()
+    data = resp.json()
+    choices = data.get('choices') or []
+    if choices and choices[0].get('message', {}).get('content'):
+        return choices[0]['message']['content']
+    return None
+
+
+def _retry_after(resp) -> float | None:
     try:
-        resp = requests.post('https://openrouter.ai/api/v1/chat/completions', json=body, headers=headers, timeout=25)
-        resp.raise_for_status()
-        data = resp.json()
-        choices = data.get('choices') or []
-        if choices and choices[0].get('message', {}).get('content'):
-            return choices[0]['message']['content']
-    except Exception:
+        return float(resp.headers.get('Retry-After'))
+    except (TypeError, ValueError):
         return None
-    return None
 
 
-def translate_via_mymemory(text: str, source_lang: str, target_lang: str) -> str | None:
-    """Fallback public translation API (rate-limited). Returns None on failure."""
+def translate_via_openrouter(text: str, source_lang: str, target_lang: str) -> str | None:
+    system_prompt = (
+        'You are a professional translator. Translate the user text accurately '
+        f'from {source_lang.upper()} to {target_lang.upper()}. Return only the translated text without explanations.'
+    )
+    return _openrouter_chat(system_prompt, text)
+
+
+def _parse_openrouter_batch(content: str, count: int) -> list[str | None]:
+    """Parse a JSON array of {"id", "text"} objects into a list addressed by id."""
+    results: list[str | None] = [None] * count
+    if not content:
+        return results
+    start, end = content.find('['), content.rfind(']')
+    if start == -1 or end <= start:
+        return results
     try:
-        import requests
-        sl = (source_lang or 'DE').lower()
-        tl = (target_lang or 'FA').lower()
-        
-        # MyMemory uses different language codes
-        lang_map = {
-            'de': 'de',
-            'fa': 'fa',
-            'en': 'en',
-            'fr': 'fr'
-        }
-        
-        source_code = lang_map.get(sl, sl)
-        target_code = lang_map.get(tl, tl)
-        
-        resp = requests.get(
-            'https://api.mymemory.translated.net/get',
-            params={
-                'q': text, 
-                'langpair': f'{source_code}|{target_code}',
-                'de': 'your-email@domain.com'  # Optional: add email for higher rate limit
-            },
-            timeout=15,
-        )
-        resp.raise_for_status()
-        data = resp.json() or {}
-        t = ((data.get('responseData') or {}).get('translatedText') or '').strip()
-        
-        # Validate that we got a translation (not the same text)
-        if t and t != text and len(t) > 0:
-            return t
+        items = json.loads(content[start:end + 1])
+    except ValueError:
+        return results
+    if not isinstance(items, list):
+        return results
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        idx, text = item.get('id'), item.get('text')
+        if isinstance(idx, int) and 0 <= idx < count and isinstance(text, str) and text.strip():
+            results[idx] = text.strip()
+    return results
+
+
+def translate_batch_via_openrouter(texts: list[str], source_lang: str, target_lang: str) -> list[str | None]:
+    """
+    Translate many segments with a single OpenRouter chat completion.
+    Returns one entry per input text; entries that could not be parsed are None.
+    """
+    if not texts:
+        return []
+    system_prompt = (
+        'You are a professional translator. The user sends a JSON array of objects with "id" and "text". '
+        f'Translate every "text" accurately from {source_lang.upper()} to {target_lang.upper()}, keeping line breaks. '
+        'Return only a JSON array of objects with the same "id" and the translated "text", without explanations.'
+    )
+    segments = [{'id': idx, 'text': text} for idx, text in enumerate(texts)]
+    content = _openrouter_chat(system_prompt, json.dumps(segments, ensure_ascii=False), timeout=60)
+    results = _parse_openrouter_batch(content or '', len(texts))
+    # A segment echoed back untranslated counts as a failure
+    return [r if r and r != texts[idx].strip() else None for idx, r in enumerate(results)]
+
+
+def translate_via_mymemory(text: str, source_lang: str, target_lang: str) -> str | None:
+    """Fallback public translation API (rate-limited).
+
+    Returns None when there is no usable translation (same text, quota used
+    up); request and HTTP errors raise.
+    """
+    sl = (source_lang or 'DE').lower()
+    tl = (target_lang or 'FA').lower()
+    
+    # MyMemory uses different language codes
+    lang_map = {
+        'de': 'de',
+        'fa': 'fa',
+        'en': 'en',
+        'fr': 'fr'
+    }
+    
+    source_code = lang_map.get(sl, sl)
+    target_code = lang_map.get(tl, tl)
+    
+    resp = provider_get(
+        'https://api.mymemory.translated.net/get',
+        15,
+        params={
+            'q': text, 
+            'langpair': f'{source_code}|{target_code}',
+            'de': 'your-email@domain.com'  # Optional: add email for higher rate limit
+        },
+    )
+    if resp.status_code == 429:
+        get_provider_quota('MyMemory').exhaust(_retry_after(resp))
         return None
-    except Exception as e:
-        print(f"MyMemory translation error: {e}")
+    resp.raise_for_status()
+    data = resp.json() or {}
+    t = ((data.get('responseData') or {}).get('translatedText') or '').strip()
+    if data.get('quotaFinished') or t.startswith('MYMEMORY WARNING'):
+        # Daily free quota used up; the warning comes back as the "translation"
+        get_provider_quota('MyMemory').exhaust()
         return None
+    
+    # Validate that we got a translation (not the same text)
+    if t and t != text and len(t) > 0:
+        return t
+    return None
 
 
+# Precompiled validator tables. Character classes are counted on the UTF-8
+# bytes in C: every character in U+0600..U+06FF starts with byte D8..DB.
+_PERSIAN_LEAD_BYTES = (b'\xd8', b'\xd9', b'\xda', b'\xdb')
+_ASCII_LETTERS = string.ascii_letters.encode()
+_NUMBER_RUN = re.compile(r'\d+')
+_HTML_ENTITY = re.compile(r'&[a-zA-Z]+;')
+IMPORTANT_PUNCTUATION = ('(', ')', '[', ']', '–', '-', ':', ';', '!', '?')
+_ENCODING_ERRORS = ('Ã¼', 'Ã¤', 'Ã¶', 'ÃŸ', 'â€')  # 'â€' also covers 'â€™' and 'â€œ'
+_ARTIFACTS = ('[translation]', '[/translation]', '**', '###', 'translation:', 'übersetzung:')
+_CRITICAL_ISSUES = frozenset(['Empty translation', 'Translation identical to original', 'No Persian characters found'])
+# Bump whenever the scoring below changes; stored results from older versions are revalidated
+VALIDATOR_VERSION = 1
+
+
+@traced('validate')
 def validate_translation_quality(original: str, translated: str, source_lang: str, target_lang: str) -> dict:
     """
     Comprehensive validation of translation quality and formatting.
     Returns dict with 'valid' (bool), 'score' (0-100), and 'issues' (list).
     """
-    issues = []
-    score = 100
-    
     # Basic validation
     if not translated or not translated.strip():
         return {'valid': False, 'score': 0, 'issues': ['Empty translation']}
     
     if translated == original:
         return {'valid': False, 'score': 0, 'issues': ['Translation identical to original']}
-    
+
+    issues = []
+    score = 100
+
     # Length validation (should not be too short or too long)
     length_ratio = len(translated) / max(len(original), 1)
     if length_ratio < 0.3:
@@ -119,108 +216,96 @@ def validate_translation_quality(original: str, translated: str, source_lang: st
     elif length_ratio > 3.0:
         issues.append('Translation too long')
         score -= 20
-    
+
     # Character set validation for Persian
     if target_lang.upper() == 'FA':
-        persian_chars = re.findall(r'[\u0600-\u06FF]', translated)
-        latin_chars = re.findall(r'[a-zA-Z]', translated)
-        
-        if not persian_chars:
+        encoded = translated.encode('utf-8', 'surrogatepass')
+        persian_count = sum(map(encoded.count, _PERSIAN_LEAD_BYTES))
+        latin_count = len(encoded) - len(encoded.translate(None, _ASCII_LETTERS))
+        if not persian_count:
             issues.append('No Persian characters found')
-            score -= 30  # Reduced penalty from 50 to 30
-        
-        # Allow some Latin chars for technical terms, but not too many
-        # More lenient for short texts
+            score -= 30
+        # Allow some Latin chars for technical terms, more leniently for short texts
         max_latin_ratio = 0.5 if len(translated) < 20 else 0.3
-        if len(latin_chars) > len(persian_chars) * max_latin_ratio:
+        if latin_count > persian_count * max_latin_ratio:
             issues.append('Too many Latin characters in Persian translation')
-            score -= 10  # Reduced penalty from 15 to 10
-    
+            score -= 10
+
     # Preserve formatting elements
-    original_numbers = re.findall(r'\d+', original)
-    translated_numbers = re.findall(r'\d+', translated)
-    if len(original_numbers) != len(translated_numbers):
+    if len(_NUMBER_RUN.findall(original)) != len(_NUMBER_RUN.findall(translated)):
         issues.append('Number count mismatch')
         score -= 10
-    
+
     # Check for preserved punctuation marks
-    important_punctuation = ['(', ')', '[', ']', '–', '-', ':', ';', '!', '?']
-    for punct in important_punctuation:
+    for punct in IMPORTANT_PUNCTUATION:
         if original.count(punct) != translated.count(punct):
             issues.append(f'Punctuation mismatch: {punct}')
             score -= 5
-    
+
     # Check for HTML entities or encoding issues
-    if '&' in translated and ';' in translated:
-        html_entities = re.findall(r'&[a-zA-Z]+;', translated)
-        if html_entities:
-            issues.append('HTML entities detected')
-            score -= 10
-    
-    # Check for obvious encoding errors
-    encoding_errors = ['Ã¼', 'Ã¤', 'Ã¶', 'ÃŸ', 'â€™', 'â€œ', 'â€']
-    for error in encoding_errors:
-        if error in translated:
-            issues.append('Encoding error detected')
-            score -= 20
-            break
-    
+    if '&' in translated and ';' in translated and _HTML_ENTITY.search(translated):
+        issues.append('HTML entities detected')
+        score -= 10
+    if any(error in translated for error in _ENCODING_ERRORS):
+        issues.append('Encoding error detected')
+        score -= 20
+
     # Check for translation service artifacts
-    artifacts = ['[translation]', '[/translation]', '**', '###', 'Translation:', 'Übersetzung:']
-    for artifact in artifacts:
-        if artifact.lower() in translated.lower():
+    lowered = translated.lower()
+    for artifact in _ARTIFACTS:
+        if artifact in lowered:
             issues.append('Translation service artifact detected')
             score -= 15
-    
+
     # Ensure score doesn't go below 0
     score = max(0, score)
-    
+
     # Consider valid if score >= 70 and no critical issues
-    critical_issues = ['Empty translation', 'Translation identical to original', 'No Persian characters found']
-    has_critical = any(issue in issues for issue in critical_issues)
-    
     return {
-        'valid': score >= 70 and not has_critical,
+        'valid': score >= 70 and _CRITICAL_ISSUES.isdisjoint(issues),
         'score': score,
         'issues': issues
     }
 
 
+# Compact opaque placeholder tokens; providers pass them through unchanged
+PLACEHOLDER_TOKEN = '⟦{}⟧'
+PLACEHOLDER_PATTERN = re.compile(r'⟦(\d+)⟧')
+_PADDED_PLACEHOLDER_PATTERN = re.compile(r' ?⟦(\d+)⟧ ?')
+_FORMATTING_PATTERN = re.compile(r'\n|<br\s*/?>|&[a-zA-Z0-9#]+;', re.IGNORECASE)
+
+
 def preserve_formatting_for_translation(text: str) -> tuple[str, dict]:
     """
     Preserve formatting elements before translation by replacing them with placeholders.
     Returns the modified text and a mapping to restore formatting.
+
+    Newlines, <br> tags and HTML entities become short ⟦n⟧ tokens, one per
+    distinct element. Line breaks are padded with a space so words on either
+    side stay apart; the padding is removed again on restore.
     """
-    if not text:
+    if not text or not _FORMATTING_PATTERN.search(text):
         return text, {}
-    
-    formatting_map = {}
-    preserved_text = text
-    
-    # Preserve newlines with a unique placeholder
-    newline_placeholder = "___NEWLINE_PLACEHOLDER___"
-    if '\n' in preserved_text:
-        formatting_map['newlines'] = preserved_text.count('\n')
-        preserved_text = preserved_text.replace('\n', f' {newline_placeholder} ')
-    
-    # Preserve line breaks  
-    br_placeholder = "___BR_PLACEHOLDER___"
-    if '<br>' in preserved_text or '<br/>' in preserved_text or '<br />' in preserved_text:
-        preserved_text = re.sub(r'<br\s*/?>', f' {br_placeholder} ', preserved_text, flags=re.IGNORECASE)
-        formatting_map['br_tags'] = True
-    
-    # Preserve HTML entities that should remain
-    entity_placeholders = {}
-    html_entities = re.findall(r'&[a-zA-Z0-9#]+;', preserved_text)
-    for i, entity in enumerate(set(html_entities)):
-        placeholder = f"___ENTITY_{i}___"
-        entity_placeholders[placeholder] = entity
-        preserved_text = preserved_text.replace(entity, placeholder)
-    
-    if entity_placeholders:
-        formatting_map['entities'] = entity_placeholders
-    
-    return preserved_text, formatting_map
+
+    tokens: dict[str, str] = {}
+    padded: set[str] = set()
+
+    def replace(match: re.Match) -> str:
+        element = match.group(0)
+        is_break = element == '\n' or element[:1] == '<'
+        if is_break:
+            element = '\n' if element == '\n' else '<br>'
+        token = next((t for t, e in tokens.items() if e == element), None)
+        if token is None:
+            token = PLACEHOLDER_TOKEN.format(len(tokens))
+            tokens[token] = element
+        if is_break:
+            padded.add(token)
+            return f' {token} '
+        return token
+
+    preserved_text = _FORMATTING_PATTERN.sub(replace, text)
+    return preserved_text, {'tokens': tokens, 'padded': padded}
 
 
 def restore_formatting_after_translation(text: str, formatting_map: dict) -> str:
@@ -229,25 +314,48 @@ def restore_formatting_after_translation(text: str, formatting_map: dict) -> str
     """
     if not text or not formatting_map:
         return text
-    
+
+    tokens = formatting_map['tokens']
+    padded = formatting_map['padded']
     restored_text = text
-    
-    # Restore HTML entities first
-    if 'entities' in formatting_map:
-        for placeholder, entity in formatting_map['entities'].items():
-            restored_text = restored_text.replace(placeholder, entity)
-    
-    # Restore line breaks
-    if 'br_tags' in formatting_map:
-        restored_text = restored_text.replace('___BR_PLACEHOLDER___', '<br>')
-    
-    # Restore newlines  
-    if 'newlines' in formatting_map:
-        restored_text = restored_text.replace('___NEWLINE_PLACEHOLDER___', '\n')
-    
-    return restored_text
+    for token, element in tokens.items():
+        if token not in padded:
+            restored_text = restored_text.replace(token, element)
 
+    def restore_break(match: re.Match) -> str:
+        token = PLACEHOLDER_TOKEN.format(match.group(1))
+        return tokens[token] if token in padded else match.group(0)
 
+    # Line breaks also drop the space added on each side
+    return _PADDED_PLACEHOLDER_PATTERN.sub(restore_break, restored_text)
+
+
+# Precompiled normalizer used by clean_and_format_translation. Each step
+# only runs when a cheap check shows it can change the text.
+_MOJIBAKE = re.compile('Ã[¼¤¶Ÿ]|â€[™œ]?')
+_MOJIBAKE_FIXES = {'Ã¼': 'ü', 'Ã¤': 'ä', 'Ã¶': 'ö', 'ÃŸ': 'ß', 'â€™': "'", 'â€œ': '"', 'â€': '"'}
+# Entities left after html.unescape (double-escaped input); &amp; is replaced
+# between the two groups so '&amp;lt;' becomes '<' but '&amp;#10;' stays '&#10;'
+_LEFTOVER_ENTITIES_BEFORE_AMP = re.compile('&#10;|&#13;|&#32;|&nbsp;')
+_LEFTOVER_ENTITIES_AFTER_AMP = re.compile('&lt;|&gt;|&quot;|&apos;')
+_LEFTOVER_ENTITY_TEXT = {
+    '&#10;': '\n', '&#13;': '\r', '&#32;': ' ', '&nbsp;': ' ',
+    '&lt;': '<', '&gt;': '>', '&quot;': '"', '&apos;': "'",
+}
+# Removed in this order, each pattern seeing the previous one's output
+_ARTIFACT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\[/?translation\]', r'\*\*', r'###',
+        r'^Translation:\s*', r'^Übersetzung:\s*', r'^Translated:\s*', r'^Result:\s*',
+    )
+]
+_ANY_ARTIFACT = re.compile('|'.join(p.pattern for p in _ARTIFACT_PATTERNS), re.IGNORECASE)
+_SPACES_AROUND_NEWLINE = re.compile(r'[ \t]*\n[ \t]*')
+_SPACE_RUN = re.compile(r'[ \t]{2,}|\t')
+
+
+@traced('normalize')
 def clean_and_format_translation(text: str, target_lang: str) -> str:
     """
     Clean and format translation to ensure professional quality with proper formatting.
@@ -259,49 +367,28 @@ def clean_and_format_translation(text: str, target_lang: str) -> str:
     text = text.strip()
     
     # Fix common encoding issues
-    encoding_fixes = {
-        'Ã¼': 'ü', 'Ã¤': 'ä', 'Ã¶': 'ö', 'ÃŸ': 'ß',
-        'â€™': "'", 'â€œ': '"', 'â€': '"', 'â€"': '–', 'â€"': '—'
-    }
-    for bad, good in encoding_fixes.items():
-        text = text.replace(bad, good)
+    if 'Ã' in text or 'â€' in text:
+        text = _MOJIBAKE.sub(lambda m: _MOJIBAKE_FIXES[m.group()], text)
     
-    # Decode HTML entities (but preserve intentional ones)
-    import html
-    # First decode numeric character references like &#10; &#13; etc.
-    text = html.unescape(text)
-    
-    # Handle specific problematic entities that break formatting
-    problematic_entities = {
-        '&#10;': '\n',    # Line feed
-        '&#13;': '\r',    # Carriage return  
-        '&#32;': ' ',     # Space
-        '&nbsp;': ' ',    # Non-breaking space
-        '&amp;': '&',     # Ampersand
-        '&lt;': '<',      # Less than
-        '&gt;': '>',      # Greater than
-        '&quot;': '"',    # Quote
-        '&apos;': "'",    # Apostrophe
-    }
-    for entity, replacement in problematic_entities.items():
-        text = text.replace(entity, replacement)
+    # Decode HTML entities, then the ones that were double-escaped
+    if '&' in text:
+        text = html.unescape(text)
+        if '&' in text:
+            replace_entity = lambda m: _LEFTOVER_ENTITY_TEXT[m.group()]
+            text = _LEFTOVER_ENTITIES_BEFORE_AMP.sub(replace_entity, text)
+            text = text.replace('&amp;', '&')
+            text = _LEFTOVER_ENTITIES_AFTER_AMP.sub(replace_entity, text)
     
     # Remove translation service artifacts
-    artifacts_to_remove = [
-        r'\[/?translation\]',
-        r'\*\*',
-        r'###',
-        r'^Translation:\s*',
-        r'^Übersetzung:\s*',
-        r'^Translated:\s*',
-        r'^Result:\s*'
-    ]
-    for pattern in artifacts_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    if _ANY_ARTIFACT.search(text):
+        for pattern in _ARTIFACT_PATTERNS:
+            text = pattern.sub('', text)
     
     # Clean up extra whitespace while preserving intentional line breaks
-    text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces/tabs to single space
-    text = re.sub(r'[ \t]*\n[ \t]*', '\n', text)  # Clean around newlines
+    if '\n' in text:
+        text = _SPACES_AROUND_NEWLINE.sub('\n', text)
+    if '\t' in text or '  ' in text:
+        text = _SPACE_RUN.sub(' ', text)
     text = text.strip()
     
     # Persian-specific formatting
@@ -309,162 +396,761 @@ def clean_and_format_translation(text: str, target_lang: str) -> str:
         # Ensure proper RTL markers for Persian text
         if text and not text.startswith('\u202B'):  # RTL embedding
             # Only add if text contains significant Persian content
-            persian_char_count = len(re.findall(r'[\u0600-\u06FF]', text))
-            if persian_char_count > 3:
+            encoded = text.encode('utf-8', 'surrogatepass')
+            if sum(map(encoded.count, _PERSIAN_LEAD_BYTES)) > 3:
                 text = f'\u202B{text}\u202C'  # Wrap in RTL embedding
     
     return text
 
 
+# Provider calls in flight in this process, keyed by (source hash, source_lang, target_lang)
+_in_flight = SingleFlight()
+
+
+def _timed_provider_call(service_name: str, translate_func, *args, span_name: str | None = None):
+    """
+    Call translate_func(*args) in the provider's concurrency slot and record the outcome.
+
+    Exceptions (request errors, timeouts, HTTP errors) count as failures. A
+    None result means the provider had no usable translation (unchanged
+    text, no API key, quota reply); it records nothing and hands a half-open
+    probe back.
+    """
+    health = get_provider_health(service_name)
+    started = time.monotonic()
+    try:
+        with provider_slot(service_name), span(span_name or f'provider.{service_name.lower()}'):
+            result = translate_func(*args)
+    except Exception:
+        health.record_failure(time.monotonic() - started)
+        raise
+    if result is None:
+        health.cancel_request()
+    else:
+        health.record_success(time.monotonic() - started)
+    return result
+
+
+def _call_provider(service_name: str, translate_func, text: str, source_lang: str, target_lang: str) -> str | None:
+    # Skip providers whose circuit is open; record latency and outcome otherwise
+    health = get_provider_health(service_name)
+    if not health.allow_request():
+        logger.debug("%s skipped (circuit open)", service_name)
+        return None
+    chunks, separators = split_for_limit(text, provider_max_bytes(service_name))
+    # Queue for the provider's rate and character budget; route around it when exhausted
+    with span('quota_wait'):
+        granted = get_provider_quota(service_name).acquire(len(text), requests=len(chunks))
+    if not granted:
+        health.cancel_request()
+        logger.info("%s skipped (quota exhausted)", service_name)
+        return None
+    if len(chunks) == 1:
+        return _timed_provider_call(service_name, translate_func, text, source_lang, target_lang)
+
+    # Over the provider's request limit: translate the chunks in parallel, all must succeed
+    translated = map_nested(
+        lambda chunk: _timed_provider_call(service_name, translate_func, chunk, source_lang, target_lang), chunks
+    )
+    if not all(part and part.strip() for part in translated):
+        return None
+    return join_segments([part.strip() for part in translated], separators)
+
+
 def translate_text(text: str, source_lang: str, target_lang: str) -> str:
     """
     Simplified translation function for better reliability.
+
+    Local providers (the glossary) are tried first, then the network providers
+    from TRANSLATION_PROVIDERS in order. When TRANSLATION_HEDGE_DELAY (seconds) is set,
+    the next provider is started in parallel whenever the running ones have not
+    answered within that delay, and the first valid result wins.
+    Concurrent calls for the same text and language pair share one provider round.
     """
     if not text or not text.strip():
         return text
-    
+
     original_text = text.strip()
-    print(f"Translating: '{original_text}' from {source_lang} to {target_lang}")
-    
-    # Try translation services in order
-    services = [
-        ('MyMemory', translate_via_mymemory),
-        ('LibreTranslate', translate_via_libretranslate),
-        ('OpenRouter', translate_via_openrouter)
-    ]
+    # Dates, numbers and other letterless text come back unchanged from every provider
+    if is_passthrough(original_text):
+        return original_text
+    return _in_flight.do(
+        (sha256_text(original_text), source_lang, target_lang),
+        lambda: _translate_uncoalesced(original_text, source_lang, target_lang),
+    )
+
+
+def _translate_uncoalesced(original_text: str, source_lang: str, target_lang: str) -> str:
+    # Local providers (glossary) answer without a network call
+    local_result = translate_locally(original_text, source_lang, target_lang)
+    if local_result:
+        return local_result
+
+    # Try translation services in order (reordered by observed provider health)
+    services = order_providers([
+        (provider.name, provider.translate) for provider in configured_providers() if not provider.local
+    ])
+
+    hedge_delay = float(os.getenv('TRANSLATION_HEDGE_DELAY', '0') or 0)
+    if hedge_delay > 0:
+        def accept(result) -> bool:
+            return bool(result and result.strip() and result != original_text)
+
+        calls = [
+            (service_name, lambda f=translate_func, n=service_name: _call_provider(n, f, original_text, source_lang, target_lang))
+            for service_name, translate_func in services
+        ]
+        service_name, result = hedged_call(calls, hedge_delay, accept)
+        if service_name:
+            logger.debug("%s success (hedged)", service_name)
+            return result.strip()
+        logger.info("No translation found, returning original (%d chars)", len(original_text))
+        return original_text
     
     for service_name, translate_func in services:
         try:
-            print(f"Trying {service_name}...")
-            result = translate_func(original_text, source_lang, target_lang)
+            result = _call_provider(service_name, translate_func, original_text, source_lang, target_lang)
             
             if result and result.strip() and result != original_text:
-                print(f"✓ {service_name} success: '{result}'")
+                logger.debug("%s success", service_name)
                 # Simple validation: just check if we got a different non-empty result
                 return result.strip()
             else:
-                print(f"✗ {service_name} failed or returned same text")
+                logger.debug("%s failed or returned same text", service_name)
                 
         except Exception as e:
-            print(f"✗ {service_name} error: {e}")
+            logger.warning("%s error: %s", service_name, e)
             continue
     
-    print(f"No translation found, returning original: '{original_text}'")
+    logger.info("No translation found, returning original (%d chars)", len(original_text))
     return original_text
 
 
+def translate_locally(text: str, source_lang: str, target_lang: str) -> str | None:
+    """First result of the configured local providers, or None."""
+    for provider in configured_providers():
+        if not provider.local:
+            continue
+        try:
+            result = provider.translate(text, source_lang, target_lang)
+        except Exception as e:
+            logger.warning("%s error: %s", provider.name, e)
+            continue
+        if result and result.strip() and result != text:
+            logger.debug("%s hit", provider.name)
+            return result.strip()
+    return None
+
+
+def translate_many(texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+    """
+    Translate several texts concurrently on the shared translation pool.
+    Results are returned in the same order as the input texts.
+    """
+    return map_concurrently(lambda t: translate_text(t, source_lang, target_lang), texts)
+
+
+def _batch_chunks(texts: list[str]) -> list[list[int]]:
+    """Group text indexes into batches bounded by segment count and total characters."""
+    max_items = int(os.getenv('OPENROUTER_BATCH_SIZE', '40'))
+    max_chars = int(os.getenv('OPENROUTER_BATCH_MAX_CHARS', '6000'))
+    chunks, current, size = [], [], 0
+    for idx, text in enumerate(texts):
+        if current and (len(current) >= max_items or size + len(text) > max_chars):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(idx)
+        size += len(text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def translate_texts_batched(texts: list[str], source_lang: str, target_lang: str) -> list[str]:
+    """
+    Translate many texts with a handful of batched OpenRouter requests.
+    Segments missing from a batch response fall back to per-segment translate_text.
+    """
+    # Blank segments and glossary hits never need a provider call
+    results: list[str | None] = [
+        translate_locally(text.strip(), source_lang, target_lang) if text and text.strip() else text
+        for text in texts
+    ]
+    todo = [idx for idx, value in enumerate(results) if value is None]
+
+    openrouter = get_provider('OpenRouter')
+    if todo and os.getenv('OPENROUTER_API_KEY') and openrouter in configured_providers():
+        todo_texts = [texts[idx].strip() for idx in todo]
+
+        def run_chunk(chunk: list[int]) -> list[str | None]:
+            # Same circuit, quota and outcome recording as single calls (_call_provider)
+            health = get_provider_health('OpenRouter')
+            if not health.allow_request():
+                return [None] * len(chunk)
+            if not get_provider_quota('OpenRouter').acquire(sum(len(todo_texts[i]) for i in chunk)):
+                health.cancel_request()
+                return [None] * len(chunk)
+            try:
+                return _timed_provider_call(
+                    'OpenRouter', translate_batch_via_openrouter, [todo_texts[i] for i in chunk], source_lang, target_lang,
+                    span_name='provider.openrouter_batch',
+                )
+            except Exception as e:
+                logger.warning("OpenRouter batch error: %s", e)
+                return [None] * len(chunk)
+
+        chunks = _batch_chunks(todo_texts)
+        for chunk, translated in zip(chunks, map_concurrently(run_chunk, chunks)):
+            for i, value in zip(chunk, translated):
+                results[todo[i]] = value
+
+    failed = [idx for idx, value in enumerate(results) if value is None]
+    if failed:
+        logger.info("Batch translation fell back to single requests for %d segment(s)", len(failed))
+        for idx, value in zip(failed, translate_many([texts[idx] for idx in failed], source_lang, target_lang)):
+            results[idx] = value
+    return results
+
+
+def iter_translated_texts(texts: list[str], source_lang: str, target_lang: str, batch: bool = False):
+    """
+    Translate texts and yield (index, translation, cacheable) as each one completes.
+
+    Long texts (SEGMENT_MIN_CHARS) are split into sentences that are cached in
+    the translation memory individually, so an edit only retranslates the
+    sentences it touched. Segments keep their inline formatting through
+    preserve_formatting_for_translation and are rejoined with the original
+    whitespace and line breaks. Segments without anything to translate
+    (is_passthrough) are kept unchanged without a provider call. Valid
+    segment translations are remembered after the last text completes; the
+    caller commits. cacheable is False for a long text assembled with a
+    segment no provider could translate.
+    """
+    plans: dict[int, tuple[list[str], list[str], list[str]]] = {}  # idx -> (segments, separators, hashes)
+    for idx, text in enumerate(texts):
+        if should_segment(text):
+            segments, separators = split_segments(text)
+            if len(segments) > 1:
+                plans[idx] = (segments, separators, [sha256_text(seg) for seg in segments])
+
+    known = lookup_memory({h for _, _, hashes in plans.values() for h in hashes}, source_lang, target_lang)
+    jobs: list[tuple[int | str, str, dict]] = []  # (text idx or segment hash, provider input, formatting map)
+    waiting: dict[str, list[int]] = {}  # segment hash -> text indexes still missing it
+    missing: dict[int, int] = {}
+    incomplete: set[int] = set()
+    segment_sources: dict[str, str] = {}
+    for idx, text in enumerate(texts):
+        if idx not in plans:
+            jobs.append((idx, text, {}))
+            continue
+        segments, _, hashes = plans[idx]
+        for pos, (seg, shash) in enumerate(zip(segments, hashes)):
+            if shash in known:
+                continue
+            if is_passthrough(seg, final=pos == len(segments) - 1):
+                # Kept as is: a name or date is its own translation, not a failed one
+                known[shash] = MemoryEntry(seg)
+                continue
+            if shash not in segment_sources:
+                segment_sources[shash] = seg
+                protected, formatting_map = preserve_formatting_for_translation(seg)
+                jobs.append((shash, protected, formatting_map))
+            if idx not in waiting.setdefault(shash, []):
+                waiting[shash].append(idx)
+                missing[idx] = missing.get(idx, 0) + 1
+
+    known = {shash: entry.text for shash, entry in known.items()}
+
+    def assemble(idx: int) -> str:
+        segments, separators, hashes = plans[idx]
+        return join_segments([known[h] for h in hashes], separators)
+
+    # Fields whose sentences are all in the memory need no provider call
+    for idx in plans:
+        if not missing.get(idx):
+            yield idx, assemble(idx), True
+
+    inputs = [job_text for _, job_text, _ in jobs]
+    if batch:
+        completed = enumerate(translate_texts_batched(inputs, source_lang, target_lang))
+    else:
+        completed = iter_completed(lambda t: translate_text(t, source_lang, target_lang), inputs)
+
+    new_segments = {}
+    segment_quality = {}
+    for job_idx, translated in completed:
+        key, _, formatting_map = jobs[job_idx]
+        if isinstance(key, int):
+            yield key, translated, True
+            continue
+        translated = restore_formatting_after_translation(translated, formatting_map)
+        known[key] = translated
+        validation = validate_translation_quality(segment_sources[key], translated, source_lang, target_lang)
+        valid = not has_critical_issue(validation)
+        if valid:
+            new_segments[key] = translated
+            segment_quality[key] = validation
+        for idx in waiting[key]:
+            missing[idx] -= 1
+            if not valid:
+                incomplete.add(idx)
+            if not missing[idx]:
+                yield idx, assemble(idx), idx not in incomplete
+    remember_many(new_segments, source_lang, target_lang, segment_sources, segment_quality, VALIDATOR_VERSION)
+
+
 def translate_via_libretranslate(text: str, source_lang: str, target_lang: str) -> str | None:
-    """Try LibreTranslate public API (or custom URL via env). Returns None on failure."""
-    try:
-        import requests
-        url = os.getenv('LIBRETRANSLATE_URL', 'https://libretranslate.com/translate')
-        sl = (source_lang or 'DE').lower()
-        tl = (target_lang or 'FA').lower()
-        
-        # LibreTranslate language codes
-        lang_map = {
-            'de': 'de',
-            'fa': 'fa',
-            'en': 'en',
-            'fr': 'fr'
-        }
-        
-        source_code = lang_map.get(sl, sl)
-        target_code = lang_map.get(tl, tl)
-        
-        data = {
-            'q': text,
-            'source': source_code,
-            'target': target_code,
-            'format': 'text'
-        }
-        resp = requests.post(url, json=data, timeout=20)
-        resp.raise_for_status()
-        js = resp.json() or {}
-        t = (js.get('translatedText') or '').strip()
-        
-        # Validate that we got a translation (not the same text)
-        if t and t != text and len(t) > 0:
-            return t
-        return None
-    except Exception as e:
-        print(f"LibreTranslate error: {e}")
-        return None
+    """Try LibreTranslate public API (or custom URL via env).
+
+    Returns None when the result is the unchanged text; request and HTTP errors raise.
+    """
+    url = os.getenv('LIBRETRANSLATE_URL', 'https://libretranslate.com/translate')
+    sl = (source_lang or 'DE').lower()
+    tl = (target_lang or 'FA').lower()
+    
+    # LibreTranslate language codes
+    lang_map = {
+        'de': 'de',
+        'fa': 'fa',
+        'en': 'en',
+        'fr': 'fr'
+    }
+    
+    source_code = lang_map.get(sl, sl)
+    target_code = lang_map.get(tl, tl)
+    
+    data = {
+        'q': text,
+        'source': source_code,
+        'target': target_code,
+        'format': 'text'
+    }
+    resp = provider_post(url, 20, json=data)
+    resp.raise_for_status()
+    js = resp.json() or {}
+    t = (js.get('translatedText') or '').strip()
+    
+    # Validate that we got a translation (not the same text)
+    if t and t != text and len(t) > 0:
+        return t
+    return None
+
+
+# Built-in providers; TRANSLATION_PROVIDERS selects and orders them
+register_provider('Glossary', translate_via_glossary, local=True)
+register_provider('MyMemory', translate_via_mymemory)
+register_provider('LibreTranslate', translate_via_libretranslate)
+register_provider('OpenRouter', translate_via_openrouter)
 
 
 @translation_bp.route('/translate', methods=['POST', 'OPTIONS'])
 @cross_origin()  # ensure CORS headers even on errors
 def translate_plain_text():
+    """
+    Translate free text, e.g. a sentence highlighted by a student.
+
+    Single mode: {"text", "source_lang", "target_lang"} -> {"translated", "cached"}.
+    Batch mode: {"texts": [...]} -> {"translations": [...], "cached": [...]} in input order.
+    Translations are served from the translation memory when present; at most
+    TRANSLATE_MAX_ITEMS texts of TRANSLATE_MAX_CHARS characters each are accepted.
+    Only requests that need a provider are rate limited (TRANSLATE_PROVIDER_RATE_LIMIT
+    per client and minute), so memory hits stay cheap for many students behind one address.
+    """
     try:
         payload = request.get_json(silent=True) or {}
-        text = payload.get('text', '')
-        source_lang = payload.get('source_lang', 'DE')
-        target_lang = payload.get('target_lang', 'EN')
-        
-        print(f"Endpoint received: text='{text}', source_lang='{source_lang}', target_lang='{target_lang}'")
-        
-        translated = translate_text(text, source_lang, target_lang)
-        
-        print(f"Translation result: '{translated}'")
-        
-        return jsonify({ 'translated': translated })
+        source_lang = (payload.get('source_lang') or 'DE').upper()
+        target_lang = (payload.get('target_lang') or 'EN').upper()
+        batch = 'texts' in payload
+        texts = payload.get('texts') if batch else [payload.get('text', '')]
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return jsonify({'error': 'texts must be a list of strings'}), 400
+
+        max_items = int(os.getenv('TRANSLATE_MAX_ITEMS', '50'))
+        max_chars = int(os.getenv('TRANSLATE_MAX_CHARS', '5000'))
+        if len(texts) > max_items:
+            return jsonify({'error': f'At most {max_items} texts per request'}), 413
+        if any(len(text) > max_chars for text in texts):
+            return jsonify({'error': f'Texts are limited to {max_chars} characters'}), 413
+
+        lookup = lookup_free_texts(texts, source_lang, target_lang)
+        hashes, known = lookup
+        if any(h and h not in known for h in hashes):
+            limited = check_rate_limit(
+                'translate_provider', int(os.getenv('TRANSLATE_PROVIDER_RATE_LIMIT', '60')), window_seconds=60
+            )
+            if limited is not None:
+                return limited
+        translations, cached = translate_free_texts(texts, source_lang, target_lang, lookup)
+        if batch:
+            return jsonify({'translations': translations, 'cached': cached})
+        return jsonify({'translated': translations[0], 'cached': cached[0]})
     except Exception as e:
-        print(f"Translation endpoint error: {e}")
+        db.session.rollback()
+        logger.exception("Translation endpoint error: %s", e)
         return jsonify({ 'translated': '', 'error': str(e) })
 
 
-def iter_exam_text_fields(exam: Exam):
-    # Yields tuples: (path, value)
-    # Titles/texts/questions/statements and SA tasks are considered translatable
-    data = exam.to_dict()
+def lookup_free_texts(texts: list[str], source_lang: str, target_lang: str) -> tuple[list[str | None], dict[str, str]]:
+    """Return (hash per text, None for blank ones; {hash: translation} of those in the translation memory)."""
+    hashes = [sha256_text(text) if text and text.strip() else None for text in texts]
+    known = {
+        shash: entry.text
+        for shash, entry in lookup_memory({h for h in hashes if h}, source_lang, target_lang).items()
+    }
+    return hashes, known
+
+
+def translate_free_texts(texts: list[str], source_lang: str, target_lang: str,
+                         lookup: tuple[list[str | None], dict[str, str]] | None = None) -> tuple[list[str], list[bool]]:
+    """
+    Translate texts through the translation memory and return (translations, cached flags).
+
+    Hits in the in-process LRU need no database round trip. Each distinct
+    missing text is translated once and valid results are remembered.
+    lookup is the lookup_free_texts() result when the caller already has it.
+    """
+    hashes, known = lookup if lookup is not None else lookup_free_texts(texts, source_lang, target_lang)
+    known = dict(known)
+    cached = [h is None or h in known for h in hashes]
 
-    # Leseverstehen Teil 1
-    for idx, t in enumerate(data['leseverstehen_teil1'].get('titles', [])):
-        yield (f'leseverstehen_teil1.titles[{idx}]', t)
-    for idx, t in enumerate(data['leseverstehen_teil1'].get('texts', [])):
-        yield (f'leseverstehen_teil1.texts[{idx}]', t)
-
-    # Leseverstehen Teil 2
-    for idx, t in enumerate(data['leseverstehen_teil2'].get('texts', [])):
-        yield (f'leseverstehen_teil2.texts[{idx}]', t)
-    for q_idx, q in enumerate(data['leseverstehen_teil2'].get('questions', [])):
-        yield (f'leseverstehen_teil2.questions[{q_idx}].question', q.get('question', ''))
-        for o_idx, opt in enumerate(q.get('options', [])):
-            yield (f'leseverstehen_teil2.questions[{q_idx}].options[{o_idx}]', opt)
-
-    # Leseverstehen Teil 3
-    for idx, t in enumerate(data['leseverstehen_teil3'].get('situations', [])):
-        yield (f'leseverstehen_teil3.situations[{idx}]', t)
-    for idx, t in enumerate(data['leseverstehen_teil3'].get('ads', [])):
-        yield (f'leseverstehen_teil3.ads[{idx}]', t)
-
-    # Sprachbausteine
-    if data['sprachbausteine_teil1'].get('text'):
-        yield ('sprachbausteine_teil1.text', data['sprachbausteine_teil1']['text'])
-    if data['sprachbausteine_teil2'].get('text'):
-        yield ('sprachbausteine_teil2.text', data['sprachbausteine_teil2']['text'])
-
-    # Hörverstehen statements (not audio urls)
-    for teil in ['teil1', 'teil2', 'teil3']:
-        for idx, st in enumerate(data['hoerverstehen'].get(teil, {}).get('statements', [])):
-            yield (f'hoerverstehen.{teil}.statements[{idx}]', st)
-
-    # Schriftlicher Ausdruck
-    if data['schriftlicher_ausdruck'].get('task_a'):
-        yield ('schriftlicher_ausdruck.task_a', data['schriftlicher_ausdruck']['task_a'])
-    if data['schriftlicher_ausdruck'].get('task_b'):
-        yield ('schriftlicher_ausdruck.task_b', data['schriftlicher_ausdruck']['task_b'])
-
-
-def compute_exam_hash(exam: Exam) -> str:
+    sources = {h: text for h, text in zip(hashes, texts) if h and h not in known}
+    if sources:
+        missing = list(sources)
+        to_store = {}
+        quality = {}
+        for idx, translated, cacheable in iter_translated_texts([sources[h] for h in missing], source_lang, target_lang):
+            shash = missing[idx]
+            known[shash] = translated
+            validation = validate_translation_quality(sources[shash], translated, source_lang, target_lang)
+            if cacheable and not has_critical_issue(validation):
+                to_store[shash] = translated
+                quality[shash] = validation
+        remember_many(to_store, source_lang, target_lang, sources, quality, VALIDATOR_VERSION)
+        with span('db.commit'):
+            db.session.commit()
+
+    return [known[h] if h else text for h, text in zip(hashes, texts)], cached
+
+
+def iter_exam_text_fields(exam: Exam, data: dict | None = None):
+    """
+    Yield (path, value) for the translatable fields: titles, texts, questions,
+    statements and SA tasks. data is exam.to_dict() when the caller already has it.
+    """
+    if data is None:
+        data = exam.to_dict(shared=True)
+    for accessor, value in iter_exam_text_accessors(data):
+        yield accessor.path, value
+
+
+def exam_text_fields(exam: Exam, data: dict | None = None) -> dict[str, str]:
+    return {path: value or '' for path, value in iter_exam_text_fields(exam, data)}
+
+
+def compute_exam_hash(exam: Exam, data: dict | None = None) -> str:
     # Simplistic: hash of concatenated translatable fields
     parts = []
-    for _, value in iter_exam_text_fields(exam):
+    for _, value in iter_exam_text_fields(exam, data):
         parts.append(str(value))
     joined = '\n'.join(parts)
     return sha256_text(joined)
 
 
+# Snapshot sections that can be rebuilt independently, keyed by fingerprint name
+EXAM_SECTIONS = {
+    'lv1': 'leseverstehen_teil1',
+    'lv2': 'leseverstehen_teil2',
+    'lv3': 'leseverstehen_teil3',
+    'sb1': 'sprachbausteine_teil1',
+    'sb2': 'sprachbausteine_teil2',
+    'hv': 'hoerverstehen',
+    'sa': 'schriftlicher_ausdruck',
+}
+
+
+def compute_section_hashes(data: dict) -> dict[str, str]:
+    # Fingerprint each section's full content (texts, answers, audio urls)
+    return {
+        name: sha256_text(json.dumps(data.get(key), sort_keys=True, ensure_ascii=False))
+        for name, key in EXAM_SECTIONS.items()
+    }
+
+
+def use_batch_mode(payload: dict) -> bool:
+    # Request flag wins; otherwise fall back to TRANSLATION_BATCH_MODE
+    if 'batch' in payload:
+        return bool(payload.get('batch'))
+    return os.getenv('TRANSLATION_BATCH_MODE', 'false').lower() == 'true'
+
+
+def set_path(obj, path, value):
+    compile_path(path).set(obj, value)
+
+
+def lookup_cached_translations(exam_id: int, path_hashes: list[tuple[str, str]],
+                               source_lang: str, target_lang: str) -> dict[str, MemoryEntry]:
+    """
+    Resolve cached translations by source hash.
+    The translation memory is consulted first; path-keyed rows written before it
+    existed are used as a fallback and promoted into the memory (unvalidated).
+    """
+    cached = lookup_memory((shash for _, shash in path_hashes), source_lang, target_lang)
+    missing = [(path, shash) for path, shash in path_hashes if shash not in cached]
+    if missing:
+        legacy = lookup_legacy('exam', exam_id, missing, source_lang, target_lang)
+        remember_many(legacy, source_lang, target_lang)
+        cached.update((shash, MemoryEntry(text)) for shash, text in legacy.items())
+    return cached
+
+
+def store_translations(exam_id: int, translations: dict[str, str], paths_by_hash: dict[str, list[str]],
+                       source_lang: str, target_lang: str, sources: dict[str, str],
+                       quality: dict[str, dict] | None = None) -> None:
+    """
+    Save {source_hash: translation} in the memory and reference it from each exam path.
+    Both writes are single bulk upserts. The validation of each translation is
+    stored with it; quality holds results the caller already computed.
+    """
+    quality = dict(quality or {})
+    for shash, translated in translations.items():
+        if shash not in quality:
+            quality[shash] = validate_translation_quality(sources[shash], translated, source_lang, target_lang)
+    memory_ids = remember_many(translations, source_lang, target_lang, sources, quality, VALIDATOR_VERSION)
+    link_paths('exam', exam_id, [
+        (path, shash, memory_ids[shash])
+        for shash in translations
+        for path in paths_by_hash[shash]
+    ], source_lang, target_lang)
+
+
+def has_critical_issue(validation: dict) -> bool:
+    """Empty, untranslated, or (for FA) no Persian text at all."""
+    return not _CRITICAL_ISSUES.isdisjoint(validation['issues'])
+
+
+def cached_validation(shash: str, entry: MemoryEntry, source_text: str, source_lang: str, target_lang: str,
+                      upgrades: list[dict]) -> dict:
+    """
+    Validation of a cached translation without rerunning the validator.
+
+    The result stored with the memory row is trusted when it comes from the
+    current VALIDATOR_VERSION. Otherwise the row is validated now and the
+    result appended to upgrades for store_quality.
+    """
+    if entry.validator_version == VALIDATOR_VERSION and entry.score is not None:
+        return {
+            'valid': entry.score >= 70 and _CRITICAL_ISSUES.isdisjoint(entry.issues),
+            'score': entry.score,
+            'issues': entry.issues,
+        }
+    validation = validate_translation_quality(source_text, entry.text, source_lang, target_lang)
+    upgrades.append({
+        'source_hash': shash, 'source_lang': source_lang, 'target_lang': target_lang,
+        'source_text': source_text, 'translated_text': entry.text, 'validation': validation,
+    })
+    return validation
+
+
+def translate_exam_fields(exam_id: int, fields: list[tuple[str, str]], source_lang: str, target_lang: str,
+                          batch: bool = False, progress=None) -> dict[str, str]:
+    """
+    Translate (path, text) fields of an exam and return {path: translation}.
+
+    Cached translations are resolved first by content hash; the remaining
+    distinct texts are translated concurrently, once each, and the valid
+    results are stored in the translation memory.
+    With batch=True the missing texts are packed into batched OpenRouter
+    requests. progress, if given, is called as progress({path: translation}, total)
+    with the cached fields first and then as fields complete.
+    """
+    path_hashes = [(path, sha256_text(sv)) for path, sv in fields]
+    cached = lookup_cached_translations(exam_id, path_hashes, source_lang, target_lang)
+
+    translated_map = {}
+    pending: dict[str, str] = {}  # source_hash -> source text, translated once per request
+    pending_paths: dict[str, list[str]] = {}
+    upgrades: list[dict] = []
+    for (path, sv), (_, shash) in zip(fields, path_hashes):
+        entry = cached.get(shash)
+        if entry is not None:
+            if not has_critical_issue(cached_validation(shash, entry, sv, source_lang, target_lang, upgrades)):
+                translated_map[path] = entry.text
+                continue
+            # If a bad cached translation exists, drop it so we can refresh
+            forget(shash, source_lang, target_lang)
+            cached.pop(shash)
+        pending.setdefault(shash, sv)
+        pending_paths.setdefault(shash, []).append(path)
+    store_quality([u for u in upgrades if u['source_hash'] in cached], VALIDATOR_VERSION)
+
+    if progress:
+        progress(dict(translated_map), len(fields))
+
+    # Provider work runs on the translation pool; DB writes stay on this thread
+    hashes = list(pending)
+    texts = [pending[shash] for shash in hashes]
+    to_store = {}
+    quality = {}
+    for idx, translated, cacheable in iter_translated_texts(texts, source_lang, target_lang, batch):
+        shash = hashes[idx]
+        for path in pending_paths[shash]:
+            translated_map[path] = translated
+        # Only cache if translation is valid and different
+        validation = validate_translation_quality(pending[shash], translated, source_lang, target_lang)
+        if cacheable and not has_critical_issue(validation):
+            to_store[shash] = translated
+            quality[shash] = validation
+        if progress:
+            progress({path: translated for path in pending_paths[shash]}, len(fields))
+    store_translations(exam_id, to_store, pending_paths, source_lang, target_lang, pending, quality)
+
+    return translated_map
+
+
+def build_exam_translation(exam: Exam, source_lang: str, target_lang: str, batch: bool = False,
+                           previous: ExamTranslation | None = None,
+                           section_hashes: dict[str, str] | None = None,
+                           progress=None, data: dict | None = None) -> tuple[dict, dict[str, str]]:
+    """
+    Build the fully translated exam payload and its per-section fingerprints.
+
+    When a previous snapshot with section fingerprints is given, sections whose
+    fingerprint is unchanged are copied from it and only the other sections
+    are re-resolved through translate_exam_fields.
+    data (exam.to_dict()) is translated in place when given.
+    The caller is responsible for committing the session.
+    """
+    exam_id = exam.id
+    base = exam.to_dict() if data is None else data
+    accessors = list(iter_exam_text_accessors(base))
+    if section_hashes is None:
+        section_hashes = compute_section_hashes(base)
+
+    # Splice unchanged sections from the previous snapshot
+    reused = set()
+    if previous is not None and previous.section_hashes:
+        previous_hashes = json.loads(previous.section_hashes)
+        with span('serialize'):
+            previous_payload = json.loads(previous.payload)
+        for name, key in EXAM_SECTIONS.items():
+            if previous_hashes.get(name) == section_hashes[name] and key in previous_payload:
+                base[key] = previous_payload[key]
+                reused.add(key)
+
+    by_path = {accessor.path: accessor for accessor, _ in accessors if accessor.steps[0] not in reused}
+    fields = [(accessor.path, value or '') for accessor, value in accessors if accessor.path in by_path]
+    translated_map = translate_exam_fields(exam_id, fields, source_lang, target_lang, batch=batch, progress=progress)
+
+    # Build translated exam payload from original
+    for path, translated in translated_map.items():
+        by_path[path].set(base, translated)
+    return base, section_hashes
+
+
+def is_snapshot_current(existing: ExamTranslation | None, exam_hash: str, section_hashes: dict[str, str]) -> bool:
+    if not existing or existing.exam_hash != exam_hash:
+        return False
+    return not existing.section_hashes or json.loads(existing.section_hashes) == section_hashes
+
+
+def refresh_exam_translation(exam: Exam, source_lang: str, target_lang: str,
+                             batch: bool = False, progress=None) -> dict:
+    """
+    Return the translated payload for (exam, target_lang), rebuilding the
+    changed sections of the stored snapshot first if it is out of date.
+
+    The rebuild runs under a PostgreSQL advisory lock on (exam, target_lang):
+    workers that find the same stale snapshot wait for the first one and then
+    return the snapshot it stored instead of calling the providers again.
+    """
+    data = exam.to_dict()
+    with span('fingerprint'):
+        current_hash = compute_exam_hash(exam, data)
+        section_hashes = compute_section_hashes(data)
+    with span('db.snapshot'):
+        existing = ExamTranslation.query.filter_by(exam_id=exam.id, target_lang=target_lang).first()
+    if is_snapshot_current(existing, current_hash, section_hashes):
+        with span('serialize'):
+            return json.loads(existing.payload)
+
+    # End the read transaction so the re-check below sees rows committed while waiting
+    db.session.commit()
+    with advisory_lock('exam_translation', exam.id, target_lang):
+        with span('db.snapshot'):
+            existing = ExamTranslation.query.filter_by(
+                exam_id=exam.id, target_lang=target_lang
+            ).execution_options(populate_existing=True).first()
+        if is_snapshot_current(existing, current_hash, section_hashes):
+            with span('serialize'):
+                return json.loads(existing.payload)
+
+        # Otherwise rebuild the changed sections field by field with cache
+        base, section_hashes = build_exam_translation(
+            exam, source_lang, target_lang, batch=batch,
+            previous=existing, section_hashes=section_hashes, progress=progress, data=data
+        )
+
+        # Upsert full translation snapshot
+        with span('serialize'):
+            payload = json.dumps(base, ensure_ascii=False)
+        if existing:
+            existing.exam_hash = current_hash
+            existing.payload = payload
+            existing.section_hashes = json.dumps(section_hashes)
+        else:
+            existing = ExamTranslation(
+                exam_id=exam.id, target_lang=target_lang,
+                exam_hash=current_hash, payload=payload,
+                section_hashes=json.dumps(section_hashes)
+            )
+            db.session.add(existing)
+
+        with span('db.commit'):
+            db.session.commit()
+    return base
+
+
+def revalidate_translation_memory(limit: int = 500) -> int:
+    """
+    Revalidate up to limit memory rows scored by an older validator version.
+    Rows that no longer pass are removed. Returns how many rows were processed.
+    """
+    rows = stale_quality_rows(VALIDATOR_VERSION, limit)
+    updates = []
+    for row in rows:
+        validation = validate_translation_quality(row.source_text, row.translated_text, row.source_lang, row.target_lang)
+        if has_critical_issue(validation):
+            forget(row.source_hash, row.source_lang, row.target_lang)
+            continue
+        updates.append({
+            'source_hash': row.source_hash, 'source_lang': row.source_lang, 'target_lang': row.target_lang,
+            'source_text': None, 'translated_text': row.translated_text, 'validation': validation,
+        })
+    store_quality(updates, VALIDATOR_VERSION)
+    db.session.commit()
+    return len(rows)
+
+
+def warm_languages() -> list[str]:
+    # Languages kept pre-translated on every exam write, e.g. TRANSLATION_WARM_LANGS=FA,EN
+    return [lang.strip().upper() for lang in os.getenv('TRANSLATION_WARM_LANGS', '').split(',') if lang.strip()]
+
+
+def schedule_pretranslation(exam: Exam, old_fields: dict[str, str]) -> list[TranslationJob]:
+    """
+    Queue background translation of the fields that are new or changed
+    compared to old_fields, for every warm language.
+    """
+    languages = warm_languages()
+    if not languages:
+        return []
+    changed = [
+        path for path, text in exam_text_fields(exam).items()
+        if text.strip() and old_fields.get(path) != text
+    ]
+    return [enqueue_translation_job(exam.id, 'DE', lang, paths=changed) for lang in languages]
+
+
 @translation_bp.route('/exams/<int:exam_id>/translate', methods=['POST', 'OPTIONS'])
 @require_admin
 @rate_limit(limit=20, window_seconds=60)
@@ -475,105 +1161,42 @@ def translate_exam(exam_id: int):
     target_lang = payload.get('target_lang', 'EN').upper()
     source_lang = payload.get('source_lang', 'DE').upper()
 
-    # If full translation exists and up to date, return it
-    current_hash = compute_exam_hash(exam)
-    existing = ExamTranslation.query.filter_by(exam_id=exam_id, target_lang=target_lang).first()
-    if existing and existing.exam_hash == current_hash:
-        return jsonify({ 'exam_id': exam_id, 'target_lang': target_lang, 'payload': json.loads(existing.payload) })
-
-    # Otherwise translate field by field with cache
-    translated_map = {}
-    for path, value in iter_exam_text_fields(exam):
-        sv = value or ''
-        shash = sha256_text(sv)
-        cache = TranslationCache.query.filter_by(
-            resource_type='exam', resource_id=exam_id,
-            path=path, source_lang=source_lang, target_lang=target_lang,
-            source_hash=shash
-        ).first()
-        # Validate cached value: must differ from source, and for FA must contain Persian chars
-        def _is_valid(t: str) -> bool:
-            if not t:
-                return False
-            if t == sv:
-                return False
-            if target_lang.upper() == 'FA':
-                return bool(re.search(r'[\u0600-\u06FF]', t))
-            return True
-
-        if cache and _is_valid(cache.translated_text):
-            translated_map[path] = cache.translated_text
-        else:
-            # If bad cache exists, drop it so we can refresh
-            if cache and not _is_valid(cache.translated_text):
-                db.session.delete(cache)
-            translated = translate_text(sv, source_lang, target_lang)
-            translated_map[path] = translated
-            # Only cache if translation is valid and different
-            if _is_valid(translated):
-                db.session.add(TranslationCache(
-                    resource_type='exam', resource_id=exam_id,
-                    path=path, source_lang=source_lang, target_lang=target_lang,
-                    source_hash=shash, translated_text=translated
-                ))
-
-    # Build translated exam payload from original
-    base = exam.to_dict()
-
-    def set_path(obj, path, value):
-        # very small setter supporting patterns used above
-        parts = path.split('.')
-        ref = obj
-        for i, part in enumerate(parts):
-            if '[' in part and ']' in part:
-                # array index
-                key, idx = part.split('[')
-                idx = int(idx[:-1])
-                if i == len(parts) - 1:
-                    ref[key][idx] = value
-                else:
-                    ref = ref[key]
-            else:
-                if i == len(parts) - 1:
-                    ref[part] = value
-                else:
-                    ref = ref[part]
+    # Asynchronous mode: queue the work for a background worker unless the snapshot is current
+    if payload.get('async') or request.args.get('async') in ('1', 'true'):
+        existing = ExamTranslation.query.filter_by(exam_id=exam_id, target_lang=target_lang).first()
+        data = exam.to_dict(shared=True)
+        if is_snapshot_current(existing, compute_exam_hash(exam, data), compute_section_hashes(data)):
+            return jsonify({ 'exam_id': exam_id, 'target_lang': target_lang, 'payload': json.loads(existing.payload) })
+        job = enqueue_translation_job(exam_id, source_lang, target_lang, batch=use_batch_mode(payload))
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': f'/api/translation/jobs/{job.id}',
+        }), 202
 
-    for path, translated in translated_map.items():
-        set_path(base, path, translated)
+    # Whole-exam rebuilds queue behind interactive requests for the provider budget
+    with bulk_priority():
+        base = refresh_exam_translation(exam, source_lang, target_lang, batch=use_batch_mode(payload))
+    with span('serialize'):
+        return jsonify({ 'exam_id': exam_id, 'target_lang': target_lang, 'payload': base })
 
-    # Upsert full translation snapshot
-    if existing:
-        existing.exam_hash = current_hash
-        existing.payload = json.dumps(base, ensure_ascii=False)
-    else:
-        existing = ExamTranslation(
-            exam_id=exam_id, target_lang=target_lang,
-            exam_hash=current_hash, payload=json.dumps(base, ensure_ascii=False)
-        )
-        db.session.add(existing)
 
-    db.session.commit()
-    return jsonify({ 'exam_id': exam_id, 'target_lang': target_lang, 'payload': base })
+@translation_bp.route('/translation/jobs/<int:job_id>', methods=['GET'])
+@rate_limit(limit=120, window_seconds=60)
+def translation_job_status(job_id: int):
+    """Status, per-field progress and partial results of a background translation"""
+    job = TranslationJob.query.get_or_404(job_id)
+    include_results = request.args.get('results', '1') not in ('0', 'false')
+    return jsonify(job.to_dict(include_results=include_results))
 
 
 def get_path_value(obj, path: str):
-    parts = path.split('.')
-    ref = obj
-    for part in parts:
-        if '[' in part and ']' in part:
-            key, idx = part.split('[')
-            idx = int(idx[:-1])
-            ref = ref.get(key, [])
-            if idx < 0 or idx >= len(ref):
-                return None
-            ref = ref[idx]
-        else:
-            if isinstance(ref, dict):
-                ref = ref.get(part)
-            else:
-                return None
-    return ref
+    """Value at path in obj, or None when the path is missing or malformed."""
+    try:
+        accessor = compile_path(path)
+    except (TypeError, ValueError):
+        return None
+    return accessor.get(obj)
 
 
 @translation_bp.route('/exams/<int:exam_id>/translate_parts', methods=['POST', 'OPTIONS'])
@@ -581,14 +1204,80 @@ def get_path_value(obj, path: str):
 # @rate_limit(limit=30, window_seconds=60)  # Temporarily disabled for testing
 # @cross_origin()  # Temporarily disabled for testing
 def translate_exam_parts(exam_id: int):
-    exam = Exam.query.get_or_404(exam_id)
+    """
+    Translate selected exam paths.
+
+    Returns one JSON object by default. With "stream": true in the payload, or
+    an Accept header of application/x-ndjson or text/event-stream, results are
+    streamed instead: cached hits first, then each new translation as soon as
+    it completes, and quality_stats as the final event.
+    """
     payload = request.get_json(silent=True) or {}
     target_lang = payload.get('target_lang', 'FA').upper()
     source_lang = payload.get('source_lang', 'DE').upper()
     paths = payload.get('paths', [])
-    data = exam.to_dict()
+    # Only the requested fields are read, projected out of the JSONB columns
+    sources = project_exam_fields(exam_id, paths)
+    if sources is None:
+        abort(404)
+    events = iter_exam_part_translations(exam_id, sources, source_lang, target_lang, use_batch_mode(payload))
+
+    stream_format = requested_stream_format(payload)
+    if stream_format:
+        return stream_events(events, stream_format)
 
     result_map = {}
+    quality_stats = {}
+    for event in events:
+        if event['type'] == 'translation':
+            result_map[event['path']] = event['translation']
+        elif event['type'] == 'quality_stats':
+            quality_stats = event['quality_stats']
+    with span('serialize'):
+        return jsonify({
+            'translations': result_map,
+            'target_lang': target_lang,
+            'quality_stats': quality_stats
+        })
+
+
+def requested_stream_format(payload: dict) -> str | None:
+    """Return 'sse' or 'ndjson' when the client asked for a streamed response."""
+    accept = request.headers.get('Accept', '')
+    if 'text/event-stream' in accept:
+        return 'sse'
+    if 'application/x-ndjson' in accept or payload.get('stream'):
+        return 'ndjson'
+    return None
+
+
+def stream_events(events, stream_format: str) -> Response:
+    """Stream event dicts as NDJSON lines or server-sent events."""
+    def generate():
+        for event in events:
+            body = json.dumps(event, ensure_ascii=False)
+            if stream_format == 'sse':
+                yield f"event: {event['type']}\ndata: {body}\n\n"
+            else:
+                yield body + '\n'
+
+    mimetype = 'text/event-stream' if stream_format == 'sse' else 'application/x-ndjson'
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # don't let nginx buffer the stream
+    return response
+
+
+def iter_exam_part_translations(exam_id: int, sources: dict, source_lang: str, target_lang: str, batch: bool = False):
+    """
+    Yield translation events for exam paths; sources is {path: source value}
+    as returned by project_exam_fields().
+
+    Yields {'type': 'translation', 'path', 'translation', 'score', 'cached'}
+    for cached hits first and then for new translations in completion order,
+    followed by one {'type': 'quality_stats', ...} event. New translations are
+    stored and committed after the last one arrives.
+    """
     quality_stats = {
         'total_translations': 0,
         'high_quality': 0,  # score >= 90
@@ -598,105 +1287,127 @@ def translate_exam_parts(exam_id: int):
         'average_score': 0
     }
     total_score = 0
-    
-    for path in paths:
-        original = get_path_value(data, path)
+
+    def record_quality(path: str, score: int) -> None:
+        nonlocal total_score
+        total_score += score
+        if score >= 90:
+            quality_stats['high_quality'] += 1
+        elif score >= 70:
+            quality_stats['good_quality'] += 1
+        else:
+            quality_stats['poor_quality'] += 1
+            logger.info("Low quality translation for %s", path)
+
+    items = []  # (path, source_text, source_hash)
+    for path, original in sources.items():
         if original is None:
             continue
         text = str(original)
-        print(f"Translating path: {path}, text: {text[:50]}...")
-        quality_stats['total_translations'] += 1
-        
-        shash = sha256_text(text)
-        cache = TranslationCache.query.filter_by(
-            resource_type='exam', resource_id=exam_id,
-            path=path, source_lang=source_lang, target_lang=target_lang,
-            source_hash=shash
-        ).first()
-
-        if cache and cache.translated_text:
-            # Validate cached translation with enhanced quality check
-            validation = validate_translation_quality(text, cache.translated_text, source_lang, target_lang)
+        items.append((path, text, sha256_text(text)))
+    quality_stats['total_translations'] = len(items)
+
+    cached = lookup_cached_translations(exam_id, [(path, shash) for path, _, shash in items], source_lang, target_lang)
+    pending: dict[str, str] = {}  # source_hash -> source text, translated once per request
+    pending_paths: dict[str, list[str]] = {}
+    upgrades: list[dict] = []
+
+    for path, text, shash in items:
+        entry = cached.get(shash)
+        if entry is not None and entry.text:
+            # The score stored with the translation is reused; only unscored rows are validated here
+            validation = cached_validation(shash, entry, text, source_lang, target_lang, upgrades)
             
             if validation['valid']:
-                result_map[path] = cache.translated_text
                 quality_stats['cached_translations'] += 1
-                total_score += validation['score']
-                
-                if validation['score'] >= 90:
-                    quality_stats['high_quality'] += 1
-                elif validation['score'] >= 70:
-                    quality_stats['good_quality'] += 1
-                else:
-                    quality_stats['poor_quality'] += 1
-                    
-                print(f"Using cached translation for {path} (quality: {validation['score']}/100)")
-            else:
-                # Remove invalid cached translation
-                print(f"Removing invalid cached translation for {path}: {validation['issues']}")
-                db.session.delete(cache)
-                cache = None
-        
-        if not cache or not cache.translated_text:
-            # Generate new translation with quality validation
-            print(f"Generating new professional translation for {path}...")
-            translated = translate_text(text, source_lang, target_lang)
-            
-            # Validate the new translation
-            validation = validate_translation_quality(text, translated, source_lang, target_lang)
-            total_score += validation['score']
-            
-            print(f"Translation quality for {path}: {validation['score']}/100")
-            if validation['issues']:
-                print(f"Quality issues detected: {validation['issues']}")
-            
-            if validation['score'] >= 90:
-                quality_stats['high_quality'] += 1
-            elif validation['score'] >= 70:
-                quality_stats['good_quality'] += 1
-            else:
-                quality_stats['poor_quality'] += 1
-                print(f"Warning: Low quality translation for {path}")
-            
-            result_map[path] = translated
-            print(f"New translation for {path}: {translated[:50]}...")
-            
-            # Cache only if quality is acceptable
-            if validation['valid']:
-                db.session.add(TranslationCache(
-                    resource_type='exam', resource_id=exam_id,
-                    path=path, source_lang=source_lang, target_lang=target_lang,
-                    source_hash=shash, translated_text=translated
-                ))
-            else:
-                print(f"Not caching low-quality translation for {path}")
-    
+                record_quality(path, validation['score'])
+                yield {'type': 'translation', 'path': path, 'translation': entry.text,
+                       'score': validation['score'], 'cached': True}
+                continue
+
+            # Remove invalid cached translation
+            logger.info("Removing invalid cached translation for %s: %s", path, validation['issues'])
+            forget(shash, source_lang, target_lang)
+            cached.pop(shash)
+
+        pending.setdefault(shash, text)
+        pending_paths.setdefault(shash, []).append(path)
+    store_quality([u for u in upgrades if u['source_hash'] in cached], VALIDATOR_VERSION)
+
+    # Generate each missing text once, concurrently, and validate each result as it arrives
+    hashes = list(pending)
+    texts = [pending[shash] for shash in hashes]
+    to_store = {}
+    quality = {}
+    for idx, translated, cacheable in iter_translated_texts(texts, source_lang, target_lang, batch):
+        shash = hashes[idx]
+        # Validate the new translation
+        validation = validate_translation_quality(pending[shash], translated, source_lang, target_lang)
+        # Cache only if quality is acceptable
+        if validation['valid'] and cacheable:
+            to_store[shash] = translated
+            quality[shash] = validation
+        else:
+            logger.info("Not caching low-quality translation for %s: %s", pending_paths[shash], validation['issues'])
+
+        for path in pending_paths[shash]:
+            record_quality(path, validation['score'])
+            yield {'type': 'translation', 'path': path, 'translation': translated,
+                   'score': validation['score'], 'cached': False}
+    store_translations(exam_id, to_store, pending_paths, source_lang, target_lang, pending, quality)
+    with span('db.commit'):
+        db.session.commit()
+
     # Calculate average quality score
     if quality_stats['total_translations'] > 0:
         quality_stats['average_score'] = round(total_score / quality_stats['total_translations'], 1)
-    
-    db.session.commit()
-    print(f"Translation quality summary: {quality_stats}")
-    print(f"Final result: {result_map}")
-    
-    return jsonify({ 
-        'translations': result_map, 
-        'target_lang': target_lang,
-        'quality_stats': quality_stats
+    logger.debug("Translation quality summary: %s", quality_stats)
+
+    yield {'type': 'quality_stats', 'target_lang': target_lang, 'quality_stats': quality_stats}
+
+
+@translation_bp.route('/translation/providers', methods=['GET'])
+@require_admin
+@rate_limit(limit=60, window_seconds=60)
+def provider_health_endpoint():
+    """Circuit breaker state, latency, error rate and remaining quota of each translation provider"""
+    quotas = [get_provider_quota(provider.name).snapshot() for provider in configured_providers() if not provider.local]
+    return jsonify({'providers': health_snapshot(), 'quotas': quotas})
+
+
+@translation_bp.route('/translation/cache/stats', methods=['GET'])
+@require_admin
+@rate_limit(limit=60, window_seconds=60)
+def translation_cache_stats_endpoint():
+    """Hit, miss and eviction counters of the in-process translation cache"""
+    return jsonify({
+        'memory_lru': translation_lru.stats(), 'glossary': glossary_stats(), 'in_flight': _in_flight.stats(),
     })
 
 
+@translation_bp.route('/translation/validate', methods=['POST'])
 @translation_bp.route('/api/translation/validate', methods=['POST'])
 # @require_admin  # Temporarily disabled for testing
 # @rate_limit(limit=30, window_seconds=60)  # Temporarily disabled for testing
 def validate_translation_endpoint():
-    """Endpoint to validate translation quality"""
+    """
+    Endpoint to validate translation quality.
+
+    Batch mode: {"items": [{"original", "translated", "source_lang"?, "target_lang"?}, ...]}
+    validates up to TRANSLATION_VALIDATE_MAX_ITEMS pairs and returns one
+    result per item plus a summary; top-level source_lang/target_lang are the
+    defaults for every item.
+    """
     try:
         data = request.get_json()
-        original = data.get('original', '')
-        translated = data.get('translated', '')
         source_lang = data.get('source_lang', 'DE').upper()
         target_lang = data.get('target_lang', 'FA').upper()
+
+        if 'items' in data:
+            return validate_translation_batch(data['items'], source_lang, target_lang)
+
+        original = data.get('original', '')
+        translated = data.get('translated', '')
         
         if not original or not translated:
             return jsonify({'error': 'Original and translated text required'}), 400
@@ -706,41 +1417,91 @@ def validate_translation_endpoint():
         return jsonify(validation)
         
     except Exception as e:
-        print(f"Validation error: {e}")
+        logger.exception("Validation error: %s", e)
         return jsonify({'error': str(e)}), 500
 
+
+def validate_translation_batch(items: list, source_lang: str, target_lang: str):
+    max_items = int(os.getenv('TRANSLATION_VALIDATE_MAX_ITEMS', '10000'))
+    if not isinstance(items, list):
+        return jsonify({'error': 'items must be a list'}), 400
+    if len(items) > max_items:
+        return jsonify({'error': f'At most {max_items} items per request'}), 413
+
+    results = []
+    valid_count = 0
+    total_score = 0
+    for item in items:
+        item = item if isinstance(item, dict) else {}
+        original = item.get('original', '')
+        translated = item.get('translated', '')
+        if not original or not translated:
+            results.append({'error': 'Original and translated text required'})
+            continue
+        if not isinstance(original, str) or not isinstance(translated, str):
+            results.append({'error': 'Original and translated text must be strings'})
+            continue
+        item_source_lang = item.get('source_lang') or source_lang
+        item_target_lang = item.get('target_lang') or target_lang
+        if not isinstance(item_source_lang, str) or not isinstance(item_target_lang, str):
+            results.append({'error': 'source_lang and target_lang must be strings'})
+            continue
+        validation = validate_translation_quality(
+            original, translated, item_source_lang.upper(), item_target_lang.upper(),
+        )
+        valid_count += validation['valid']
+        total_score += validation['score']
+        results.append(validation)
+
+    checked = len(results) - sum(1 for result in results if 'error' in result)
+    return jsonify({
+        'results': results,
+        'summary': {
+            'total': len(items),
+            'checked': checked,
+            'valid': valid_count,
+            'invalid': checked - valid_count,
+            'average_score': round(total_score / checked, 1) if checked else 0,
+        }
+    })
+
+
 def _test_translate_exam_parts(exam_id: int, paths: list, source_lang: str = 'DE', target_lang: str = 'FA'):
     """Test function for translate_exam_parts without request context"""
-    exam = Exam.query.get_or_404(exam_id)
-    data = exam.to_dict()
+    sources = project_exam_fields(exam_id, paths)
+    if sources is None:
+        abort(404)
 
     result_map = {}
-    for path in paths:
-        original = get_path_value(data, path)
+    items = []  # (path, source_text, source_hash)
+    for path, original in sources.items():
         if original is None:
             continue
         text = str(original)
-        print(f"Translating path: {path}, text: {text[:50]}...")  # Debug
-        shash = sha256_text(text)
-        cache = TranslationCache.query.filter_by(
-            resource_type='exam', resource_id=exam_id,
-            path=path, source_lang=source_lang, target_lang=target_lang,
-            source_hash=shash
-        ).first()
-        if cache:
-            result_map[path] = cache.translated_text
-            print(f"Using cached translation for {path}")  # Debug
+        logger.debug("Translating path: %s, text: %.50s...", path, text)
+        items.append((path, text, sha256_text(text)))
+
+    cached = lookup_cached_translations(exam_id, [(path, shash) for path, _, shash in items], source_lang, target_lang)
+    pending: dict[str, str] = {}
+    pending_paths: dict[str, list[str]] = {}
+    for path, text, shash in items:
+        if shash in cached:
+            result_map[path] = cached[shash].text
+            logger.debug("Using cached translation for %s", path)
         else:
-            translated = translate_text(text, source_lang, target_lang)
+            pending.setdefault(shash, text)
+            pending_paths.setdefault(shash, []).append(path)
+
+    hashes = list(pending)
+    to_store = {}
+    for shash, translated in zip(hashes, translate_many([pending[shash] for shash in hashes], source_lang, target_lang)):
+        for path in pending_paths[shash]:
             result_map[path] = translated
-            print(f"New translation for {path}: {translated[:50]}...")  # Debug
-            db.session.add(TranslationCache(
-                resource_type='exam', resource_id=exam_id,
-                path=path, source_lang=source_lang, target_lang=target_lang,
-                source_hash=shash, translated_text=translated
-            ))
+            logger.debug("New translation for %s: %.50s...", path, translated)
+        to_store[shash] = translated
+    store_translations(exam_id, to_store, pending_paths, source_lang, target_lang, pending)
     db.session.commit()
-    print(f"Final result: {result_map}")  # Debug
+    logger.debug("Final result: %s", result_map)
     return result_map
 
 
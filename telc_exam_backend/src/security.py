@@ -20,6 +20,39 @@ def _make_key(limit_key: str) -> str:
     return f"{client_ip}:{limit_key}"
 
 
+def check_rate_limit(limit_key: str, limit: int, window_seconds: int):
+    """Count one request for the client under limit_key.
+
+    Returns a 429 response when the client is over limit in the window, None
+    otherwise. For limits that only apply to some requests of an endpoint.
+    """
+    # Allow turning off via env for dev or behind proper gateways
+    if os.getenv("RATE_LIMIT_DISABLED", "false").lower() == "true":
+        return None
+
+    key = _make_key(limit_key)
+    with _rate_lock:
+        now = _now()
+        bucket = _rate_store.get(key, [])
+        # purge old
+        threshold = now - window_seconds
+        bucket = [t for t in bucket if t > threshold]
+        if len(bucket) >= limit:
+            retry_after = max(1, int(bucket[0] + window_seconds - now))
+            return (
+                jsonify({
+                    "error": "rate_limited",
+                    "message": "Too many requests. Please slow down.",
+                    "retry_after": retry_after,
+                }),
+                429,
+                {"Retry-After": str(retry_after)},
+            )
+        bucket.append(now)
+        _rate_store[key] = bucket
+    return None
+
+
 def rate_limit(limit: int = 60, window_seconds: int = 60, key_func: Callable[[], str] | None = None):
     """Very small in-memory rate limiter (best-effort, single-process only).
 
@@ -31,33 +64,10 @@ def rate_limit(limit: int = 60, window_seconds: int = 60, key_func: Callable[[],
     def decorator(func: Callable[..., Any]):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Allow turning off via env for dev or behind proper gateways
-            if os.getenv("RATE_LIMIT_DISABLED", "false").lower() == "true":
-                return func(*args, **kwargs)
-
             kf = key_func or (lambda: request.endpoint or request.path)
-            key = _make_key(kf())
-
-            with _rate_lock:
-                now = _now()
-                bucket = _rate_store.get(key, [])
-                # purge old
-                threshold = now - window_seconds
-                bucket = [t for t in bucket if t > threshold]
-                if len(bucket) >= limit:
-                    retry_after = max(1, int(bucket[0] + window_seconds - now))
-                    return (
-                        jsonify({
-                            "error": "rate_limited",
-                            "message": "Too many requests. Please slow down.",
-                            "retry_after": retry_after,
-                        }),
-                        429,
-                        {"Retry-After": str(retry_after)},
-                    )
-                bucket.append(now)
-                _rate_store[key] = bucket
-
+            limited = check_rate_limit(kf(), limit, window_seconds)
+            if limited is not None:
+                return limited
             return func(*args, **kwargs)
 
         return wrapper
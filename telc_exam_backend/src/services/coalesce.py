@@ -0,0 +1,105 @@
+import os
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import func, select
+
+from src.models.user import db
+from src.services.tracing import span
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution.
+
+    The first caller for a key runs func; callers arriving while it is in
+    flight wait for it and get the same result (or exception). Nothing is
+    cached once the call returns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if not leader:
+            with span('coalesce_wait'):
+                call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'in_flight': len(self._calls), 'executed': self.executed, 'shared': self.shared}
+
+
+def advisory_key(*parts: Any) -> int:
+    """Stable signed 64-bit key for pg_advisory_lock built from parts."""
+    digest = hashlib.blake2b(':'.join(str(p) for p in parts).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+@contextmanager
+def advisory_lock(*parts: Any, timeout: float | None = None):
+    """Hold a PostgreSQL session advisory lock for the duration of the block.
+
+    The lock lives on a dedicated connection, so commits made by the caller's
+    session inside the block do not release it, and it is dropped by the
+    server if the process dies. Waits up to timeout seconds
+    (TRANSLATION_REBUILD_LOCK_TIMEOUT, default 120) and then gives up, so a
+    stuck holder costs duplicate work rather than a failed request. Yields
+    True when the lock was acquired and False after a timeout.
+    """
+    if timeout is None:
+        timeout = float(os.getenv('TRANSLATION_REBUILD_LOCK_TIMEOUT', '120'))
+    key = advisory_key(*parts)
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    with db.engine.connect() as conn:
+        acquired = False
+        try:
+            with span('lock_wait'):
+                while True:
+                    acquired = conn.execute(select(func.pg_try_advisory_lock(key))).scalar()
+                    conn.commit()
+                    if acquired or time.monotonic() >= deadline:
+                        break
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.5)
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(select(func.pg_advisory_unlock(key)))
+                conn.commit()
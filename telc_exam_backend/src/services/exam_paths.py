@@ -0,0 +1,118 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterator
+
+
+_TOKEN = re.compile(r'([^.\[\]]+)|\[(\d+)\]')
+
+
+class CompiledPath:
+    """Accessor for a field path such as 'leseverstehen_teil2.questions[3].options[1]'.
+
+    steps holds the parsed dict keys (str) and list indexes (int), so get and
+    set walk the payload without looking at the string again.
+    """
+    __slots__ = ('path', 'steps')
+
+    def __init__(self, path: str, steps: tuple):
+        self.path = path
+        self.steps = steps
+
+    def get(self, obj: Any) -> Any:
+        """Value at the path, or None when any step is missing."""
+        ref = obj
+        for step in self.steps:
+            if isinstance(step, int):
+                if not isinstance(ref, list) or step >= len(ref):
+                    return None
+                ref = ref[step]
+            elif isinstance(ref, dict):
+                ref = ref.get(step)
+            else:
+                return None
+        return ref
+
+    def set(self, obj: Any, value: Any) -> None:
+        """Assign value at the path; intermediate containers must already exist."""
+        ref = obj
+        for step in self.steps[:-1]:
+            ref = ref[step]
+        ref[self.steps[-1]] = value
+
+    def __repr__(self) -> str:
+        return f'CompiledPath({self.path!r})'
+
+
+@lru_cache(maxsize=8192)
+def path_accessor(*steps) -> CompiledPath:
+    """Memoized accessor for the given steps; the path string is built once."""
+    parts = []
+    for step in steps:
+        if isinstance(step, int):
+            parts.append(f'[{step}]')
+        else:
+            parts.append(f'.{step}' if parts else step)
+    return CompiledPath(''.join(parts), steps)
+
+
+@lru_cache(maxsize=8192)
+def compile_path(path: str) -> CompiledPath:
+    """Parse a dotted/indexed path once and return its memoized accessor.
+
+    Raises ValueError for paths that are not made of keys and [index] steps.
+    """
+    steps = []
+    pos = 0
+    for match in _TOKEN.finditer(path):
+        gap = path[pos:match.start()]
+        key, index = match.groups()
+        # Keys follow a '.' (except the first one); indexes follow their key directly
+        expected = ('.' if steps else '') if index is None else ('' if steps else None)
+        if gap != expected:
+            break
+        steps.append(int(index) if index is not None else key)
+        pos = match.end()
+    if not steps or pos != len(path):
+        raise ValueError(f'Invalid field path: {path!r}')
+    return path_accessor(*steps)
+
+
+def iter_exam_text_accessors(data: dict) -> Iterator[tuple[CompiledPath, Any]]:
+    """Yield (accessor, value) for every translatable field of an exam payload (Exam.to_dict())."""
+    # Leseverstehen Teil 1
+    lv1 = data['leseverstehen_teil1']
+    for idx, t in enumerate(lv1.get('titles', [])):
+        yield path_accessor('leseverstehen_teil1', 'titles', idx), t
+    for idx, t in enumerate(lv1.get('texts', [])):
+        yield path_accessor('leseverstehen_teil1', 'texts', idx), t
+
+    # Leseverstehen Teil 2
+    lv2 = data['leseverstehen_teil2']
+    for idx, t in enumerate(lv2.get('texts', [])):
+        yield path_accessor('leseverstehen_teil2', 'texts', idx), t
+    for q_idx, q in enumerate(lv2.get('questions', [])):
+        yield path_accessor('leseverstehen_teil2', 'questions', q_idx, 'question'), q.get('question', '')
+        for o_idx, opt in enumerate(q.get('options', [])):
+            yield path_accessor('leseverstehen_teil2', 'questions', q_idx, 'options', o_idx), opt
+
+    # Leseverstehen Teil 3
+    lv3 = data['leseverstehen_teil3']
+    for idx, t in enumerate(lv3.get('situations', [])):
+        yield path_accessor('leseverstehen_teil3', 'situations', idx), t
+    for idx, t in enumerate(lv3.get('ads', [])):
+        yield path_accessor('leseverstehen_teil3', 'ads', idx), t
+
+    # Sprachbausteine
+    for section in ('sprachbausteine_teil1', 'sprachbausteine_teil2'):
+        if data[section].get('text'):
+            yield path_accessor(section, 'text'), data[section]['text']
+
+    # Hörverstehen statements (not audio urls)
+    for teil in ('teil1', 'teil2', 'teil3'):
+        for idx, st in enumerate(data['hoerverstehen'].get(teil, {}).get('statements', [])):
+            yield path_accessor('hoerverstehen', teil, 'statements', idx), st
+
+    # Schriftlicher Ausdruck
+    for task in ('task_a', 'task_b'):
+        if data['schriftlicher_ausdruck'].get(task):
+            yield path_accessor('schriftlicher_ausdruck', task), data['schriftlicher_ausdruck'][task]
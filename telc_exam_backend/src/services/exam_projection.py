@@ -0,0 +1,117 @@
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.models.user import db
+from src.models.exam import Exam
+from src.services.exam_paths import compile_path, path_accessor
+from src.services.tracing import traced
+
+
+# Leading payload keys (Exam.to_dict, v1 sections and flat keys) -> exam column
+_SECTION_COLUMNS = {
+    ('leseverstehen_teil1', 'titles'): 'lv1_titles',
+    ('leseverstehen_teil1', 'texts'): 'lv1_texts',
+    ('leseverstehen_teil1', 'answers'): 'lv1_answers',
+    ('leseverstehen_teil2', 'texts'): 'lv2_texts',
+    ('leseverstehen_teil2', 'questions'): 'lv2_questions',
+    ('leseverstehen_teil3', 'situations'): 'lv3_situations',
+    ('leseverstehen_teil3', 'ads'): 'lv3_ads',
+    ('sprachbausteine_teil1', 'text'): 'sb1_text',
+    ('sprachbausteine_teil1', 'options'): 'sb1_options',
+    ('sprachbausteine_teil1', 'answers'): 'sb1_answers',
+    ('sprachbausteine_teil2', 'text'): 'sb2_text',
+    ('sprachbausteine_teil2', 'words'): 'sb2_words',
+    ('sprachbausteine_teil2', 'answers'): 'sb2_answers',
+    ('schriftlicher_ausdruck', 'task_a'): 'sa_task_a',
+    ('schriftlicher_ausdruck', 'task_b'): 'sa_task_b',
+    **{
+        ('hoerverstehen', f'teil{n}', field): f'hv{n}_{field}'
+        for n in (1, 2, 3) for field in ('audio_url', 'statements', 'answers')
+    },
+}
+_FLAT_COLUMNS = {
+    'title': 'title',
+    'lv1_titles': 'lv1_titles', 'lv1_texts': 'lv1_texts', 'lv1_answers': 'lv1_answers',
+    'lv2_texts': 'lv2_texts', 'lv2_questions': 'lv2_questions',
+    'lv3_situations': 'lv3_situations', 'lv3_ads': 'lv3_ads',
+    'sb1_text': 'sb1_text', 'sb1_words': 'sb1_options', 'sb1_answers': 'sb1_answers',
+    'sb2_text': 'sb2_text', 'sb2_options': 'sb2_words', 'sb2_answers': 'sb2_answers',
+}
+_JSON_COLUMNS = frozenset(column.name for column in Exam.__table__.columns if isinstance(column.type, JSONB))
+ANSWER_COLUMNS = ('lv1_answers', 'lv2_answers', 'lv3_answers', 'sb1_answers', 'sb2_answers',
+                  'hv1_answers', 'hv2_answers', 'hv3_answers')
+
+# One SELECT carries at most this many projections (PostgreSQL allows 1664 target columns);
+# larger requests fetch the whole columns and walk them in Python
+MAX_PROJECTIONS = 500
+
+
+def column_path(path: str) -> tuple[str, tuple] | None:
+    """(exam column, steps inside its JSON value) for a payload path, or None if no column holds it."""
+    try:
+        steps = compile_path(path).steps
+    except (TypeError, ValueError):
+        return None
+    for size in (3, 2):
+        column = _SECTION_COLUMNS.get(steps[:size])
+        if column is not None:
+            break
+    else:
+        size, column = 1, _FLAT_COLUMNS.get(steps[0])
+    if column is None:
+        return None
+    rest = steps[size:]
+    if rest and column not in _JSON_COLUMNS:
+        return None
+    return column, rest
+
+
+def _projection(column: str, rest: tuple):
+    expr = getattr(Exam, column)
+    # jsonb #> '{3,options,1}'; array indexes are given as text like object keys
+    return expr[tuple(str(step) for step in rest)] if rest else expr
+
+
+@traced('db.projection')
+def project_exam_fields(exam_id: int, paths: Iterable[str]) -> dict[str, Any] | None:
+    """
+    Fetch only the given payload paths of an exam, e.g. 'hoerverstehen.teil1.statements[2]'.
+
+    Each path becomes a jsonb #> projection in one SELECT, so neither the
+    unrelated columns nor the rest of a JSON array leave the database.
+    Returns {path: value} with None for paths that do not exist, or None
+    when the exam itself does not exist.
+    """
+    resolved = {}
+    for path in dict.fromkeys(paths):
+        resolved[path] = column_path(path)
+    targets = list(dict.fromkeys(target for target in resolved.values() if target is not None))
+
+    if len(targets) > MAX_PROJECTIONS:
+        columns = list(dict.fromkeys(column for column, _ in targets))
+        row = db.session.execute(select(*(getattr(Exam, c) for c in columns)).where(Exam.id == exam_id)).first()
+        if row is None:
+            return None
+        values = dict(zip(columns, row))
+        found = {(column, rest): path_accessor(*rest).get(values[column]) if rest else values[column]
+                 for column, rest in targets}
+    else:
+        exprs = [_projection(column, rest) for column, rest in targets]
+        row = db.session.execute(select(Exam.id, *exprs).where(Exam.id == exam_id)).first()
+        if row is None:
+            return None
+        found = dict(zip(targets, row[1:]))
+    return {path: found.get(target) if target is not None else None for path, target in resolved.items()}
+
+
+@traced('db.projection')
+def exam_answers(exam_id: int) -> dict[str, list] | None:
+    """The answer key of an exam ({'lv1_answers': [...], ...}) without loading its texts; None if missing."""
+    row = db.session.execute(
+        select(*(getattr(Exam, column) for column in ANSWER_COLUMNS)).where(Exam.id == exam_id)
+    ).first()
+    if row is None:
+        return None
+    return {column: value or [] for column, value in zip(ANSWER_COLUMNS, row)}
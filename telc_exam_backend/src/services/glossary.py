@@ -0,0 +1,138 @@
+import os
+import time
+import logging
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.user import db
+from src.models.translation import GlossaryEntry, GlossaryState
+from src.services.memory_cache import translation_lru
+
+
+# Trailing punctuation is not part of the lookup key and is carried over to the translation
+_TRAILING_PUNCTUATION = '.!?:;,'
+_TARGET_PUNCTUATION = {'FA': {'?': '؟', ',': '،', ';': '؛'}}
+
+logger = logging.getLogger(__name__)
+
+_index_lock = threading.Lock()
+_index: dict[tuple[str, str], dict[str, str]] | None = None
+_loaded_at = 0.0
+# Last glossary_state.generation this process has seen
+_generation: int | None = None
+_generation_checked_at = 0.0
+
+
+def normalize_term(text: str) -> str:
+    """Lookup key: collapsed whitespace, case-folded, without trailing punctuation."""
+    return ' '.join(text.split()).rstrip(_TRAILING_PUNCTUATION).rstrip().casefold()
+
+
+def spelling_variants(text: str) -> list[str]:
+    """Common exact spellings of a term (case variants, each bare or with one trailing punctuation mark)."""
+    base = text.rstrip(_TRAILING_PUNCTUATION).strip()
+    spellings = {base, base.lower(), base.upper(), base.capitalize(), base[:1].lower() + base[1:]}
+    return sorted(spelling + ending for spelling in spellings for ending in ('', *_TRAILING_PUNCTUATION))
+
+
+def _load_index() -> dict[tuple[str, str], dict[str, str]]:
+    # Uses its own connection so it is safe to call from translation pool threads
+    index: dict[tuple[str, str], dict[str, str]] = {}
+    with db.engine.connect() as conn:
+        rows = conn.execute(select(
+            GlossaryEntry.source_lang, GlossaryEntry.target_lang,
+            GlossaryEntry.normalized_source, GlossaryEntry.translated_text,
+        ))
+        for source_lang, target_lang, key, translated in rows:
+            index.setdefault((source_lang.upper(), target_lang.upper()), {})[key] = translated
+    return index
+
+
+def get_index() -> dict[tuple[str, str], dict[str, str]]:
+    """The in-memory glossary, reloaded every GLOSSARY_RELOAD_SECONDS (default 60)."""
+    global _index, _loaded_at
+    reload_seconds = float(os.getenv('GLOSSARY_RELOAD_SECONDS', '60'))
+    if _index is None or time.monotonic() - _loaded_at > reload_seconds:
+        with _index_lock:
+            if _index is None or time.monotonic() - _loaded_at > reload_seconds:
+                _index = _load_index()
+                _loaded_at = time.monotonic()
+    return _index
+
+
+def invalidate_glossary() -> None:
+    """Drop the in-memory index so the next lookup reloads it (called after admin edits)."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def bump_glossary_generation() -> None:
+    """Count a glossary edit in the caller's transaction so other processes notice it."""
+    stmt = insert(GlossaryState).values(id=1, generation=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_={'generation': GlossaryState.generation + 1, 'updated_at': db.func.now()},
+    )
+    db.session.execute(stmt)
+
+
+def sync_glossary_generation() -> None:
+    """
+    Pick up glossary edits made by other processes.
+
+    At most every GLOSSARY_RELOAD_SECONDS the stored generation is compared
+    with the last one seen here. When it changed, the glossary index and the
+    translation LRU are dropped, since the LRU may still hold translations
+    the edit removed from the translation memory.
+    """
+    global _index, _generation, _generation_checked_at
+    reload_seconds = float(os.getenv('GLOSSARY_RELOAD_SECONDS', '60'))
+    if time.monotonic() - _generation_checked_at <= reload_seconds:
+        return
+    with _index_lock:
+        if time.monotonic() - _generation_checked_at <= reload_seconds:
+            return
+        _generation_checked_at = time.monotonic()
+        try:
+            with db.engine.connect() as conn:
+                generation = conn.execute(select(GlossaryState.generation).where(GlossaryState.id == 1)).scalar() or 0
+        except Exception as e:
+            logger.warning("Glossary generation unavailable: %s", e)
+            return
+        if _generation is not None and generation != _generation:
+            _index = None
+            translation_lru.clear()
+            logger.info("Glossary changed (generation %s), cleared the translation LRU", generation)
+        _generation = generation
+
+
+def translate_via_glossary(text: str, source_lang: str, target_lang: str) -> str | None:
+    """Exact term/phrase lookup in the glossary; None when the text is not in it."""
+    key = normalize_term(text)
+    if not key:
+        return None
+    pair = (source_lang.upper(), target_lang.upper())
+    try:
+        translated = get_index().get(pair, {}).get(key)
+    except Exception as e:
+        logger.warning("Glossary unavailable: %s", e)
+        return None
+    if translated is None:
+        return None
+    stripped = text.rstrip()
+    trailing = stripped[len(stripped.rstrip(_TRAILING_PUNCTUATION)):]
+    if trailing and not translated.rstrip().endswith(tuple(_TRAILING_PUNCTUATION + '؟،؛')):
+        mapping = _TARGET_PUNCTUATION.get(pair[1], {})
+        translated = translated.rstrip() + ''.join(mapping.get(ch, ch) for ch in trailing)
+    return translated
+
+
+def glossary_stats() -> dict:
+    index = _index or {}
+    return {
+        'loaded': _index is not None,
+        'entries': {f'{sl}->{tl}': len(terms) for (sl, tl), terms in index.items()},
+    }
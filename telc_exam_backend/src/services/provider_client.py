@@ -0,0 +1,109 @@
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# 429 is not retried: it comes straight back so the caller can mark the quota
+# exhausted and move on to the next provider
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_sessions_lock = threading.Lock()
+_sessions: dict[str, requests.Session] = {}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After but never sleeps longer than the configured cap.
+
+    A provider asking us to come back in an hour should fail fast and let the
+    circuit breaker take over instead of blocking a worker.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _env_float('TRANSLATION_HTTP_MAX_RETRY_AFTER', 10))
+
+
+def _build_session() -> requests.Session:
+    # Only 5xx answers are retried. Connect errors and read timeouts fail at
+    # once so a call never takes longer than its timeout; the hedge and the
+    # next provider in line cover those.
+    retries = int(_env_float('TRANSLATION_HTTP_RETRIES', 2))
+    retry = _CappedRetry(
+        total=retries,
+        connect=0,
+        read=False,  # re-raise the timeout as requests.ReadTimeout instead of wrapping it
+        other=0,
+        status=retries,
+        backoff_factor=_env_float('TRANSLATION_HTTP_BACKOFF', 0.5),
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'POST'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    pool_size = int(_env_float('TRANSLATION_HTTP_POOL_SIZE', 16))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Keep-alive session shared by every call to the host of url."""
+    parts = urlsplit(url)
+    key = f'{parts.scheme}://{parts.netloc}'
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _build_session()
+                _sessions[key] = session
+    return session
+
+
+def provider_timeout(read_timeout: float) -> tuple[float, float]:
+    """(connect, read) timeout; TRANSLATION_CONNECT_TIMEOUT / TRANSLATION_READ_TIMEOUT override."""
+    connect = _env_float('TRANSLATION_CONNECT_TIMEOUT', 3.05)
+    read = _env_float('TRANSLATION_READ_TIMEOUT', read_timeout)
+    return connect, read
+
+
+def provider_get(url: str, read_timeout: float, **kwargs) -> requests.Response:
+    kwargs.setdefault('timeout', provider_timeout(read_timeout))
+    return get_session(url).get(url, **kwargs)
+
+
+def provider_post(url: str, read_timeout: float, **kwargs) -> requests.Response:
+    kwargs.setdefault('timeout', provider_timeout(read_timeout))
+    return get_session(url).post(url, **kwargs)
+
+
+# Largest request text each provider accepts (UTF-8 bytes); MyMemory rejects q over 500 bytes
+_DEFAULT_MAX_BYTES = {
+    'mymemory': 500,
+    'libretranslate': 5000,
+    'openrouter': 12000,
+}
+
+
+def provider_max_bytes(name: str) -> int:
+    """Request size limit for a provider; TRANSLATION_<NAME>_MAX_BYTES overrides, 0 means unlimited."""
+    key = name.lower()
+    try:
+        return int(os.getenv(f'TRANSLATION_{key.upper()}_MAX_BYTES', str(_DEFAULT_MAX_BYTES.get(key, 0))))
+    except ValueError:
+        return _DEFAULT_MAX_BYTES.get(key, 0)
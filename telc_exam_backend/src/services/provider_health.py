@@ -0,0 +1,166 @@
+import os
+import time
+import threading
+from collections import deque
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class ProviderHealth:
+    """Rolling health statistics and circuit breaker for one translation provider.
+
+    - Keeps the last TRANSLATION_HEALTH_WINDOW calls (latency + outcome)
+    - Opens the circuit after TRANSLATION_CB_FAILURES consecutive failures
+    - After TRANSLATION_CB_OPEN_SECONDS lets a single probe through (half-open);
+      the probe's outcome closes or re-opens the circuit
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.window = int(_env_number('TRANSLATION_HEALTH_WINDOW', 50))
+        self.failure_threshold = int(_env_number('TRANSLATION_CB_FAILURES', 5))
+        self.open_seconds = _env_number('TRANSLATION_CB_OPEN_SECONDS', 60)
+        self.min_samples = int(_env_number('TRANSLATION_HEALTH_MIN_SAMPLES', 5))
+
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[bool, float]] = deque(maxlen=self.window)
+        self._consecutive_failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._total_calls = 0
+        self._total_failures = 0
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def cancel_request(self) -> None:
+        """Give back a request allowed by allow_request that was never sent."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append((True, latency))
+            self._total_calls += 1
+            self._consecutive_failures = 0
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._probe_in_flight = False
+
+    def record_failure(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append((False, latency))
+            self._total_calls += 1
+            self._total_failures += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._consecutive_failures = 0
+            self._state = CLOSED
+            self._probe_in_flight = False
+
+    def _stats(self) -> tuple[int, float, float]:
+        count = len(self._samples)
+        if not count:
+            return 0, 1.0, 0.0
+        successes = sum(1 for ok, _ in self._samples if ok)
+        avg_latency = sum(latency for _, latency in self._samples) / count
+        return count, successes / count, avg_latency
+
+    def score(self) -> float | None:
+        """Expected seconds spent per successful call; lower is better.
+
+        None until enough samples have been collected.
+        """
+        with self._lock:
+            count, success_rate, avg_latency = self._stats()
+            if count < self.min_samples:
+                return None
+            if self._state == OPEN:
+                return float('inf')
+            return avg_latency / max(success_rate, 0.05)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count, success_rate, avg_latency = self._stats()
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+            return {
+                'name': self.name,
+                'state': self._state,
+                'samples': count,
+                'success_rate': round(success_rate, 3),
+                'error_rate': round(1 - success_rate, 3),
+                'avg_latency_ms': round(avg_latency * 1000, 1),
+                'consecutive_failures': self._consecutive_failures,
+                'retry_in_seconds': round(retry_in, 1),
+                'total_calls': self._total_calls,
+                'total_failures': self._total_failures,
+            }
+
+
+_registry_lock = threading.Lock()
+_registry: dict[str, ProviderHealth] = {}
+
+
+def get_provider_health(name: str) -> ProviderHealth:
+    health = _registry.get(name)
+    if health is None:
+        with _registry_lock:
+            health = _registry.setdefault(name, ProviderHealth(name))
+    return health
+
+
+def order_providers(services: list[tuple]) -> list[tuple]:
+    """Reorder (name, ...) provider tuples by observed health.
+
+    Providers with enough samples are sorted by score and placed into the
+    slots they occupied; providers without enough data keep their configured
+    position. Disabled with TRANSLATION_ADAPTIVE_ORDER=false.
+    """
+    if os.getenv('TRANSLATION_ADAPTIVE_ORDER', 'true').lower() != 'true':
+        return list(services)
+    scores = [get_provider_health(service[0]).score() for service in services]
+    known = [i for i, score in enumerate(scores) if score is not None]
+    ranked = sorted(known, key=lambda i: (scores[i], i))
+    ordered = list(services)
+    for slot, i in zip(known, ranked):
+        ordered[slot] = services[i]
+    return ordered
+
+
+def health_snapshot() -> list[dict]:
+    with _registry_lock:
+        providers = list(_registry.values())
+    return [p.snapshot() for p in providers]
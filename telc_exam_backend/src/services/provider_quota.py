@@ -0,0 +1,275 @@
+import os
+import time
+import heapq
+import logging
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.user import db
+from src.models.translation import ProviderQuotaUsage
+
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+BULK = 1
+_PRIORITY_NAMES = {INTERACTIVE: 'interactive', BULK: 'bulk'}
+
+# Callers default to interactive; the background worker marks its work as bulk
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar('translation_priority', default=INTERACTIVE)
+
+# Free-tier limits; 0 means unlimited. MyMemory allows 50k characters a day with an
+# email, free OpenRouter models 20 requests a minute and 50 a day.
+_DEFAULT_LIMITS = {
+    'mymemory': {'requests_per_minute': 0, 'requests_per_day': 0, 'chars_per_day': 50000},
+    'openrouter': {'requests_per_minute': 20, 'requests_per_day': 50, 'chars_per_day': 0},
+}
+_ENV_SUFFIX = {'requests_per_minute': 'RPM', 'requests_per_day': 'REQUESTS_PER_DAY', 'chars_per_day': 'CHARS_PER_DAY'}
+# limit -> (window, counter)
+_LIMIT_COUNTERS = {
+    'requests_per_minute': ('minute', 'requests'),
+    'requests_per_day': ('day', 'requests'),
+    'chars_per_day': ('day', 'chars'),
+}
+_WINDOW_SECONDS = {'minute': 60, 'day': 86400}
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+@contextmanager
+def bulk_priority():
+    """Mark provider calls made inside the block (and pool tasks it submits) as bulk."""
+    token = _priority.set(BULK)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _window_start(now: datetime, window: str) -> datetime:
+    if window == 'minute':
+        return now.replace(second=0, microsecond=0)
+    return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class ProviderQuota:
+    """Outbound request and character budget of one provider.
+
+    Limits come from TRANSLATION_<NAME>_RPM, TRANSLATION_<NAME>_REQUESTS_PER_DAY
+    and TRANSLATION_<NAME>_CHARS_PER_DAY (0 disables a limit). Usage is
+    counted per UTC minute and day in provider_quota_usage, so every web and
+    worker process spends the same budget. Bulk calls may only use up to
+    1 - TRANSLATION_QUOTA_INTERACTIVE_SHARE (default 0.2) of each limit, which
+    keeps headroom for interactive requests in other processes; within a
+    process, waiting interactive callers are also served first. A call whose
+    budget will not free up within its maximum wait (TRANSLATION_QUOTA_MAX_WAIT,
+    TRANSLATION_QUOTA_BULK_MAX_WAIT) is refused at once so the caller can move
+    on to another provider. If the database cannot be reached, calls are let
+    through rather than blocked.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        key = name.lower()
+        defaults = _DEFAULT_LIMITS.get(key, {})
+        self.limits = {
+            limit: int(_env_number(f'TRANSLATION_{key.upper()}_{suffix}', defaults.get(limit, 0)))
+            for limit, suffix in _ENV_SUFFIX.items()
+        }
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int]] = []
+        self._tickets = itertools.count()
+        # Local hint that lets unlimited providers skip the database until they report exhaustion
+        self._blocked_until = 0.0
+        self._pruned = 0.0
+        self.granted = 0
+        self.refused = 0
+
+    def _caps(self, priority: int) -> dict[str, dict[str, int]]:
+        """{window: {counter: cap}} for the priority; the day window is always tracked for blocks."""
+        share = 1.0
+        if priority == BULK:
+            share = 1.0 - min(max(_env_number('TRANSLATION_QUOTA_INTERACTIVE_SHARE', 0.2), 0.0), 1.0)
+        caps: dict[str, dict[str, int]] = {'day': {}}
+        for limit, capacity in self.limits.items():
+            if capacity > 0:
+                window, counter = _LIMIT_COUNTERS[limit]
+                caps.setdefault(window, {})[counter] = max(1, int(capacity * share))
+        return caps
+
+    def _reserve(self, chars: int, requests: int, priority: int) -> float:
+        """Count the call in every window; 0 when granted, else seconds until the refusing window frees up."""
+        table = ProviderQuotaUsage.__table__
+        now = datetime.utcnow()
+        try:
+            with db.engine.connect() as conn:
+                for window, caps in self._caps(priority).items():
+                    start = _window_start(now, window)
+                    # Calls larger than a whole limit go through in an empty window
+                    charge = {
+                        counter: min(amount, caps[counter]) if caps.get(counter) else amount
+                        for counter, amount in (('requests', requests), ('chars', chars))
+                    }
+                    conditions = [or_(table.c.blocked_until.is_(None), table.c.blocked_until <= now)]
+                    conditions += [table.c[counter] + charge[counter] <= cap for counter, cap in caps.items()]
+                    stmt = insert(table).values(provider=self.name, window=window, window_start=start, **charge)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=['provider', 'window', 'window_start'],
+                        set_={counter: table.c[counter] + stmt.excluded[counter] for counter in charge},
+                        where=and_(*conditions),
+                    ).returning(table.c.requests)
+                    if conn.execute(stmt).first() is None:
+                        blocked_until = conn.execute(select(table.c.blocked_until).where(
+                            table.c.provider == self.name, table.c.window == window, table.c.window_start == start,
+                        )).scalar()
+                        conn.rollback()
+                        if blocked_until is not None and blocked_until > now:
+                            return (blocked_until - now).total_seconds()
+                        return (start + timedelta(seconds=_WINDOW_SECONDS[window]) - now).total_seconds()
+                self._prune(conn, now)
+                conn.commit()
+        except Exception as e:
+            logger.warning("%s quota check failed, letting the call through: %s", self.name, e)
+        return 0.0
+
+    def _prune(self, conn, now: datetime) -> None:
+        # Hourly, drop windows older than two days
+        if time.monotonic() - self._pruned < 3600:
+            return
+        self._pruned = time.monotonic()
+        table = ProviderQuotaUsage.__table__
+        conn.execute(table.delete().where(
+            table.c.provider == self.name, table.c.window_start < now - timedelta(days=2),
+        ))
+
+    def acquire(self, chars: int, requests: int = 1, max_wait: float | None = None) -> bool:
+        """Take budget for requests calls carrying chars characters; False if refused."""
+        if not any(self.limits.values()) and time.monotonic() >= self._blocked_until:
+            return True
+        priority = current_priority()
+        if max_wait is None:
+            if priority == INTERACTIVE:
+                max_wait = _env_number('TRANSLATION_QUOTA_MAX_WAIT', 2)
+            else:
+                max_wait = _env_number('TRANSLATION_QUOTA_BULK_MAX_WAIT', 60)
+        deadline = time.monotonic() + max_wait
+        with self._cond:
+            ticket = (priority, next(self._tickets))
+            heapq.heappush(self._queue, ticket)
+        try:
+            while True:
+                # The lock only guards the queue; the database round trip runs without it
+                with self._cond:
+                    while self._queue[0] != ticket:
+                        now = time.monotonic()
+                        if now >= deadline:
+                            self.refused += 1
+                            return False
+                        self._cond.wait(deadline - now)
+                wait = self._reserve(chars, requests, priority)
+                with self._cond:
+                    if wait == 0:
+                        self.granted += 1
+                        return True
+                    now = time.monotonic()
+                    if now >= deadline or now + wait > deadline:
+                        self.refused += 1
+                        return False
+                    self._cond.wait(min(wait, deadline - now))
+        finally:
+            with self._cond:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+
+    def exhaust(self, seconds: float | None = None) -> None:
+        """Record that the provider reported its quota as used up; refuse calls in every process for seconds."""
+        if seconds is None:
+            seconds = _env_number('TRANSLATION_QUOTA_EXHAUSTED_SECONDS', 3600)
+        table = ProviderQuotaUsage.__table__
+        now = datetime.utcnow()
+        until = now + timedelta(seconds=seconds)
+        stmt = insert(table).values(
+            provider=self.name, window='day', window_start=_window_start(now, 'day'),
+            requests=0, chars=0, blocked_until=until,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['provider', 'window', 'window_start'],
+            set_={'blocked_until': stmt.excluded.blocked_until},
+            where=or_(table.c.blocked_until.is_(None), table.c.blocked_until < stmt.excluded.blocked_until),
+        )
+        try:
+            with db.engine.connect() as conn:
+                conn.execute(stmt)
+                conn.commit()
+        except Exception as e:
+            logger.warning("%s quota block could not be stored: %s", self.name, e)
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+    def snapshot(self) -> dict:
+        table = ProviderQuotaUsage.__table__
+        now = datetime.utcnow()
+        rows = {}
+        try:
+            with db.engine.connect() as conn:
+                result = conn.execute(select(table).where(
+                    table.c.provider == self.name,
+                    or_(*(
+                        and_(table.c.window == window, table.c.window_start == _window_start(now, window))
+                        for window in _WINDOW_SECONDS
+                    )),
+                ))
+                rows = {row.window: row for row in result}
+        except Exception as e:
+            logger.warning("%s quota usage could not be read: %s", self.name, e)
+        remaining = {}
+        for limit, capacity in self.limits.items():
+            window, counter = _LIMIT_COUNTERS[limit]
+            row = rows.get(window)
+            used = getattr(row, counter) if row is not None else 0
+            remaining[limit] = {
+                'limit': capacity or None,
+                'remaining': max(0, capacity - used) if capacity else None,
+            }
+        blocked_until = rows['day'].blocked_until if 'day' in rows else None
+        with self._cond:
+            waiting = {name: 0 for name in _PRIORITY_NAMES.values()}
+            for priority, _ in self._queue:
+                waiting[_PRIORITY_NAMES[priority]] += 1
+            return {
+                'name': self.name,
+                **remaining,
+                'blocked_for_seconds': round(max(0.0, (blocked_until - now).total_seconds()), 1) if blocked_until else 0.0,
+                'waiting': waiting,
+                'granted': self.granted,
+                'refused': self.refused,
+            }
+
+
+_registry_lock = threading.Lock()
+_registry: dict[str, ProviderQuota] = {}
+
+
+def get_provider_quota(name: str) -> ProviderQuota:
+    quota = _registry.get(name)
+    if quota is None:
+        with _registry_lock:
+            quota = _registry.setdefault(name, ProviderQuota(name))
+    return quota
@@ -0,0 +1,38 @@
+import os
+import threading
+from typing import Callable, NamedTuple
+
+
+class Provider(NamedTuple):
+    """A translation backend: translate(text, source_lang, target_lang) -> str | None.
+
+    Local providers answer without a network call; they are tried first and
+    bypass health tracking, concurrency slots and hedging.
+    """
+    name: str
+    translate: Callable[[str, str, str], str | None]
+    local: bool = False
+
+
+_registry_lock = threading.Lock()
+_providers: dict[str, Provider] = {}
+
+
+def register_provider(name: str, translate: Callable[[str, str, str], str | None], local: bool = False) -> None:
+    with _registry_lock:
+        _providers[name.lower()] = Provider(name, translate, local)
+
+
+def get_provider(name: str) -> Provider | None:
+    return _providers.get(name.lower())
+
+
+def configured_providers() -> list[Provider]:
+    """Providers in TRANSLATION_PROVIDERS order (comma separated names); all, in registration order, by default.
+
+    Unknown names are ignored.
+    """
+    names = [name.strip() for name in os.getenv('TRANSLATION_PROVIDERS', '').split(',') if name.strip()]
+    if not names:
+        return list(_providers.values())
+    return [provider for provider in map(get_provider, names) if provider is not None]
@@ -0,0 +1,178 @@
+import os
+import re
+
+
+# Candidate sentence ends: terminal punctuation (plus closing quotes/brackets) followed by whitespace
+_SENTENCE_END = re.compile(r'[.!?…]+["\'»«“”)\]]*(\s+)')
+_PARAGRAPH_BREAK = re.compile(r'\s*\n\s*')
+_LAST_WORD = re.compile(r'(\S+)$')
+# A capitalized name or initial: "Anna", "Müller-Lüdenscheidt", "M."
+_NAME_WORD = re.compile(r'[A-ZÄÖÜ](?:[a-zäöüß]+(?:-[A-ZÄÖÜ][a-zäöüß]+)*|\.)')
+# Capitalized words that open a letter's closing rather than name its writer
+_CLOSING_WORDS = {'ihr', 'ihre', 'dein', 'deine', 'euer', 'eure', 'liebe', 'lieber', 'viele',
+                  'herzliche', 'beste', 'gruß', 'grüße', 'hallo', 'tschüss', 'mfg', 'lg', 'vg'}
+
+# Abbreviations after which a period does not end the sentence
+_ABBREVIATIONS = {
+    'z.b.', 'b.', 'd.h.', 'h.', 'u.a.', 'a.', 'usw.', 'bzw.', 'ca.', 'dr.', 'nr.', 'str.', 'tel.',
+    'vgl.', 'evtl.', 'ggf.', 'inkl.', 'bzgl.', 'etc.', 'geb.', 'prof.', 'hr.', 'fr.', 'mo.', 'di.',
+    'mi.', 'do.', 'sa.', 'so.', 'jan.', 'feb.', 'aug.', 'sept.', 'okt.', 'nov.', 'dez.', 'e.v.',
+}
+
+
+def segment_min_chars() -> int:
+    try:
+        return int(os.getenv('SEGMENT_MIN_CHARS', '400'))
+    except ValueError:
+        return 400
+
+
+def should_segment(text: str) -> bool:
+    """Only long texts are worth caching sentence by sentence."""
+    return bool(text) and len(text) >= segment_min_chars()
+
+
+def is_passthrough(segment: str, final: bool = False) -> bool:
+    """
+    True for text that reads the same in every language and needs no provider call.
+
+    That is text without letters (dates, numbers, times, prices) and, when it
+    is the final segment of a text, a signature line of at most three
+    capitalized names such as "Anna Schmidt" or "M. Weber".
+    """
+    text = segment.strip()
+    if not any(ch.isalpha() for ch in text):
+        return True
+    if not final or len(text) > 40:
+        return False
+    words = text.split()
+    return len(words) <= 3 and all(
+        _NAME_WORD.fullmatch(word) and word.lower() not in _CLOSING_WORDS for word in words
+    )
+
+
+def _ends_sentence(text: str, end: int) -> bool:
+    # end is the index just past the punctuation; reject abbreviations, initials and ordinals
+    word = _LAST_WORD.search(text, 0, end)
+    if word is None:
+        return True
+    token = word.group(1).lower().lstrip('("„»«“')
+    if token in _ABBREVIATIONS:
+        return False
+    stem = token.rstrip('.')
+    if token.endswith('.') and (len(stem) == 1 or stem.isdigit()):
+        return False
+    nxt = text[end:].lstrip()
+    # A lower-case continuation means the period was not a sentence end
+    return not nxt[:1].islower()
+
+
+def _split_sentences(paragraph: str) -> tuple[list[str], list[str]]:
+    segments, separators = [], []
+    start = 0
+    for match in _SENTENCE_END.finditer(paragraph):
+        gap_start = match.start(1)
+        if match.end() >= len(paragraph) or not _ends_sentence(paragraph, gap_start):
+            continue
+        segments.append(paragraph[start:gap_start])
+        separators.append(match.group(1))
+        start = match.end()
+    segments.append(paragraph[start:])
+    return segments, separators
+
+
+def split_segments(text: str) -> tuple[list[str], list[str]]:
+    """
+    Split text into paragraph and sentence segments.
+
+    Returns (segments, separators) with len(separators) == len(segments) + 1;
+    separators hold the exact whitespace and newlines around the segments so
+    join_segments(segments, separators) == text.
+    """
+    body = text.strip()
+    if not body:
+        return [], [text]
+    lead = text[:len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()):]
+
+    segments, separators = [], [lead]
+    pos = 0
+    for brk in list(_PARAGRAPH_BREAK.finditer(body)) + [None]:
+        paragraph = body[pos:brk.start()] if brk else body[pos:]
+        sentences, gaps = _split_sentences(paragraph)
+        segments.extend(sentences)
+        separators.extend(gaps)
+        if brk:
+            separators.append(brk.group(0))
+            pos = brk.end()
+    separators.append(trail)
+    return segments, separators
+
+
+def join_segments(segments: list[str], separators: list[str]) -> str:
+    """Inverse of split_segments, used with translated segments."""
+    parts = [separators[0]]
+    for segment, separator in zip(segments, separators[1:]):
+        parts.append(segment)
+        parts.append(separator)
+    return ''.join(parts)
+
+
+def _utf8_len(text: str) -> int:
+    return len(text.encode('utf-8'))
+
+
+def _split_oversized(segment: str, max_bytes: int) -> tuple[list[str], list[str]]:
+    # Break a single overlong sentence at whitespace, or mid-word as a last resort
+    pieces, gaps = [], []
+    rest = segment
+    while _utf8_len(rest) > max_bytes:
+        cut = len(rest.encode('utf-8')[:max_bytes].decode('utf-8', 'ignore'))
+        space = rest.rfind(' ', 0, cut)
+        if space > 0:
+            pieces.append(rest[:space])
+            gap_end = space + len(rest[space:]) - len(rest[space:].lstrip(' '))
+            gaps.append(rest[space:gap_end])
+            rest = rest[gap_end:]
+        else:
+            pieces.append(rest[:cut])
+            gaps.append('')
+            rest = rest[cut:]
+    pieces.append(rest)
+    return pieces, gaps
+
+
+def split_for_limit(text: str, max_bytes: int) -> tuple[list[str], list[str]]:
+    """
+    Pack text into chunks of at most max_bytes UTF-8 bytes for a provider's request limit.
+
+    Chunks break at sentence and paragraph boundaries where possible. Returns
+    (chunks, separators) in the split_segments layout, so
+    join_segments(chunks, separators) == text.
+    """
+    if max_bytes <= 0 or _utf8_len(text) <= max_bytes:
+        return [text], ['', '']
+    segments, separators = split_segments(text)
+    if not segments:
+        return [text], ['', '']
+    pieces, gaps = [], []
+    for idx, segment in enumerate(segments):
+        sub, sub_gaps = _split_oversized(segment, max_bytes)
+        pieces.extend(sub)
+        gaps.extend(sub_gaps)
+        if idx < len(segments) - 1:
+            gaps.append(separators[idx + 1])
+
+    chunks, chunk_separators = [], [separators[0]]
+    current = pieces[0]
+    for gap, piece in zip(gaps, pieces[1:]):
+        joined = current + gap + piece
+        if _utf8_len(joined) <= max_bytes:
+            current = joined
+        else:
+            chunks.append(current)
+            chunk_separators.append(gap)
+            current = piece
+    chunks.append(current)
+    chunk_separators.append(separators[-1])
+    return chunks, chunk_separators
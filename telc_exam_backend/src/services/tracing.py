@@ -0,0 +1,110 @@
+import os
+import time
+import threading
+import contextvars
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable
+
+
+# The trace of the current request; None when tracing is off, which makes span() a no-op
+_current: contextvars.ContextVar['Trace | None'] = contextvars.ContextVar('trace', default=None)
+_NOOP = nullcontext()
+
+
+def tracing_enabled() -> bool:
+    """TRACING_ENABLED=true turns on per-request spans and the Server-Timing header."""
+    return os.getenv('TRACING_ENABLED', 'false').lower() == 'true'
+
+
+class Trace:
+    """Accumulated time per span name for one request.
+
+    Spans running on pool threads add to the same trace (the contextvar is
+    copied into every pool task), so totals are summed thread time and can
+    exceed the wall time of the request.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.spans: dict[str, list] = {}  # name -> [count, seconds]
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.spans.get(name)
+            if entry is None:
+                self.spans[name] = [1, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing header value: one metric per span name plus the total."""
+        with self._lock:
+            items = sorted(self.spans.items(), key=lambda item: -item[1][1])
+        metrics = [f'{name};dur={seconds * 1000:.1f};desc="{count}x"' for name, (count, seconds) in items]
+        metrics.append(f'total;dur={self.elapsed() * 1000:.1f}')
+        return ', '.join(metrics)
+
+    def summary(self) -> str:
+        with self._lock:
+            items = sorted(self.spans.items(), key=lambda item: -item[1][1])
+        return ' '.join(f'{name}={seconds * 1000:.0f}ms/{count}' for name, (count, seconds) in items)
+
+
+class _Span:
+    __slots__ = ('trace', 'name', 'started')
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def span(name: str):
+    """Time the enclosed block under name in the current trace; a shared no-op without one."""
+    trace = _current.get()
+    if trace is None:
+        return _NOOP
+    return _Span(trace, name)
+
+
+def traced(name: str) -> Callable:
+    """Decorator form of span()."""
+    def decorator(func: Callable[..., Any]):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with _Span(trace, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_trace() -> Trace:
+    trace = Trace()
+    _current.set(trace)
+    return trace
+
+
+def current_trace() -> Trace | None:
+    return _current.get()
+
+
+def end_trace() -> Trace | None:
+    trace = _current.get()
+    _current.set(None)
+    return trace
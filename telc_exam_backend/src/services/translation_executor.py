@@ -0,0 +1,185 @@
+import os
+import threading
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+
+_executor_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_hedge_executor: ThreadPoolExecutor | None = None
+
+_slots_lock = threading.Lock()
+_provider_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Shared, lazily created pool used for all concurrent translation work.
+
+    Size is controlled by TRANSLATION_MAX_WORKERS (default 16).
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_env_int('TRANSLATION_MAX_WORKERS', 16),
+                    thread_name_prefix='translate',
+                )
+    return _executor
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    # Hedged provider calls get their own pool so that fields running on the
+    # main pool never wait for a slot held by one of their own hedges.
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(
+                    max_workers=_env_int('TRANSLATION_HEDGE_WORKERS', 32),
+                    thread_name_prefix='translate-hedge',
+                )
+    return _hedge_executor
+
+
+def submit(func: Callable[..., Any], *args, **kwargs) -> Future:
+    """Submit work to the pool, carrying the caller's contextvars along."""
+    ctx = contextvars.copy_context()
+    return get_executor().submit(ctx.run, func, *args, **kwargs)
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+    """Run func over items on the pool and return results in input order.
+
+    Exceptions raised by func propagate to the caller once all work is submitted.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if len(items) == 1:
+        return [func(items[0])]
+    futures = [submit(func, item) for item in items]
+    return [f.result() for f in futures]
+
+
+def map_nested(func: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+    """Like map_concurrently, but safe to call from a task already running on the pool.
+
+    The caller works through the items itself and only waits for items a pool
+    worker has actually started, so a saturated pool cannot deadlock it.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    results: list[Any] = [None] * len(items)
+    claimed = [False] * len(items)
+    lock = threading.Lock()
+
+    def run(idx: int) -> None:
+        with lock:
+            if claimed[idx]:
+                return
+            claimed[idx] = True
+        results[idx] = func(items[idx])
+
+    futures = [submit(run, idx) for idx in range(1, len(items))]
+    try:
+        for idx in range(len(items)):
+            run(idx)
+    finally:
+        for future in futures:
+            if not future.cancel():
+                future.result()
+    return results
+
+
+def iter_completed(func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[tuple[int, Any]]:
+    """Run func over items on the pool and yield (index, result) as each one finishes."""
+    futures = {submit(func, item): idx for idx, item in enumerate(items)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def _provider_semaphore(name: str) -> threading.BoundedSemaphore:
+    key = name.lower()
+    sem = _provider_slots.get(key)
+    if sem is None:
+        with _slots_lock:
+            sem = _provider_slots.get(key)
+            if sem is None:
+                default_cap = _env_int('TRANSLATION_PROVIDER_CONCURRENCY', 4)
+                cap = _env_int(f'TRANSLATION_{key.upper()}_CONCURRENCY', default_cap)
+                sem = threading.BoundedSemaphore(cap)
+                _provider_slots[key] = sem
+    return sem
+
+
+@contextmanager
+def provider_slot(name: str):
+    """Limit how many calls to a single provider run at the same time.
+
+    The cap comes from TRANSLATION_<NAME>_CONCURRENCY, falling back to
+    TRANSLATION_PROVIDER_CONCURRENCY (default 4).
+    """
+    sem = _provider_semaphore(name)
+    sem.acquire()
+    try:
+        yield
+    finally:
+        sem.release()
+
+
+def hedged_call(
+    calls: list[tuple[str, Callable[[], Any]]],
+    hedge_delay: float,
+    accept: Callable[[Any], bool],
+) -> tuple[str | None, Any]:
+    """Race calls in preference order and return the first accepted result.
+
+    The first call starts immediately. Each following call starts when the
+    ones already running have not produced an accepted result within
+    hedge_delay seconds, or as soon as one of them fails. Calls that
+    have not started yet are cancelled once a winner is found; running calls
+    finish in the background and their results are discarded.
+
+    Returns (name, result) of the winner, or (None, None) if every call failed.
+    """
+    pool = _get_hedge_executor()
+    queue = list(calls)
+    running: dict[Future, str] = {}
+
+    def launch():
+        name, func = queue.pop(0)
+        ctx = contextvars.copy_context()
+        running[pool.submit(ctx.run, func)] = name
+
+    launch()
+    while running:
+        done, _ = wait(list(running), timeout=hedge_delay if queue else None, return_when=FIRST_COMPLETED)
+        if not done:
+            # Hedge: the running calls are slow, start the next one as well
+            launch()
+            continue
+        for future in done:
+            name = running.pop(future)
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+            if accept(result):
+                for other in running:
+                    other.cancel()
+                return name, result
+        if queue:
+            # A running call failed, escalate without waiting for the delay
+            launch()
+    return None, None
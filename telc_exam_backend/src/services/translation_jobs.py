@@ -0,0 +1,118 @@
+import os
+import json
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_
+
+from src.models.user import db
+from src.models.translation import TranslationJob
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def enqueue_translation_job(exam_id: int, source_lang: str, target_lang: str, batch: bool = False,
+                            paths: list[str] | None = None) -> TranslationJob:
+    """Queue a background translation for an exam and language.
+
+    paths limits the provider work to those fields (the snapshot is still
+    refreshed afterwards); None means the whole exam. A job that has not
+    started yet is reused and its paths are merged; a running whole-exam job
+    is reused for another whole-exam request.
+    """
+    statuses = [QUEUED, RUNNING] if paths is None else [QUEUED]
+    job = TranslationJob.query.filter(
+        TranslationJob.exam_id == exam_id,
+        TranslationJob.source_lang == source_lang,
+        TranslationJob.target_lang == target_lang,
+        TranslationJob.status.in_(statuses),
+    ).order_by(TranslationJob.id.desc()).first()
+    if job:
+        if job.status == QUEUED:
+            if paths is None or job.paths is None:
+                job.paths = None
+            else:
+                merged = json.loads(job.paths)
+                merged += [path for path in paths if path not in merged]
+                job.paths = json.dumps(merged)
+            job.batch = job.batch or batch
+            db.session.commit()
+        return job
+    job = TranslationJob(
+        exam_id=exam_id, source_lang=source_lang, target_lang=target_lang,
+        batch=batch, status=QUEUED, paths=json.dumps(paths) if paths is not None else None
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def claim_next_job(worker_id: str) -> TranslationJob | None:
+    """Claim the oldest queued job with SELECT ... FOR UPDATE SKIP LOCKED.
+
+    Jobs left running by a worker that died (no update for
+    TRANSLATION_JOB_STALE_SECONDS) are claimed again.
+    """
+    stale_after = int(os.getenv('TRANSLATION_JOB_STALE_SECONDS', '600'))
+    cutoff = datetime.utcnow() - timedelta(seconds=stale_after)
+    job = TranslationJob.query.filter(or_(
+        TranslationJob.status == QUEUED,
+        (TranslationJob.status == RUNNING) & (TranslationJob.updated_at < cutoff),
+    )).order_by(TranslationJob.id).with_for_update(skip_locked=True).first()
+    if job is None:
+        db.session.rollback()
+        return None
+    job.status = RUNNING
+    job.worker = worker_id
+    job.attempts = (job.attempts or 0) + 1
+    job.started_at = datetime.utcnow()
+    job.error = None
+    db.session.commit()
+    return job
+
+
+class JobProgress:
+    """Collects per-field results of a running job and flushes them at most every
+    TRANSLATION_JOB_PROGRESS_INTERVAL seconds, so pollers see partial results."""
+
+    def __init__(self, job: TranslationJob):
+        self.job = job
+        self.results: dict[str, str] = json.loads(job.results) if job.results else {}
+        self.total = 0
+        self.interval = float(os.getenv('TRANSLATION_JOB_PROGRESS_INTERVAL', '1.0'))
+        self._last_flush = 0.0
+
+    def __call__(self, results: dict[str, str], total: int) -> None:
+        self.results.update(results)
+        self.total = total
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self.job.total_fields = self.total
+        self.job.done_fields = len(self.results)
+        self.job.results = json.dumps(self.results, ensure_ascii=False)
+        db.session.commit()
+        self._last_flush = time.monotonic()
+
+
+def finish_job(job: TranslationJob, progress: JobProgress) -> None:
+    progress.flush()
+    job.status = DONE
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+
+
+def fail_job(job_id: int, error: str) -> None:
+    db.session.rollback()
+    job = db.session.get(TranslationJob, job_id)
+    if job is None:
+        return
+    job.status = FAILED
+    job.error = error[:2000]
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
@@ -0,0 +1,250 @@
+import json
+from datetime import datetime
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import bindparam, event, func, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.user import db
+from src.models.translation import TranslationCache, TranslationMemory
+from src.services.glossary import sync_glossary_generation
+from src.services.memory_cache import translation_lru
+from src.services.tracing import span, traced
+
+
+class MemoryEntry(NamedTuple):
+    """A translation memory row with the validation stored when it was written."""
+    text: str
+    score: int | None = None
+    issues: list[str] | None = None
+    validator_version: int | None = None
+
+
+# session.info key of LRU writes waiting for their transaction to commit
+_PENDING_LRU = 'translation_lru_pending'
+
+
+def _cache_after_commit(entries: dict[tuple[str, str, str], MemoryEntry]) -> None:
+    # Rows written in the current transaction reach the LRU only once it commits,
+    # so a rolled back write is never served from this process
+    db.session.info.setdefault(_PENDING_LRU, {}).update(entries)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_pending_lru(session) -> None:
+    for key, entry in session.info.pop(_PENDING_LRU, {}).items():
+        translation_lru.set(key, entry)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _drop_pending_lru(session) -> None:
+    session.info.pop(_PENDING_LRU, None)
+
+
+def _entry(translated: str, score, issues, validator_version) -> MemoryEntry:
+    return MemoryEntry(translated, score, json.loads(issues) if issues else [], validator_version)
+
+
+def lookup_memory(source_hashes: Iterable[str], source_lang: str, target_lang: str) -> dict[str, MemoryEntry]:
+    """Return {source_hash: MemoryEntry} for hashes present in the translation memory.
+
+    The in-process LRU tier is consulted first; the remaining hashes are fetched
+    with a single query and copied into it.
+    """
+    sync_glossary_generation()
+    found = {}
+    misses = []
+    for shash in set(source_hashes):
+        translated = translation_lru.get((shash, source_lang, target_lang))
+        if translated is not None:
+            found[shash] = translated
+        else:
+            misses.append(shash)
+    if not misses:
+        return found
+
+    with span('db.memory'):
+        rows = db.session.query(
+            TranslationMemory.source_hash, TranslationMemory.translated_text, TranslationMemory.quality_score,
+            TranslationMemory.quality_issues, TranslationMemory.validator_version,
+        ).filter(
+            TranslationMemory.source_lang == source_lang,
+            TranslationMemory.target_lang == target_lang,
+            TranslationMemory.source_hash.in_(misses),
+        ).all()
+    for shash, *row in rows:
+        found[shash] = _entry(*row)
+        translation_lru.set((shash, source_lang, target_lang), found[shash])
+    return found
+
+
+@traced('db.legacy')
+def lookup_legacy(resource_type: str, resource_id: int, path_hashes: Iterable[tuple[str, str]],
+                  source_lang: str, target_lang: str) -> dict[str, str]:
+    """Return {source_hash: translated_text} from path-keyed rows written before the memory existed."""
+    wanted = set(path_hashes)
+    if not wanted:
+        return {}
+    rows = db.session.query(TranslationCache.path, TranslationCache.source_hash, TranslationCache.translated_text).filter(
+        TranslationCache.resource_type == resource_type,
+        TranslationCache.resource_id == resource_id,
+        TranslationCache.source_lang == source_lang,
+        TranslationCache.target_lang == target_lang,
+        TranslationCache.path.in_({path for path, _ in wanted}),
+        TranslationCache.source_hash.in_({shash for _, shash in wanted}),
+        TranslationCache.translated_text.isnot(None),
+    ).all()
+    return {
+        shash: translated
+        for path, shash, translated in rows
+        if (path, shash) in wanted and translated
+    }
+
+
+@traced('db.remember')
+def remember_many(translations: dict[str, str], source_lang: str, target_lang: str,
+                  sources: dict[str, str] | None = None, quality: dict[str, dict] | None = None,
+                  validator_version: int | None = None) -> dict[str, int]:
+    """Upsert {source_hash: translated_text} in one statement and return {source_hash: memory id}.
+
+    sources ({source_hash: source text}) and quality ({source_hash: validation
+    dict}) are stored alongside when known. Uses INSERT ... ON CONFLICT DO
+    UPDATE so concurrent workers writing the same text never trip over the
+    unique constraint. The LRU tier sees the entries once the caller commits.
+    """
+    if not translations:
+        return {}
+    sources = sources or {}
+    quality = quality or {}
+    now = datetime.utcnow()
+    entries = {}
+    values = []
+    for shash, translated in translations.items():
+        validation = quality.get(shash)
+        entry = MemoryEntry(translated)
+        if validation is not None:
+            entry = MemoryEntry(translated, validation['score'], validation['issues'], validator_version)
+        entries[shash] = entry
+        values.append({
+            'source_hash': shash, 'source_lang': source_lang, 'target_lang': target_lang,
+            'source_text': sources.get(shash), 'translated_text': translated,
+            'quality_score': entry.score, 'validator_version': entry.validator_version,
+            'quality_issues': json.dumps(entry.issues, ensure_ascii=False) if entry.issues is not None else None,
+            'created_at': now, 'updated_at': now,
+        })
+    stmt = insert(TranslationMemory).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['source_hash', 'source_lang', 'target_lang'],
+        set_={
+            'translated_text': stmt.excluded.translated_text,
+            'source_text': func.coalesce(stmt.excluded.source_text, TranslationMemory.source_text),
+            'quality_score': stmt.excluded.quality_score,
+            'quality_issues': stmt.excluded.quality_issues,
+            'validator_version': stmt.excluded.validator_version,
+            'updated_at': now,
+        },
+    ).returning(TranslationMemory.source_hash, TranslationMemory.id)
+    ids = {shash: memory_id for shash, memory_id in db.session.execute(stmt)}
+    _cache_after_commit({(shash, source_lang, target_lang): entry for shash, entry in entries.items()})
+    return ids
+
+
+@traced('db.quality')
+def store_quality(updates: list[dict], validator_version: int) -> None:
+    """Record validation results on existing memory rows in one executemany.
+
+    Each update has source_hash, source_lang, target_lang, translated_text,
+    source_text (or None to keep the stored one) and validation.
+    """
+    if not updates:
+        return
+    table = TranslationMemory.__table__
+    stmt = update(table).where(
+        table.c.source_hash == bindparam('b_hash'),
+        table.c.source_lang == bindparam('b_source_lang'),
+        table.c.target_lang == bindparam('b_target_lang'),
+        # Skip rows whose translation was replaced meanwhile
+        table.c.translated_text == bindparam('b_text'),
+    ).values(
+        source_text=func.coalesce(bindparam('b_source_text'), table.c.source_text),
+        quality_score=bindparam('b_score'),
+        quality_issues=bindparam('b_issues'),
+        validator_version=validator_version,
+    )
+    db.session.execute(stmt, [
+        {
+            'b_hash': u['source_hash'], 'b_source_lang': u['source_lang'], 'b_target_lang': u['target_lang'],
+            'b_text': u['translated_text'], 'b_source_text': u['source_text'],
+            'b_score': u['validation']['score'],
+            'b_issues': json.dumps(u['validation']['issues'], ensure_ascii=False),
+        }
+        for u in updates
+    ])
+    _cache_after_commit({
+        (u['source_hash'], u['source_lang'], u['target_lang']): MemoryEntry(
+            u['translated_text'], u['validation']['score'], u['validation']['issues'], validator_version
+        )
+        for u in updates
+    })
+
+
+def stale_quality_rows(validator_version: int, limit: int) -> list[TranslationMemory]:
+    """Memory rows validated by an older validator (or never) whose source text is known."""
+    return TranslationMemory.query.filter(
+        TranslationMemory.source_text.isnot(None),
+        or_(TranslationMemory.validator_version.is_(None), TranslationMemory.validator_version != validator_version),
+    ).order_by(TranslationMemory.id).limit(limit).all()
+
+
+@traced('db.link')
+def link_paths(resource_type: str, resource_id: int, links: Iterable[tuple[str, str, int]],
+               source_lang: str, target_lang: str) -> None:
+    """Record in one statement that resource paths use memory entries.
+
+    links are (path, source_hash, memory_id) tuples.
+    """
+    now = datetime.utcnow()
+    values = [
+        {
+            'resource_type': resource_type, 'resource_id': resource_id, 'path': path,
+            'source_lang': source_lang, 'target_lang': target_lang, 'source_hash': shash,
+            'translated_text': None, 'memory_id': memory_id, 'created_at': now, 'updated_at': now,
+        }
+        for path, shash, memory_id in links
+    ]
+    if not values:
+        return
+    stmt = insert(TranslationCache).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['resource_type', 'resource_id', 'path', 'source_lang', 'target_lang', 'source_hash'],
+        set_={'memory_id': stmt.excluded.memory_id, 'translated_text': None, 'updated_at': now},
+    )
+    db.session.execute(stmt)
+
+
+def forget(source_hash: str, source_lang: str, target_lang: str) -> None:
+    """Drop a bad translation from the memory and from every path that cached it."""
+    forget_many([source_hash], source_lang, target_lang)
+
+
+@traced('db.forget')
+def forget_many(source_hashes: Iterable[str], source_lang: str, target_lang: str) -> None:
+    """forget() for several hashes with one DELETE per table."""
+    source_hashes = list(set(source_hashes))
+    if not source_hashes:
+        return
+    pending = db.session.info.get(_PENDING_LRU, {})
+    for shash in source_hashes:
+        translation_lru.delete((shash, source_lang, target_lang))
+        pending.pop((shash, source_lang, target_lang), None)
+    TranslationMemory.query.filter(
+        TranslationMemory.source_lang == source_lang,
+        TranslationMemory.target_lang == target_lang,
+        TranslationMemory.source_hash.in_(source_hashes),
+    ).delete(synchronize_session=False)
+    TranslationCache.query.filter(
+        TranslationCache.source_lang == source_lang,
+        TranslationCache.target_lang == target_lang,
+        TranslationCache.source_hash.in_(source_hashes),
+    ).delete(synchronize_session=False)
@@ -0,0 +1,75 @@
+import os
+import json
+import logging
+import socket
+import time
+
+from src.models.user import db
+from src.models.exam import Exam
+from src.routes.translation import (
+    exam_text_fields, refresh_exam_translation, revalidate_translation_memory, translate_exam_fields,
+)
+from src.services.provider_quota import bulk_priority
+from src.services.translation_jobs import JobProgress, claim_next_job, fail_job, finish_job
+
+logger = logging.getLogger(__name__)
+
+
+def process_job(job) -> None:
+    """Run one claimed translation job to completion."""
+    job_id = job.id
+    try:
+        exam = db.session.get(Exam, job.exam_id)
+        if exam is None:
+            fail_job(job_id, f'Exam {job.exam_id} not found')
+            return
+        progress = JobProgress(job)
+        if job.paths is not None:
+            # Pre-translate only the listed fields; the snapshot refresh then hits the cache
+            fields = exam_text_fields(exam)
+            wanted = [(path, fields[path]) for path in json.loads(job.paths) if path in fields]
+            translate_exam_fields(exam.id, wanted, job.source_lang, job.target_lang, batch=job.batch, progress=progress)
+            db.session.commit()
+            refresh_exam_translation(exam, job.source_lang, job.target_lang, batch=job.batch)
+        else:
+            refresh_exam_translation(exam, job.source_lang, job.target_lang, batch=job.batch, progress=progress)
+        finish_job(job, progress)
+        logger.info("Translation job %s done (%s fields)", job_id, progress.total)
+    except Exception as e:
+        logger.exception("Translation job %s failed: %s", job_id, e)
+        fail_job(job_id, str(e))
+
+
+def run_worker(app, once: bool = False) -> None:
+    """Poll the translation_job table and process jobs until interrupted.
+
+    Several workers can run side by side; each job is claimed by exactly one
+    of them via SELECT ... FOR UPDATE SKIP LOCKED. When there is nothing to
+    do, the worker revalidates stale translation memory rows in batches of
+    TRANSLATION_SWEEP_BATCH (0 disables the sweep). Its provider calls run at
+    bulk priority, behind interactive requests of the same process.
+    """
+    worker_id = f'{socket.gethostname()}:{os.getpid()}'
+    poll_seconds = float(os.getenv('TRANSLATION_WORKER_POLL_SECONDS', '2'))
+    sweep_batch = int(os.getenv('TRANSLATION_SWEEP_BATCH', '500'))
+    with app.app_context(), bulk_priority():
+        while True:
+            job = claim_next_job(worker_id)
+            if job is not None:
+                process_job(job)
+                continue
+            # Idle: revalidate memory rows scored by an older validator version
+            if sweep_batch > 0 and sweep_rows(sweep_batch):
+                continue
+            if once:
+                return
+            time.sleep(poll_seconds)
+
+
+def sweep_rows(limit: int) -> int:
+    try:
+        return revalidate_translation_memory(limit)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning("Translation memory sweep failed: %s", e)
+        return 0